@@ -10,10 +10,12 @@ import asyncio
 from typing import Dict, List
 from src.agents.yolo_agent import YoloAgent
 from src.model.types import MoveTypes
+from src.motion.gaits.cache import gait_cache
 from src.nodes.controller import Controller
 from src.nodes.imu import IMU
 from src.nodes.navigator import Navigator
 from src.nodes.robot import Robot
+from src.recording.recorder import FlightRecorder
 from settings import settings
 
 logging.basicConfig(level=logging.INFO)
@@ -22,6 +24,8 @@ controller = Controller()
 imu = IMU()
 yolo_agent = YoloAgent()
 navigator = Navigator(controller=controller)
+recorder = FlightRecorder(settings.recorder_path, chunk_size=settings.recorder_chunk_size) \
+    if settings.recorder_enabled else None
 
 robot: Robot = Robot(controller=controller, imu=imu)
 
@@ -67,6 +71,19 @@ async def handle_move(move_type: MoveTypes):
     ui.notify(f"Moving {move_type.value}", type='info')
     robot.controller.process_move(move_type)
 
+@app.get('/api/timing')
+def timing():
+    """Spin-loop timing histograms (spinner duration, jitter, overruns) per node"""
+    return [node.timing_summary() for node in (controller, imu, navigator)]
+
+@app.get('/api/gaits')
+def gaits():
+    """Which move types' gaits are precompiled, and gait cache statistics"""
+    return {
+        'ready': {move_type.value: ready for move_type, ready in controller.gaits_ready.items()},
+        'cache': gait_cache.info(),
+    }
+
 def create_data_grid(data_dict: Dict, labels: List[str]):
     """Helper function to create data grids"""
     legs = data_dict.keys()
@@ -303,11 +320,15 @@ async def main_page():
     asyncio.create_task(update_displays())
 
 async def main():
-    await asyncio.gather(
+    nodes = [
         robot.imu.spin(frequency=settings.imu_frequency),
         robot.controller.spin(frequency=settings.robot_frequency),
         navigator.spin(frequency=10),  # Navigation decisions at 10Hz
-    )
+    ]
+    if recorder:
+        recorder.start()
+        nodes.append(recorder.spin())  # flushes the recording once a second
+    await asyncio.gather(*nodes)
 
 def start_video():
     yolo_agent.run()
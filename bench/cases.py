@@ -0,0 +1,133 @@
+"""
+Benchmark cases for the motion hot path.
+
+Each case is a name plus a setup function that builds whatever state it needs
+and returns the zero-argument callable to time. Setup is not timed. Servo
+writes go to a CapturingSerial so the packet build and write path run as they
+do on the robot, minus the UART.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable
+
+import numpy as np
+
+from settings import settings
+from src.mock.controller import offline_controller
+from src.model.types import MoveTypes
+from src.motion import stability
+from src.motion.gaits.arc_turn import ArcTurn
+from src.motion.gaits.gait_spec import compile_spec
+from src.motion.gaits.trot import Trot
+from src.motion.servo_controller import ServoController, encode_move
+from src.nodes import controller as controller_module
+
+
+@dataclass
+class Case:
+    name: str
+    setup: Callable[[], Callable[[], object]]
+
+
+class _NullSerial:
+    def write(self, data):
+        return len(data)
+
+
+def _ik():
+    km = controller_module._km
+    positions = settings.position_ready.astype(float)
+    out = np.empty((4, 3))
+    return lambda: km.inverse_kinematics_vectorized(positions, out=out)
+
+
+def _compile(gait):
+    spec = gait._spec()
+    return lambda: lambda: compile_spec(spec)
+
+
+def _gait_next():
+    gait = Trot(params=settings.trot_params)
+    return lambda: next(gait)
+
+
+def _arc_turn_next():
+    gait = ArcTurn(params=settings.turn_params, cycle_cache=False)
+    return lambda: next(gait)
+
+
+def _controller():
+    # built offline; afterwards it drives whatever port the case installs
+    with offline_controller() as controller:
+        return controller
+
+
+def _move_to():
+    controller = _controller()
+    sc = ServoController(_NullSerial())
+    gait = Trot(params=settings.trot_params)
+    frames = [next(gait) for _ in range(gait.max_index + 1)]
+    state = {'i': 0}
+
+    def tick():
+        previous = controller_module._sc
+        controller_module._sc = sc
+        try:
+            i = state['i'] = (state['i'] + 1) % len(frames)
+            controller.move_to(frames[i], 0)
+        finally:
+            controller_module._sc = previous
+
+    return tick
+
+
+def _servo_move():
+    sc = ServoController(_NullSerial())
+    positions = {int(servo_id): 500 + i for i, servo_id in enumerate(settings.servo_ids)}
+    return lambda: sc.move(positions, 0)
+
+
+def _servo_move_array():
+    sc = ServoController(_NullSerial())
+    servo_ids = tuple(int(servo_id) for servo_id in settings.servo_ids)
+    positions = np.arange(500, 500 + len(servo_ids), dtype=np.int32)
+    return lambda: sc.move_array(servo_ids, positions, 0)
+
+
+def _encode_move():
+    positions = {int(servo_id): 500 + i for i, servo_id in enumerate(settings.servo_ids)}
+    return lambda: encode_move(positions, 0)
+
+
+def _support_margin():
+    feet = stability.body_frame_feet(settings.position_ready)
+    return lambda: stability.support_margin(feet, [0, 1, 2])
+
+
+def _production_gaits() -> dict:
+    """One instance per indexed gait class the controller can run."""
+    controller = _controller()
+    gaits = {}
+    for move_type in MoveTypes:
+        gait = controller._get_gait_factory(move_type)
+        if gait is not None and gait.indexed:
+            gaits.setdefault(type(gait).__name__, gait)
+    return gaits
+
+
+def cases() -> list[Case]:
+    found = [
+        Case('kinematics.inverse_kinematics_vectorized', _ik),
+        Case('gait.Trot.__next__', _gait_next),
+        Case('gait.ArcTurn.__next__', _arc_turn_next),
+        Case('controller.move_to', _move_to),
+        Case('servo_controller.encode_move', _encode_move),
+        Case('servo_controller.move', _servo_move),
+        Case('servo_controller.move_array', _servo_move_array),
+        Case('stability.support_margin', _support_margin),
+    ]
+    for name, gait in sorted(_production_gaits().items()):
+        found.append(Case(f'compile_spec.{name}', _compile(gait)))
+    return found
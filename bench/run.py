@@ -0,0 +1,181 @@
+"""
+Motion hot-path benchmarks with stored baselines.
+
+    python -m bench.run                      # compare against bench/baseline.json
+    python -m bench.run --save               # record a new baseline
+    python -m bench.run --json results.json  # also write results as JSON
+    python -m bench.run -k compile_spec      # only cases whose name contains this
+
+Each case is timed with timeit: autorange picks a loop count that runs for at
+least --min-time, then the best of --repeat runs gives the per-call time (the
+minimum is the least noisy estimate of the code's own cost). A case regresses
+when it is more than --threshold slower than its baseline; any regression makes
+the exit status 1, so CI can gate on it.
+
+Shared or throttling machines drift by tens of percent between runs, so every
+run also times a fixed calibration workload and ratios are divided by how much
+slower that got than in the baseline run. A case that still looks regressed
+is measured again and keeps its best time before it is reported. Results also report each case's share
+of the control tick (1 / robot_frequency).
+
+Baselines are only comparable on the machine that recorded them: re-record with
+--save on the target (the Pi) and after intentional performance changes.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import platform
+import sys
+import time
+import timeit
+
+import numpy as np
+
+from settings import settings
+from bench.cases import cases
+
+BASELINE = os.path.join(os.path.dirname(__file__), 'baseline.json')
+DEFAULT_THRESHOLD = 0.25
+
+
+def measure(fn, repeat: int = 9, min_time: float = 0.05) -> float:
+    """Best per-call time in seconds over `repeat` runs of at least `min_time`."""
+    timer = timeit.Timer(fn)
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time:
+            break
+        number = max(number * 2, int(number * min_time / max(elapsed, 1e-9)))
+    return min([elapsed] + timer.repeat(repeat - 1, number)) / number
+
+
+def _calibration_workload():
+    values = np.arange(64, dtype=float)
+    total = 0.0
+    for i in range(50):
+        total += float(np.sqrt(values * i).sum())
+    return total
+
+
+def calibrate(repeat: int = 9, min_time: float = 0.05) -> float:
+    """Per-call time of a fixed mixed Python/NumPy workload, as a machine-speed
+    reference."""
+    return measure(_calibration_workload, repeat, min_time)
+
+
+def machine() -> dict:
+    return {
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'python': platform.python_version(),
+    }
+
+
+def load_baseline(path: str) -> dict:
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def run(pattern: str | None = None, baseline: dict | None = None, threshold: float = DEFAULT_THRESHOLD,
+        repeat: int = 9, min_time: float = 0.05) -> dict:
+    tick = 1.0 / settings.robot_frequency
+    reference = (baseline or {}).get('results', {})
+    base_calibration = (baseline or {}).get('meta', {}).get('calibration_us')
+    selected = [case for case in cases() if not pattern or pattern in case.name]
+
+    # Measure everything first, re-timing the calibration workload before each
+    # case; its best time is the machine's speed for this run.
+    calibration = calibrate(repeat, min_time)
+    times = {}
+    for case in selected:
+        calibration = min(calibration, calibrate(repeat, min_time))
+        fn = case.setup()
+        times[case.name] = (fn, measure(fn, repeat, min_time))
+    # how much slower this machine is running now than when the baseline was taken
+    speed = calibration * 1e6 / base_calibration if base_calibration else 1.0
+
+    results = {}
+    for name, (fn, seconds) in times.items():
+        result = {'per_call_us': seconds * 1e6, 'tick_share': seconds / tick}
+        base = reference.get(name)
+        if base:
+            ratio = result['per_call_us'] / base['per_call_us'] / speed
+            if ratio > 1.0 + threshold:
+                # confirm before reporting: keep the best of a second measurement
+                seconds = min(seconds, measure(fn, repeat, min_time))
+                result = {'per_call_us': seconds * 1e6, 'tick_share': seconds / tick}
+                ratio = result['per_call_us'] / base['per_call_us'] / speed
+            result.update(baseline_us=base['per_call_us'], ratio=ratio,
+                          regressed=ratio > 1.0 + threshold)
+        results[name] = result
+    return {
+        'meta': {
+            **machine(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'tick_us': tick * 1e6,
+            'threshold': threshold,
+            'calibration_us': calibration * 1e6,
+            'speed': speed,
+            'baseline_machine': (baseline or {}).get('meta', {}).get('platform'),
+        },
+        'results': results,
+    }
+
+
+def report(data: dict) -> str:
+    lines = [f"{'case':48} {'us/call':>10} {'tick %':>8} {'base us':>10} {'ratio':>7}"]
+    for name, r in data['results'].items():
+        base = f"{r['baseline_us']:10.2f} {r['ratio']:7.2f}" if 'ratio' in r else f"{'-':>10} {'-':>7}"
+        flag = '  REGRESSED' if r.get('regressed') else ''
+        lines.append(f"{name:48} {r['per_call_us']:10.2f} {r['tick_share'] * 100:7.3f}% {base}{flag}")
+    return '\n'.join(lines)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('-k', dest='pattern', help="only run cases whose name contains this")
+    parser.add_argument('--baseline', default=BASELINE, help="baseline JSON to compare against")
+    parser.add_argument('--save', action='store_true', help="write the results as the new baseline")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed slowdown before a case counts as regressed (0.25 = 25%%)")
+    parser.add_argument('--json', dest='json_path', help="write results to this JSON file")
+    parser.add_argument('--repeat', type=int, default=9)
+    parser.add_argument('--min-time', type=float, default=0.05,
+                        help="minimum seconds per timed run")
+    args = parser.parse_args(argv)
+
+    logging.getLogger('VEGA').setLevel(logging.WARNING)
+    baseline = None if args.save else load_baseline(args.baseline)
+    if baseline and baseline.get('meta', {}).get('platform') != platform.platform():
+        print(f"warning: baseline was recorded on {baseline['meta'].get('platform')}", file=sys.stderr)
+
+    data = run(args.pattern, baseline, args.threshold, args.repeat, args.min_time)
+    if data['meta']['speed'] != 1.0:
+        print(f"machine speed vs baseline: {data['meta']['speed']:.2f}x (ratios are normalized)")
+    print(report(data))
+
+    if args.json_path:
+        with open(args.json_path, 'w') as f:
+            json.dump(data, f, indent=1)
+    if args.save:
+        with open(args.baseline, 'w') as f:
+            json.dump(data, f, indent=1)
+        print(f"baseline saved to {args.baseline}")
+        return 0
+
+    regressed = [name for name, r in data['results'].items() if r.get('regressed')]
+    if regressed:
+        print(f"{len(regressed)} regression(s): {', '.join(regressed)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -51,6 +51,28 @@ class Settings:
 
         self.servos: np.ndarray = np.array(self.config.get("servos", []))
 
+        # Servo bus
+
+        _servo_bus = self.config.get("servo_bus", {})
+
+        # Link speed; pyserial opens at 9600 unless told otherwise
+        self.servo_baudrate: int = _servo_bus.get("baudrate", 9600)
+        # Planned load above this fraction of the link warns (or fails, if strict)
+        self.servo_bus_max_utilization: float = _servo_bus.get("max_utilization", 0.8)
+        self.servo_bus_strict: bool = _servo_bus.get("strict", False)
+        # Hand move frames to a background writer thread (latest frame wins)
+        self.servo_threaded_writer: bool = _servo_bus.get("threaded_writer", False)
+        # Delta-only moves: skip servos whose target moved <= deadband units
+        # (0 sends every servo every frame); full resync every refresh_interval frames
+        self.servo_deadband: int = _servo_bus.get("deadband", 0)
+        self.servo_refresh_interval: int = _servo_bus.get("refresh_interval", 50)
+        # Servo position readback rate in Hz (0 disables telemetry polling)
+        self.servo_telemetry_frequency: float = _servo_bus.get("telemetry_frequency", 0)
+        # Use the software servo bus (src/mock/servo_serial.py) instead of the port,
+        # with servo slew in position units per second
+        self.servo_bus_simulated: bool = _servo_bus.get("simulated", False)
+        self.servo_slew_rate: float = _servo_bus.get("slew_rate", 1250)
+
         # sensors
         _sensors = self.config.get("sensors", {})
         _camera = _sensors.get("camera", {})
@@ -79,6 +101,13 @@ class Settings:
         self.imu_acceleration_offsets: Optional[Tuple[int, int, int]] = (
             _imu_offsets.get("acceleration")
         )
+        # Sample the BNO055 on its own thread so I2C latency never blocks the loop
+        self.imu_threaded: bool = _imu.get("threaded", True)
+        self.imu_sample_frequency: float = _imu.get("sample_frequency", 50)
+        # Read the BNO055 data registers in one I2C burst instead of per property
+        self.imu_burst_read: bool = _imu.get("burst_read", True)
+        # Seconds of samples kept in the IMU history ring buffer
+        self.imu_history_seconds: float = _imu.get("history_seconds", 5)
 
         # Dimensions (mm)
 
@@ -131,6 +160,19 @@ class Settings:
 
         # Gait Parameters
 
+        _gaits = self.config.get("gaits", {})
+        # Continuous-phase gaits (ArcTurn) cache their steady-state cycle and
+        # replay it through the indexed / servo-table path
+        self.gait_cycle_cache: bool = _gaits.get("cycle_cache", True)
+        # Compiled gaits kept by the controller's LRU gait cache (0 disables)
+        self.gait_cache_size: int = _gaits.get("cache_size", 32)
+        # Precompile every move type's gait in the background when the
+        # controller starts, pausing between gaits to yield to the control loop
+        self.gait_warm: bool = _gaits.get("warm", True)
+        self.gait_warm_pause: float = _gaits.get("warm_pause", 0.005)
+        # Controller ticks spent crossfading into a newly selected gait (0 switches instantly)
+        self.gait_transition_ticks: int = _gaits.get("transition_ticks", 8)
+
         _gait_params = self.config.get("gait_params", {})
 
         self.trot_params: GaitParams = GaitParams(**_gait_params.get("trot", {}))
@@ -152,6 +194,14 @@ class Settings:
         self.robot_frequency = nodes.get("robot", {}).get("frequency", 50)
         self.imu_frequency = nodes.get("imu", {}).get("frequency", 5)
         self.controller_frequency = nodes.get("controller", {}).get("frequency", 10)
+        # Seconds between per-node loop timing summaries in the log (0 disables)
+        self.timing_log_interval: float = nodes.get("timing_log_interval", 60)
+
+        # flight recorder
+        _recorder = self.config.get("recorder", {})
+        self.recorder_enabled: bool = _recorder.get("enabled", False)
+        self.recorder_path: str = _recorder.get("path", "recordings")
+        self.recorder_chunk_size: int = _recorder.get("chunk_size", 4 << 20)
 
     @cached_property
     def servo_ids(self) -> np.ndarray:
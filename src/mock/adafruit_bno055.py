@@ -1,9 +1,68 @@
+import struct
 from typing import Any
 
 
+class I2CDevice:
+    """Register-level stand-in for adafruit_bus_device's I2CDevice on a BNO055:
+    a 128-byte register map, read with auto-increment like the real part.
+    Counts transactions so tests can see how many bus round trips a read cost."""
+
+    def __init__(self):
+        self.registers = bytearray(0x80)
+        self.transactions = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def write(self, buffer, start: int = 0, end: int = None):
+        self.transactions += 1
+        end = len(buffer) if end is None else end
+        register = buffer[start]
+        values = bytes(buffer[start + 1:end])
+        self.registers[register:register + len(values)] = values
+
+    def write_then_readinto(self, out_buffer, in_buffer, out_start: int = 0, out_end: int = None,
+                            in_start: int = 0, in_end: int = None):
+        self.transactions += 1
+        register = out_buffer[out_start]
+        in_end = len(in_buffer) if in_end is None else in_end
+        in_buffer[in_start:in_end] = self.registers[register:register + in_end - in_start]
+
+
+class _ScaledRegister:
+    """An int16 triple in the register map, scaled like the driver's
+    _ScaledReadOnlyStruct; assignable so tests can set what the sensor reports."""
+
+    def __init__(self, address: int, scale: float):
+        self.address = address
+        self.scale = scale
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        buffer = bytearray(7)
+        buffer[0] = self.address
+        with obj.i2c_device as i2c:
+            i2c.write_then_readinto(buffer, buffer, out_end=1, in_start=1)
+        return tuple(v * self.scale for v in struct.unpack_from('<hhh', buffer, 1))
+
+    def __set__(self, obj, value):
+        raw = [int(round(v / self.scale)) for v in value]
+        struct.pack_into('<hhh', obj.i2c_device.registers, self.address, *raw)
+
+
 class BNO055_I2C:
+    acceleration = _ScaledRegister(0x08, 1 / 100)
+    magnetic = _ScaledRegister(0x0E, 1 / 16)
+    gyro = _ScaledRegister(0x14, 0.001090830782496456)
+    euler = _ScaledRegister(0x1A, 1 / 16)
+
     def __init__(self, i2c: Any):
         self.i2c = i2c
+        self.i2c_device = I2CDevice()
         self.mode = 0x0C
         self.axis_remap = (0, 1, 2, 1, 0, 1)
         self.offsets_gyroscope = (0, 0, 0)
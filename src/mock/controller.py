@@ -0,0 +1,28 @@
+"""
+A Controller that runs without servo hardware, for tests and the benchmarks.
+"""
+
+import atexit
+from contextlib import contextmanager
+
+from settings import settings
+from src.mock.servo_serial import CapturingSerial
+from src.motion.servo_controller import ServoController
+from src.nodes import controller as controller_module
+from src.nodes.controller import Controller
+
+
+@contextmanager
+def offline_controller(**kwargs):
+    """A Controller whose servo port is a CapturingSerial for the duration of the
+    block, with its exit hooks removed so it never drives the real port."""
+    previous = controller_module._sc
+    controller_module._sc = ServoController(CapturingSerial())
+    try:
+        kwargs.setdefault('frequency', settings.robot_frequency)
+        controller = Controller(**kwargs)
+        atexit.unregister(controller._shutdown)
+        atexit.unregister(controller.shutdown)
+        yield controller
+    finally:
+        controller_module._sc = previous
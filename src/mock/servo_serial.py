@@ -0,0 +1,220 @@
+import heapq
+import os
+import select
+import threading
+import time
+from typing import Callable
+
+from src.motion.servo_bus import BITS_PER_BYTE
+from src.motion.servo_controller import (
+    CMD_GET_BATTERY_VOLTAGE,
+    CMD_MULT_SERVO_POS_READ,
+    CMD_MULT_SERVO_UNLOAD,
+    CMD_SERVO_MOVE,
+    FrameParser,
+    encode_packet,
+)
+
+
+class CapturingSerial:
+    """pyserial stand-in for the Hiwonder servo board that captures every write.
+
+    Each write is kept as (clock(), bytes). Host packets are parsed like the board
+    would: CMD_SERVO_MOVE updates the servo targets, and position / battery
+    queries are answered immediately from those targets, so ServoController works
+    unchanged against it. Nothing moves on a real wire.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic, voltage: int = 8000):
+        self.clock = clock
+        self.voltage = voltage
+        self.timeout = None
+        self.writes: list[tuple[float, bytes]] = []
+        self.positions: dict[int, int] = {}
+        self.unloaded: set[int] = set()
+        self._parser = FrameParser(size=1024)
+        self._responses = bytearray()
+
+    @property
+    def in_waiting(self) -> int:
+        return len(self._responses)
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self.writes.append((self.clock(), data))
+        self._parser.feed(data)
+        while (frame := self._parser.next_frame()) is not None:
+            self._handle(*frame)
+        return len(data)
+
+    def read(self, size: int = 1) -> bytes:
+        data = bytes(self._responses[:size])
+        del self._responses[:size]
+        return data
+
+    def _handle(self, command: int, params: list):
+        if command == CMD_SERVO_MOVE:
+            # count, time (2 bytes), then id + position word per servo
+            millis = params[1] | (params[2] << 8)
+            for i in range(params[0]):
+                servo_id, low, high = params[3 + 3 * i: 6 + 3 * i]
+                self.unloaded.discard(servo_id)
+                self.on_move(servo_id, low | (high << 8), millis)
+        elif command == CMD_MULT_SERVO_POS_READ:
+            count, servo_ids = params[0], params[1:]
+            response = [count]
+            for servo_id in servo_ids[:count]:
+                position = self.read_position(servo_id)
+                response += [servo_id, position & 0xff, (position >> 8) & 0xff]
+            self.respond(encode_packet(CMD_MULT_SERVO_POS_READ, *response))
+        elif command == CMD_GET_BATTERY_VOLTAGE:
+            self.respond(encode_packet(
+                CMD_GET_BATTERY_VOLTAGE, self.voltage & 0xff, (self.voltage >> 8) & 0xff
+            ))
+        elif command == CMD_MULT_SERVO_UNLOAD:
+            self.unloaded.update(params[1:1 + params[0]])
+
+    def on_move(self, servo_id: int, position: int, millis: int):
+        self.positions[servo_id] = position
+
+    def read_position(self, servo_id: int) -> int:
+        return self.positions.get(servo_id, 500)
+
+    def respond(self, packet: bytes):
+        self._responses += packet
+
+    def moves(self) -> list[tuple[float, bytes]]:
+        """Captured CMD_SERVO_MOVE packets."""
+        return [(t, data) for t, data in self.writes if len(data) > 3 and data[3] == CMD_SERVO_MOVE]
+
+    def close(self):
+        pass
+
+
+class _Servo:
+    """Linear move from `start` to `target` between t0 and t1."""
+    __slots__ = ('start', 'target', 't0', 't1')
+
+    def __init__(self, position: int):
+        self.start = self.target = position
+        self.t0 = self.t1 = 0.0
+
+    def position(self, now: float) -> int:
+        if now >= self.t1:
+            return self.target
+        if now <= self.t0:
+            return self.start
+        fraction = (now - self.t0) / (self.t1 - self.t0)
+        return int(round(self.start + (self.target - self.start) * fraction))
+
+
+class SimulatedServoBus(CapturingSerial):
+    """Software Hiwonder servo bus with realistic timing, on the real clock.
+
+    Wire time: every packet occupies its direction of the UART for
+    `bytes * 10 / baudrate` seconds (8N1), queued behind whatever is still on the
+    wire, and a command only takes effect once its last byte has arrived.
+    Responses are sent after `latency` board processing time plus their own wire
+    time, and only then become readable -- through a pipe, so `fileno()` works
+    with ServoController.attach and the asyncio reader path.
+
+    Servos slew: a move reaches its target over the packet's time or at
+    `slew_rate` units/s, whichever is slower, and position reads report where
+    the servo is at that moment.
+    """
+
+    def __init__(self, baudrate: int = 9600, slew_rate: float = 1250.0, latency: float = 0.001,
+                 voltage: int = 8000):
+        super(SimulatedServoBus, self).__init__(clock=time.monotonic, voltage=voltage)
+        self.baudrate = baudrate
+        self.slew_rate = slew_rate
+        self.latency = latency
+        self.servos: dict[int, _Servo] = {}
+        # when each direction of the wire is next free, and when the command
+        # being handled finished arriving
+        self._tx_free = 0.0
+        self._rx_free = 0.0
+        self._arrived = 0.0
+
+        self._read_fd, self._write_fd = os.pipe()
+        self._available = 0
+        self._pending: list = []
+        self._sequence = 0
+        self._cond = threading.Condition()
+        self._running = True
+        self._thread = threading.Thread(target=self._deliver, name='servo-bus-sim', daemon=True)
+        self._thread.start()
+
+    def wire_time(self, nbytes: int) -> float:
+        return nbytes * BITS_PER_BYTE / self.baudrate
+
+    # --- host side ----------------------------------------------------------------
+
+    def fileno(self) -> int:
+        return self._read_fd
+
+    @property
+    def in_waiting(self) -> int:
+        with self._cond:
+            return self._available
+
+    def write(self, data) -> int:
+        now = time.monotonic()
+        self._arrived = max(now, self._tx_free) + self.wire_time(len(data))
+        self._tx_free = self._arrived
+        return super(SimulatedServoBus, self).write(data)
+
+    def read(self, size: int = 1) -> bytes:
+        ready, _, _ = select.select([self._read_fd], [], [], self.timeout)
+        if not ready:
+            return b''
+        with self._cond:
+            data = os.read(self._read_fd, min(size, self._available) or size)
+            self._available -= len(data)
+        return data
+
+    def close(self):
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+        self._thread.join(1.0)
+        os.close(self._read_fd)
+        os.close(self._write_fd)
+
+    # --- board side ---------------------------------------------------------------
+
+    def on_move(self, servo_id: int, position: int, millis: int):
+        servo = self.servos.get(servo_id)
+        now = self._arrived
+        if servo is None:
+            servo = self.servos[servo_id] = _Servo(position)
+        start = servo.position(now)
+        duration = max(millis / 1000.0, abs(position - start) / self.slew_rate)
+        servo.start, servo.target, servo.t0, servo.t1 = start, position, now, now + duration
+        self.positions[servo_id] = position
+
+    def read_position(self, servo_id: int) -> int:
+        servo = self.servos.get(servo_id)
+        return servo.position(self._arrived) if servo is not None else 500
+
+    def respond(self, packet: bytes):
+        start = max(self._arrived + self.latency, self._rx_free)
+        self._rx_free = start + self.wire_time(len(packet))
+        with self._cond:
+            self._sequence += 1
+            heapq.heappush(self._pending, (self._rx_free, self._sequence, packet))
+            self._cond.notify()
+
+    def _deliver(self):
+        with self._cond:
+            while self._running:
+                if not self._pending:
+                    self._cond.wait()
+                    continue
+                delay = self._pending[0][0] - time.monotonic()
+                if delay > 0:
+                    self._cond.wait(delay)
+                    continue
+                _, _, packet = heapq.heappop(self._pending)
+                os.write(self._write_fd, packet)
+                self._available += len(packet)
@@ -21,9 +21,16 @@ small step toward the unified locomotion model the ideation surfaced:
     and touch-down) and the horizontal reposition uses a smoothstep ease, so the
     foot is never dragged onto the ground.
 
-It overrides `__next__` to act as a pure generator; `self.steps` is set to a
-neutral frame only to satisfy the base-class contract. The legacy `Turn` is left
-untouched.
+It overrides `__next__` to act as a generator. For fixed parameters the motion
+is periodic once every leg has lifted off, so by default (settings
+gaits.cycle_cache) the first cycle is run at build time as a transient and the
+second is cached as `self.steps`: the gait emits the transient frames, then
+flips to `indexed` and replays the cached cycle through the same table-driven
+hot path as Trot. The replayed cycle is the generator's second cycle, and later
+generator cycles only differ from it by float rounding. With caching
+off (or if the motion ever fails the periodicity check) `self.steps` is a
+neutral frame that only satisfies the base-class contract. The legacy `Turn` is
+left untouched.
 """
 
 import numpy as np
@@ -40,12 +47,6 @@ def _smoothstep(s: float) -> float:
     return s * s * (3.0 - 2.0 * s)
 
 
-def _rot(v, a):
-    """Rotate a 2-vector by angle a about the origin."""
-    c, s = np.cos(a), np.sin(a)
-    return np.array([c * v[0] - s * v[1], s * v[0] + c * v[1]])
-
-
 class ArcTurn(Gait):
     """Continuous ICR turn. Diagonal pairs {0,2}/{1,3} a half-cycle apart.
 
@@ -58,6 +59,11 @@ class ArcTurn(Gait):
     """
 
     SWING_FRAC = 0.25  # duty factor 0.75 -> >=3 feet down most of the cycle
+    indexed = False
+
+    def __init__(self, p0: np.ndarray = settings.position_ready, params=None, cycle_cache: bool | None = None):
+        self._cycle_cache = settings.gait_cycle_cache if cycle_cache is None else cycle_cache
+        super(ArcTurn, self).__init__(p0=p0, params=params)
 
     def build_steps(self):
         # Geometry: each foot's neutral xy relative to the body centre, via the
@@ -76,52 +82,107 @@ class ArcTurn(Gait):
         # Continuous-phase state.
         self._N = max(self.num_steps * 4, 1)              # ticks per cycle
         self._dpsi = self._yaw_per_cycle / self._N        # yaw increment per tick
-        self._phi = 0.0
-        self._psi = 0.0                                   # accumulated body yaw
         self._phase_offset = np.array([0.0, 0.5, 0.0, 0.5])  # diagonal pairs
-        # Live foot positions (body frame, xy) and per-leg swing bookkeeping.
-        self._foot_xy = self._neutral_xy.copy()
-        self._was_swing = np.array([False, False, False, False])
-        self._lift_off = self._neutral_xy.copy()
-        self._target = self._neutral_xy.copy()
-
+        # Rotations shared by every leg, as plain floats: stance turns each foot
+        # by -d_psi per tick, lift-off aims it `advance` ahead of where it left.
+        advance = (1.0 - self.SWING_FRAC) * self._yaw_per_cycle
+        self._stance_cs = (float(np.cos(-self._dpsi)), float(np.sin(-self._dpsi)))
+        self._advance_cs = (float(np.cos(advance)), float(np.sin(advance)))
+        # Per-leg constants for the tick: phase offset, p0 and neutral xy.
+        self._legs = [
+            (float(self._phase_offset[i]), *map(float, self.p0[i][:3]), *map(float, self._neutral_xy[i]))
+            for i in range(4)
+        ]
+        self._reset()
+
+        # Every leg has lifted off by the end of the first cycle (legs 1 and 3
+        # first stance-rotate away from neutral), so that cycle is the transient
+        # and the second one repeats.
+        self._emitted = 0
+        if self._cycle_cache:
+            frames = [self._step() for _ in range(3 * self._N)]
+            self._reset()
+            if self.cache_cycle(frames, self._N):
+                return
         # Satisfy the base contract: a single neutral frame (we override __next__).
         self.steps = np.zeros((4, 1, 3))
 
-    # ArcTurn is a generator; ignore the indexed-array hot path entirely.
-    def __next__(self):
-        out = np.array(self.p0, dtype=float)
-        stance_frac = 1.0 - self.SWING_FRAC
-
-        for i in range(4):
-            lp = (self._phi + self._phase_offset[i]) % 1.0
-            swinging = lp < self.SWING_FRAC
+    def _reset(self):
+        """Back to phase 0 with every foot at neutral. All mutable generator state
+        is rebound here, so a shallow copy that is reset steps independently."""
+        self._phi = 0.0
+        self._psi = 0.0                                   # accumulated body yaw
+        # Live foot positions (body frame, [x, y]) and per-leg swing bookkeeping.
+        self._feet = [[float(x), float(y)] for x, y in self._neutral_xy]
+        self._lift_offs = [list(foot) for foot in self._feet]
+        self._targets = [list(foot) for foot in self._feet]
+        self._swinging = [False] * 4
+
+    def reset(self):
+        super(ArcTurn, self).reset()
+        self._reset()
+        self._emitted = 0
+        self.indexed = False
 
-            if swinging:
-                s = lp / self.SWING_FRAC
-                if not self._was_swing[i]:
+    def __next__(self):
+        if self.indexed:
+            return super(ArcTurn, self).__next__()
+        if self.transient is None:
+            return self._step()
+        # Cached: play the transient, then hand over to the indexed cycle.
+        frame = self.transient[self._emitted]
+        self._emitted += 1
+        if self._emitted == len(self.transient):
+            self.indexed = True
+        self.positions = frame
+        return frame
+
+    def _step(self):
+        """One generator tick.
+
+        A loop over the four legs on plain Python floats: per-leg NumPy calls
+        (or whole-array ones -- there are only four legs) cost far more in call
+        overhead than the arithmetic. The operations and their order are those
+        of the original array-per-leg version, so the output is bit-for-bit the
+        same; only the frame returned is allocated.
+        """
+        swing_frac = self.SWING_FRAC
+        icx, icy = float(self._icr[0]), float(self._icr[1])
+        phi = self._phi
+        rows = []
+        for i, (offset, px, py, pz, nx, ny) in enumerate(self._legs):
+            lp = (phi + offset) % 1.0
+            foot = self._feet[i]
+            if lp < swing_frac:
+                s = lp / swing_frac
+                lift_off, target = self._lift_offs[i], self._targets[i]
+                if not self._swinging[i]:
                     # Lift-off: remember where we leave, and where to land. The
                     # foot must be replaced forward by the arc it will sweep back
                     # during the coming stance, so the cycle stays periodic.
-                    self._lift_off[i] = self._foot_xy[i].copy()
-                    advance = stance_frac * self._yaw_per_cycle
-                    self._target[i] = self._icr + _rot(self._lift_off[i] - self._icr, advance)
+                    lift_off[0], lift_off[1] = foot
+                    c, sn = self._advance_cs
+                    vx, vy = lift_off[0] - icx, lift_off[1] - icy
+                    target[0] = icx + (c * vx - sn * vy)
+                    target[1] = icy + (sn * vx + c * vy)
+                    self._swinging[i] = True
                 ease = _smoothstep(s)
-                xy = (1.0 - ease) * self._lift_off[i] + ease * self._target[i]
-                z = self.clearance * np.sin(np.pi * s)
-                self._foot_xy[i] = xy
+                foot[0] = (1.0 - ease) * lift_off[0] + ease * target[0]
+                foot[1] = (1.0 - ease) * lift_off[1] + ease * target[1]
+                z = self.clearance * float(np.sin(np.pi * s))
             else:
                 # Stance: rotate rigidly about the ICR by -d_psi so the contact
                 # point stays fixed in the world while the body yaws +d_psi.
-                self._foot_xy[i] = self._icr + _rot(self._foot_xy[i] - self._icr, -self._dpsi)
+                c, sn = self._stance_cs
+                vx, vy = foot[0] - icx, foot[1] - icy
+                foot[0] = icx + (c * vx - sn * vy)
+                foot[1] = icy + (sn * vx + c * vy)
+                self._swinging[i] = False
                 z = 0.0
-
-            self._was_swing[i] = swinging
             # Emit as an offset from the leg-frame neutral (p0 + body-frame delta).
-            out[i, 0] = self.p0[i][0] + (self._foot_xy[i][0] - self._neutral_xy[i][0])
-            out[i, 1] = self.p0[i][1] + (self._foot_xy[i][1] - self._neutral_xy[i][1])
-            out[i, 2] = self.p0[i][2] - z
+            rows.append((px + (foot[0] - nx), py + (foot[1] - ny), pz - z))
 
+        out = np.array(rows)
         self._phi += 1.0 / self._N
         self._psi += self._dpsi
         if self._phi >= 1.0:
@@ -0,0 +1,99 @@
+"""
+LRU cache of compiled gaits.
+
+Building a gait runs its whole compile step -- compile_spec, the np.roll phase
+shifts, the hip_corners geometry, and for ArcTurn three generator cycles -- yet
+for a given class, start pose and GaitParams the result is always the same.
+The Navigator flips between FORWARD and FORWARD_LT/RT many times a minute, so
+the controller asks this cache instead of constructing gaits directly.
+
+Each entry keeps a compiled prototype that is never handed out. `get` returns a
+shallow copy of it, rewound with `Gait.reset()`: the (4, N, 3) step array (and
+ArcTurn's transient) are shared read-only, while the iterator state belongs to
+the copy. A gait switch therefore costs a dict lookup, a copy and a reset. The controller
+warms the cache from a background thread, so the bookkeeping is locked; a
+compile runs outside the lock, and two threads missing the same key at once
+just both compile it.
+
+Keys hold the gait class, p0's bytes and the GaitParams values, so a changed
+parameter simply misses. Gaits also read module settings (robot geometry, the
+default poses) when they compile; call `invalidate()` after changing those.
+"""
+
+from __future__ import annotations
+
+import copy
+import threading
+from collections import OrderedDict
+from dataclasses import astuple
+
+import numpy as np
+
+from settings import settings
+from src.motion.gaits.gait import Gait
+from src.motion.gaits.gait_params import GaitParams
+
+
+def _key(cls: type, p0, params: GaitParams | None, kwargs: dict) -> tuple:
+    p0 = np.asarray(p0)
+    return (
+        cls,
+        p0.shape, p0.dtype.str, p0.tobytes(),
+        astuple(params or GaitParams()),
+        tuple(sorted(kwargs.items())),
+    )
+
+
+class GaitCache:
+
+    def __init__(self, maxsize: int = 32):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[tuple, Gait] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, cls: type, p0: np.ndarray = settings.position_ready, params: GaitParams | None = None,
+            **kwargs) -> Gait:
+        """A fresh gait of `cls`, compiled at most once per (p0, params, kwargs)."""
+        if self.maxsize <= 0:
+            self.misses += 1
+            return cls(p0=p0, params=params, **kwargs)
+        key = _key(cls, p0, params, kwargs)
+        with self._lock:
+            prototype = self._entries.get(key)
+            if prototype is not None:
+                self.hits += 1
+                self._entries.move_to_end(key)
+        if prototype is None:
+            prototype = cls(p0=p0, params=params, **kwargs)
+            with self._lock:
+                self.misses += 1
+                self._entries[key] = prototype
+                if len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+        gait = copy.copy(prototype)
+        gait.reset()
+        return gait
+
+    def invalidate(self, cls: type | None = None):
+        """Drop every entry, or only those of one gait class."""
+        with self._lock:
+            if cls is None:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries if key[0] is cls]:
+                del self._entries[key]
+
+    def cached(self, cls: type, p0: np.ndarray = settings.position_ready, params: GaitParams | None = None,
+               **kwargs) -> bool:
+        return _key(cls, p0, params, kwargs) in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def info(self) -> dict:
+        return {'size': len(self), 'maxsize': self.maxsize, 'hits': self.hits, 'misses': self.misses}
+
+
+gait_cache = GaitCache(settings.gait_cache_size)
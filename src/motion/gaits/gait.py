@@ -27,6 +27,14 @@ class Gait(ABC):
         normal = 0
         fast = 1
 
+    # Indexed gaits replay self.steps verbatim, so a whole cycle of output is known
+    # up front (cycle_positions) and can be precompiled into servo commands.
+    # Generator gaits that compute frames on the fly (ArcTurn) set this False.
+    indexed = True
+    # Frames a cycle-cached generator gait emits before its indexed replay starts
+    # (see cache_cycle); None for gaits that are indexed from the first frame.
+    transient: np.ndarray | None = None
+
     def __init__(self, p0: np.ndarray = settings.position_ready, params: GaitParams | None = None):
 
         _params = params or GaitParams()
@@ -47,6 +55,10 @@ class Gait(ABC):
         # directly (a 4-independent-leg / GaitSpec gait); otherwise it is assembled
         # below from the legacy steps1..steps4 authoring attributes.
         self.steps: np.ndarray | None = None
+        # Artifacts compiled from the cycle by their users (the controller's
+        # servo table). Shallow copies share the dict, so every copy the gait
+        # cache hands out reuses what was compiled for the prototype.
+        self.compiled: dict = {}
 
         self.build_steps()
         if self.steps is None:
@@ -134,6 +146,38 @@ class Gait(ABC):
     def get_positions(self, phase: int = 0, index: int = 0):
         return self.p0 + self.get_offsets(index)
 
+    def cycle_positions(self) -> np.ndarray:
+        """Every frame of one cycle as an (N, 4, 3) array; frame i is exactly what
+        __next__ emits at index i."""
+        return self.p0 + self.steps.transpose(1, 0, 2)
+
+    def cache_cycle(self, frames: np.ndarray, period: int, atol: float = 1e-6) -> bool:
+        """Adopt a generator gait's steady-state cycle as its step array.
+
+        `frames` is the gait's output from a fresh start: a transient of T frames
+        followed by two periods, shape (T + 2 * period, 4, 3). If the two periods
+        agree to within `atol` the motion has settled into a cycle; the second
+        period becomes `self.steps` (as offsets from p0), the first T frames are
+        kept in `self.transient` for the gait to emit first, and the gait can then
+        run indexed. Returns False, changing nothing, if it is not periodic.
+        """
+        frames = np.asarray(frames, dtype=float)
+        transient = frames.shape[0] - 2 * period
+        if period < 1 or transient < 0:
+            raise ValueError(f"need a transient and two periods of {period} frames, got {frames.shape[0]}")
+        first, second = frames[transient:transient + period], frames[transient + period:]
+        if not np.allclose(first, second, rtol=0.0, atol=atol):
+            return False
+        self.steps = (second - self.p0).transpose(1, 0, 2)
+        self.transient = frames[:transient]
+        return True
+
+    def reset(self):
+        """Rewind the iterator to the first frame of the cycle."""
+        self.positions = self.p0
+        self.index = 0
+        self.phase = 0
+
     def step_generator(self):
         """
         Generator to yield the step positions.
@@ -0,0 +1,86 @@
+"""
+Blended gait transitions.
+
+Replacing the controller's gait outright makes the feet jump from wherever they
+are to frame 0 of the new gait in a single immediate move. A `GaitTransition`
+instead runs the new gait from the first tick and crossfades into it over
+`ticks` frames:
+
+    frame[k] = from[k] + w[k] * (next(gait) - from[k]),   w = smoothstep((k + 1) / (ticks + 1))
+
+`from` is the outgoing gait's own continuation when it can be read ahead (both
+gaits indexed, the outgoing one not itself mid-transition), otherwise the pose
+the robot is holding. Either way the first frame sits next to the last one sent
+and the last frame sits next to the gait's next one, so no tick jumps.
+
+Phase alignment: when both gaits are indexed and their periods are equal or
+integer multiples of each other, the new gait starts at the outgoing gait's
+phase (same fraction of the cycle) rather than at index 0, so a diagonal pair
+that is in the air stays in the air -- Trot -> SimpleTrotWithLateral swaps the
+stride without breaking step. The `from` frames and the weights are computed
+up front as arrays at switch time; a tick is one next() and one fused blend.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from src.motion.gaits.gait import Gait
+
+
+def compatible_periods(a: Gait, b: Gait) -> bool:
+    """Both gaits replay a fixed cycle, and one period divides the other."""
+    if not (a.indexed and b.indexed):
+        return False
+    n, m = sorted((a.max_index, b.max_index))
+    return n > 0 and m % n == 0
+
+
+def align_phase(previous: Gait, gait: Gait):
+    """Start `gait` at the point of its cycle matching `previous`'s phase."""
+    index = round(previous.index * gait.max_index / previous.max_index) % gait.max_index
+    gait.index = index
+    gait.phase = previous.phase
+
+
+class GaitTransition:
+    """Crossfade from the current motion into `gait` over `ticks` frames.
+
+    `start` is the (4, 3) pose last commanded; `previous`, if given, is the gait
+    that produced it. Call next() for each frame; `done` turns True once the
+    last blended frame has been emitted and `gait` can be stepped directly.
+    """
+
+    def __init__(self, gait: Gait, ticks: int, start: np.ndarray, previous: Gait | None = None,
+                 follow_previous: bool = True):
+        self.gait = gait
+        self.ticks = ticks
+        self.aligned = previous is not None and compatible_periods(previous, gait)
+        if self.aligned:
+            align_phase(previous, gait)
+
+        k = np.arange(ticks)
+        s = (k + 1.0) / (ticks + 1.0)
+        self.weights = (s * s * (3.0 - 2.0 * s))[:, None, None]
+        if self.aligned and follow_previous:
+            # read the outgoing cycle ahead without stepping it
+            cycle = previous.cycle_positions()
+            self.source = cycle[(previous.index + k) % previous.max_index]
+        else:
+            self.source = np.broadcast_to(np.asarray(start, dtype=float), (ticks, 4, 3))
+        self.tick = 0
+
+    @property
+    def done(self) -> bool:
+        return self.tick >= self.ticks
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> np.ndarray:
+        if self.done:
+            raise StopIteration
+        source = self.source[self.tick]
+        frame = source + self.weights[self.tick] * (next(self.gait) - source)
+        self.tick += 1
+        return frame
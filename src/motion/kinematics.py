@@ -47,21 +47,44 @@ class QuadrupedKinematics:
         self._tibia_sq = tibia ** 2
         self._2_femur_tibia = 2 * femur * tibia
 
-    def inverse_kinematics_vectorized(self, positions: np.ndarray) -> np.ndarray:
+    def inverse_kinematics_vectorized(self, positions: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
         """
         Vectorized inverse kinematics for all 4 legs at once.
         ~4x faster than calling inverse_kinematics in a loop.
         
         Args:
             positions: (4, 3) array of [x, y, z] positions for each leg
+            out: optional preallocated (4, 3) float array for the result
             
         Returns:
             (4, 3) array of joint angles [coxa, femur, tibia] for each leg
         """
+        return self.inverse_kinematics_batch(positions, out=out)
+
+    def inverse_kinematics_batch(self, positions: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Batched inverse kinematics over any leading shape.
+
+        Solves a whole gait cycle (N, 4, 3) or a parameter sweep (K, N, 4, 3) in a
+        single NumPy pass instead of N calls to inverse_kinematics_vectorized.
+
+        Args:
+            positions: (..., 3) array of [x, y, z] foot positions, e.g. (N, 4, 3)
+            out: optional preallocated float array of the same shape for the result
+
+        Returns:
+            (..., 3) array of joint angles [coxa, femur, tibia], same shape as positions
+        """
+        positions = np.asarray(positions)
+        if out is None:
+            out = np.empty(positions.shape, dtype=float)
+        elif out.shape != positions.shape:
+            raise ValueError(f"out must be {positions.shape}, got {out.shape}")
+
         # Extract and invert x for world coordinates
-        x = -positions[:, 0]
-        y = positions[:, 1]
-        z = positions[:, 2]
+        x = -positions[..., 0]
+        y = positions[..., 1]
+        z = positions[..., 2]
 
         # The coxa rotates the leg about +x into the (x, radial) plane, so the 2-link
         # femur/tibia reaches the TRUE in-plane radial distance r = sqrt(y^2 + z^2), not z.
@@ -82,9 +105,10 @@ class QuadrupedKinematics:
             self.femur + self.tibia * cos_q2
         )
 
-        q3 = np.arctan2(y, z)
-
-        return np.column_stack([q3, q1, q2])
+        out[..., 0] = np.arctan2(y, z)
+        out[..., 1] = q1
+        out[..., 2] = q2
+        return out
 
     def inverse_kinematics_all_legs(self, positions: np.ndarray, offsets: np.ndarray, format="radians") -> np.ndarray:
         angles = self.inverse_kinematics_vectorized(positions + offsets)
@@ -147,6 +171,54 @@ class QuadrupedKinematics:
         # invert x for world coordinates
         return np.array([-x, y, z])
 
+    def forward_kinematics_vectorized(self, angles: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Vectorized forward kinematics for all 4 legs at once (the counterpart of
+        inverse_kinematics_vectorized).
+
+        Args:
+            angles: (4, 3) array of joint angles [coxa, femur, tibia] for each leg
+            out: optional preallocated (4, 3) float array for the result
+
+        Returns:
+            (4, 3) array of [x, y, z] positions for each leg
+        """
+        return self.forward_kinematics_batch(angles, out=out)
+
+    def forward_kinematics_batch(self, angles: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Batched forward kinematics over any leading shape -- the inverse of
+        inverse_kinematics_batch.
+
+        Args:
+            angles: (..., 3) array of joint angles [coxa, femur, tibia], e.g. (N, 4, 3)
+            out: optional preallocated float array of the same shape for the result
+
+        Returns:
+            (..., 3) array of [x, y, z] foot positions, same shape as angles
+        """
+        angles = np.asarray(angles)
+        if out is None:
+            out = np.empty(angles.shape, dtype=float)
+        elif out.shape != angles.shape:
+            raise ValueError(f"out must be {angles.shape}, got {out.shape}")
+
+        q3 = angles[..., 0]
+        theta1 = angles[..., 1]
+        theta12 = theta1 + angles[..., 2]
+
+        # Two-link arm in the (x, radial) plane; the coxa rotates radial into (y, z).
+        x = self.femur * np.cos(theta1) + self.tibia * np.cos(theta12)
+        radial = self.femur * np.sin(theta1) + self.tibia * np.sin(theta12)
+        y = radial * np.sin(q3)
+        z = radial * np.cos(q3)
+
+        # invert x for world coordinates
+        out[..., 0] = -x
+        out[..., 1] = y
+        out[..., 2] = z
+        return out
+
     def apply_body_tilt(self, positions: np.ndarray, pitch: float, yaw: float) -> np.ndarray:
         """
         Apply body tilt - ORIGINAL IMPLEMENTATION PRESERVED
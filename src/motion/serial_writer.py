@@ -0,0 +1,129 @@
+"""
+Background serial writer with a single-slot, latest-command-wins mailbox.
+
+`ServoController` writes straight to the serial port from whichever thread calls
+it -- for the gait loop that is the asyncio event loop, so a slow UART write
+stalls every other coroutine (IMU, navigator) with it. With a `SerialWriter` the
+control loop only posts the newest move frame; a daemon thread does the blocking
+write. A move frame is a complete absolute target, so if the bus falls behind
+there is no value in sending the older one: a newer post simply replaces an
+unsent frame, which is counted as dropped.
+
+Every write to the port, threaded or not, goes through `lock` so that direct
+writes (queries, unload) can never interleave bytes with a mailbox frame.
+"""
+
+import logging
+import threading
+import time
+
+LOGGER = logging.getLogger('lewansoul.servos.lx16a')
+
+
+class SerialWriter(object):
+    """Writes posted frames to `serial` from a daemon thread, newest first.
+
+    Counters: frames_posted, frames_sent, frames_dropped, write_errors, and the
+    write latency (seconds spent inside serial.write) as last / max / total.
+    A failed write is logged and counted; the next posted frame is tried anyway.
+    """
+
+    def __init__(self, serial, lock=None, on_write=None):
+        self._serial = serial
+        self.lock = lock or threading.Lock()
+        # Called on the writer thread with the byte count of each frame sent
+        self._on_write = on_write
+        self._cond = threading.Condition()
+        # Two buffers swapped between the poster and the writer: post() copies
+        # into _pending, the thread sends _sending -- no per-frame allocation.
+        self._pending = bytearray()
+        self._sending = bytearray()
+        self._has_frame = False
+        self._running = False
+        self._thread = None
+
+        self.frames_posted = 0
+        self.frames_sent = 0
+        self.frames_dropped = 0
+        self.write_errors = 0
+        self.write_time_last = 0.0
+        self.write_time_max = 0.0
+        self.write_time_total = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def start(self):
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(
+            target=self._run, name='servo-serial-writer', daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout=1.0):
+        """Stop the thread after it has sent any frame still in the mailbox."""
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def post(self, packet):
+        """Hand the newest frame to the writer; replaces any frame not yet sent."""
+        with self._cond:
+            if self._has_frame:
+                self.frames_dropped += 1
+            self._pending[:] = packet
+            self._has_frame = True
+            self.frames_posted += 1
+            self._cond.notify()
+
+    def _run(self):
+        try:
+            while True:
+                with self._cond:
+                    while self._running and not self._has_frame:
+                        self._cond.wait()
+                    if not self._has_frame:
+                        return
+                    self._pending, self._sending = self._sending, self._pending
+                    self._has_frame = False
+
+                start = time.perf_counter()
+                try:
+                    with self.lock:
+                        self._serial.write(self._sending)
+                except OSError as e:   # serial.SerialException is an OSError
+                    self.write_errors += 1
+                    LOGGER.error('Servo move write failed: %r', e)
+                    continue
+                elapsed = time.perf_counter() - start
+
+                self.frames_sent += 1
+                if self._on_write is not None:
+                    self._on_write(len(self._sending))
+                self.write_time_last = elapsed
+                self.write_time_total += elapsed
+                if elapsed > self.write_time_max:
+                    self.write_time_max = elapsed
+        finally:
+            # if the thread dies, write_move falls back to synchronous writes
+            # rather than posting into a mailbox nobody reads
+            self._running = False
+
+    @property
+    def stats(self) -> dict:
+        sent = self.frames_sent
+        return {
+            'frames_posted': self.frames_posted,
+            'frames_sent': sent,
+            'frames_dropped': self.frames_dropped,
+            'write_errors': self.write_errors,
+            'write_time_last': self.write_time_last,
+            'write_time_mean': self.write_time_total / sent if sent else 0.0,
+            'write_time_max': self.write_time_max,
+        }
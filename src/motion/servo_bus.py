@@ -0,0 +1,188 @@
+"""
+Servo bus bandwidth model and scheduler.
+
+The Hiwonder bus is a plain UART: every packet costs `bytes * 10 / baud` seconds
+on the wire (8N1 framing = start + 8 data + stop bits). A 12-servo
+CMD_SERVO_MOVE is 43 bytes, so at the control rate the link has a hard budget
+that nothing used to account for: raise `robot_frequency`, add telemetry, and
+the port silently backs up.
+
+`ServoBus` answers three questions:
+
+  * planning  -- does control rate + telemetry fit the link (`plan` / `check`)?
+  * priority  -- a move is never delayed; a query is only started when it can
+                 finish before the next tick's move is due (`query_slot_open`).
+  * reporting -- measured utilization from the bytes actually written
+                 (`record`, `utilization`).
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass
+
+LOGGER = logging.getLogger('VEGA')
+
+BITS_PER_BYTE = 10   # 8N1: start bit + 8 data bits + stop bit
+
+# Packet sizes (bytes on the wire) for n servos
+HEADER_SIZE = 4      # 0x55 0x55 length cmd
+
+
+def move_packet_size(n_servos: int) -> int:
+    """CMD_SERVO_MOVE: header, count, time (2), then id + position word per servo."""
+    return HEADER_SIZE + 3 + 3 * n_servos
+
+
+def position_query_size(n_servos: int) -> int:
+    """CMD_MULT_SERVO_POS_READ request (count + ids) plus its response
+    (count + id/position word per servo)."""
+    return (HEADER_SIZE + 1 + n_servos) + (HEADER_SIZE + 1 + 3 * n_servos)
+
+
+class BusBudgetError(ValueError):
+    pass
+
+
+@dataclass
+class BusPlan:
+    """Static budget for one control rate + telemetry rate on one link."""
+    baudrate: int
+    frequency: float
+    telemetry_frequency: float
+    tick: float            # control period (s)
+    move_time: float       # wire time of one move packet (s)
+    query_time: float      # wire time of one position query round trip (s)
+    utilization: float     # fraction of link time in use, 0..1+
+
+    @property
+    def tick_slack(self) -> float:
+        """Idle link time left in a tick after its move packet (s)."""
+        return self.tick - self.move_time
+
+    @property
+    def query_fits_in_tick(self) -> bool:
+        return self.move_time + self.query_time <= self.tick
+
+    @property
+    def max_frequency(self) -> float:
+        """Highest control rate the link sustains with moves alone."""
+        return 1.0 / self.move_time
+
+
+class ServoBus:
+    """Bandwidth model for one servo link, plus live utilization accounting."""
+
+    def __init__(self, baudrate: int, max_utilization: float = 0.8, window: float = 1.0):
+        self.baudrate = baudrate
+        self.max_utilization = max_utilization
+        self.window = window
+
+        # Live accounting: link busy time in the current and last full window.
+        self._window_start = None
+        self._busy = 0.0
+        self._last_utilization = 0.0
+        # Estimated time the wire goes idle, and when the last move went out.
+        self._busy_until = 0.0
+        self._last_move = None
+        self.moves = 0
+        self.queries = 0
+        self.queries_deferred = 0
+
+    def wire_time(self, nbytes: int) -> float:
+        return nbytes * BITS_PER_BYTE / self.baudrate
+
+    def plan(self, n_servos: int, frequency: float, telemetry_frequency: float = 0) -> BusPlan:
+        move_time = self.wire_time(move_packet_size(n_servos))
+        query_time = self.wire_time(position_query_size(n_servos))
+        return BusPlan(
+            baudrate=self.baudrate,
+            frequency=frequency,
+            telemetry_frequency=telemetry_frequency,
+            tick=1.0 / frequency,
+            move_time=move_time,
+            query_time=query_time,
+            utilization=move_time * frequency + query_time * telemetry_frequency,
+        )
+
+    def check(self, n_servos: int, frequency: float, telemetry_frequency: float = 0,
+              strict: bool = False) -> BusPlan:
+        """Warn (or, if strict, raise BusBudgetError) when the planned load would
+        exceed `max_utilization` of the link or a move cannot finish within a tick."""
+        plan = self.plan(n_servos, frequency, telemetry_frequency)
+        problems = []
+        if plan.move_time > plan.tick:
+            problems.append(
+                f"a {n_servos}-servo move takes {plan.move_time * 1000:.1f} ms on the wire "
+                f"but a tick at {frequency} Hz is {plan.tick * 1000:.1f} ms "
+                f"(max {plan.max_frequency:.1f} Hz at {self.baudrate} baud)"
+            )
+        if plan.utilization > self.max_utilization:
+            problems.append(
+                f"planned bus utilization {plan.utilization:.0%} exceeds "
+                f"{self.max_utilization:.0%} at {self.baudrate} baud"
+            )
+        if telemetry_frequency and not plan.query_fits_in_tick:
+            problems.append(
+                f"a position query ({plan.query_time * 1000:.1f} ms) never fits in the "
+                f"{plan.tick_slack * 1000:.1f} ms left after each move, so telemetry "
+                f"is only polled while the robot stands still"
+            )
+        if problems:
+            message = "Servo bus over budget: " + "; ".join(problems)
+            if strict:
+                raise BusBudgetError(message)
+            LOGGER.warning(message)
+        return plan
+
+    # --- live accounting ----------------------------------------------------
+
+    def record(self, nbytes: int, move: bool = True, now: float | None = None):
+        """Account for a packet written to the link."""
+        now = time.monotonic() if now is None else now
+        wire = self.wire_time(nbytes)
+        if self._window_start is None:
+            self._window_start = now
+        elif now - self._window_start >= self.window:
+            self._last_utilization = self._busy / (now - self._window_start)
+            self._window_start = now
+            self._busy = 0.0
+        self._busy += wire
+        self._busy_until = max(self._busy_until, now) + wire
+        if move:
+            self.moves += 1
+            self._last_move = now
+        else:
+            self.queries += 1
+
+    def query_slot_open(self, n_servos: int, frequency: float, now: float | None = None) -> bool:
+        """True if a position query sent now finishes before the next move is due.
+
+        Moves have priority: a query that would still be on the wire when the next
+        tick fires is deferred (counted in queries_deferred) rather than sent.
+        """
+        now = time.monotonic() if now is None else now
+        if self._last_move is None:
+            return True
+        next_move = self._last_move + 1.0 / frequency
+        done = max(self._busy_until, now) + self.wire_time(position_query_size(n_servos))
+        if done <= next_move:
+            return True
+        self.queries_deferred += 1
+        return False
+
+    @property
+    def utilization(self) -> float:
+        """Measured fraction of link time busy over the last full window."""
+        return self._last_utilization
+
+    @property
+    def stats(self) -> dict:
+        return {
+            'baudrate': self.baudrate,
+            'utilization': self.utilization,
+            'moves': self.moves,
+            'queries': self.queries,
+            'queries_deferred': self.queries_deferred,
+        }
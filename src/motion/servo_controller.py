@@ -1,14 +1,22 @@
 __all__ = [
     'ServoController',
     'TimeoutError',
+    'encode_move',
+    'MovePacket',
+    'FrameParser',
 ]
 
 import asyncio
 import logging
+import threading
+from collections import defaultdict, deque
 from itertools import chain
 
+import numpy as np
 from serial.serialutil import Timeout
 
+from src.motion.serial_writer import SerialWriter
+
 TEST_MODE = False
 
 CMD_SERVO_MOVE = 3
@@ -40,6 +48,125 @@ def clamp(range_min, range_max, value):
     return min(range_max, max(range_min, value))
 
 
+def encode_packet(command, *params):
+    """Encode a Hiwonder bus packet: 0x55 0x55 header, length, command, params."""
+    return bytes([0x55, 0x55, 2 + len(params), command, *params])
+
+
+def encode_move(positions, time=0):
+    """Encode a CMD_SERVO_MOVE packet without sending it.
+
+    Lets callers build a packet once (e.g. for every tick of a gait cycle) and
+    replay it later via ServoController.write.
+
+    Args:
+        positions - dict mapping servo IDs to corresponding positions
+        time - int number of milliseconds for move
+    """
+    time = clamp(0, 30000, time)
+    return encode_packet(
+        CMD_SERVO_MOVE, len(positions),
+        lower_byte(time), higher_byte(time),
+        *chain(*[
+            (servo_id, lower_byte(pos), higher_byte(pos))
+            for servo_id, position in positions.items()
+            for pos in [clamp(0, 10000, position)]
+        ])
+    )
+
+
+# One servo entry in a CMD_SERVO_MOVE packet: id byte + little-endian position word.
+_MOVE_ENTRY = np.dtype([('id', 'u1'), ('position', '<u2')])
+
+
+class MovePacket(object):
+    """A persistent CMD_SERVO_MOVE packet for a fixed, ordered set of servo IDs.
+
+    The header and IDs are encoded once; `fill` rewrites only the time and the
+    position words, in place, through a NumPy view onto the packet's bytearray.
+    Nothing is allocated per call, so it is safe for the 50 Hz loop. The returned
+    buffer is reused by the next `fill` -- send it before filling again.
+    """
+
+    def __init__(self, servo_ids):
+        servo_ids = [int(servo_id) for servo_id in servo_ids]
+        self.servo_ids = servo_ids
+        self.buffer = bytearray(encode_move(dict.fromkeys(servo_ids, 0)))
+        # Each entry is 3 bytes, so the position words are unaligned; a packed
+        # structured view lets one vectorized assignment write them all.
+        entries = np.frombuffer(self.buffer, dtype=_MOVE_ENTRY, offset=7)
+        self._positions = entries['position']
+        self._clamped = np.empty(len(servo_ids), dtype=np.int32)
+        # Delta mode (fill_changed): a second buffer carrying only the servos that
+        # moved, and the positions each servo was last sent.
+        self._ids = np.array(servo_ids, dtype=np.uint8)
+        self._delta = bytearray(self.buffer)
+        self._delta_view = memoryview(self._delta)
+        self._delta_entries = np.frombuffer(self._delta, dtype=_MOVE_ENTRY, offset=7)
+        self._last_sent = np.zeros(len(servo_ids), dtype=np.int32)
+        self._has_sent = False
+        self._step = np.empty(len(servo_ids), dtype=np.int32)
+        self._changed = np.empty(len(servo_ids), dtype=bool)
+
+    def _clamp(self, positions):
+        # minimum/maximum are cheaper than np.clip on a 12-element array
+        np.minimum(positions, 10000, out=self._clamped, casting='unsafe')
+        np.maximum(self._clamped, 0, out=self._clamped)
+        return self._clamped
+
+    def _set_time(self, buffer, time):
+        time = clamp(0, 30000, time)
+        buffer[5] = time & 0xff
+        buffer[6] = time >> 8
+
+    def fill(self, positions, time=0):
+        """Write positions (one per servo ID, in ID order) and time into the packet.
+
+        Args:
+            positions - int array of servo positions, same order as servo_ids
+            time - int number of milliseconds for move
+        """
+        self._positions[...] = self._clamp(positions)
+        self._set_time(self.buffer, time)
+        return self.buffer
+
+    def fill_changed(self, positions, time=0, deadband=0, full=False):
+        """Delta variant of fill: a packet carrying only the servos whose position
+        moved by more than `deadband` since it was last sent.
+
+        Returns None when no servo changed (nothing needs sending), the full packet
+        when every servo changed or `full` is set (a periodic refresh), and
+        otherwise a shortened packet. Sent positions are remembered, so a servo's
+        commanded position never lags its target by more than the deadband.
+        """
+        clamped = self._clamp(positions)
+        if full or not self._has_sent:
+            self._changed[...] = True
+        else:
+            np.subtract(clamped, self._last_sent, out=self._step)
+            np.abs(self._step, out=self._step)
+            np.greater(self._step, deadband, out=self._changed)
+
+        count = int(np.count_nonzero(self._changed))
+        if count == 0:
+            return None
+        self._has_sent = True
+        if count == len(self.servo_ids):
+            self._last_sent[...] = clamped
+            self._positions[...] = clamped
+            self._set_time(self.buffer, time)
+            return self.buffer
+
+        changed = self._changed
+        self._last_sent[changed] = clamped[changed]
+        self._delta_entries['id'][:count] = self._ids[changed]
+        self._delta_entries['position'][:count] = clamped[changed]
+        self._delta[2] = 5 + 3 * count      # length: count + time (2) + entries + 2
+        self._delta[4] = count
+        self._set_time(self._delta, time)
+        return self._delta_view[:7 + 3 * count]
+
+
 class TimeoutError(RuntimeError):
     pass
 
@@ -47,6 +174,73 @@ class TimeoutError(RuntimeError):
 LOGGER = logging.getLogger('lewansoul.servos.lx16a')
 
 
+class FrameParser(object):
+    """Incremental parser for Hiwonder response frames over a fixed ring buffer.
+
+    Bytes arrive in whatever chunks the port hands back; `feed` appends them and
+    `next_frame` pops one complete `0x55 0x55 length cmd params...` frame at a
+    time, or returns None until the rest of the frame has arrived. Bytes that
+    cannot start a header are skipped (and logged) so the stream resyncs.
+    """
+
+    def __init__(self, size=256):
+        if size & (size - 1):
+            raise ValueError('size must be a power of two, got %d' % size)
+        self._buf = bytearray(size)
+        self._mask = size - 1
+        self._head = 0
+        self._count = 0
+        self.overflows = 0
+
+    def __len__(self):
+        return self._count
+
+    def feed(self, data):
+        size = len(self._buf)
+        data = memoryview(data)[-size:]
+        overflow = self._count + len(data) - size
+        if overflow > 0:
+            # keep the newest bytes; a frame cut by the overflow resyncs below
+            self.overflows += 1
+            self._skip(overflow)
+        tail = (self._head + self._count) & self._mask
+        first = min(len(data), size - tail)
+        self._buf[tail:tail + first] = data[:first]
+        self._buf[:len(data) - first] = data[first:]
+        self._count += len(data)
+
+    def _peek(self, offset):
+        return self._buf[(self._head + offset) & self._mask]
+
+    def _skip(self, size):
+        self._head = (self._head + size) & self._mask
+        self._count -= size
+
+    def next_frame(self):
+        """Pop the next complete frame as (cmd, params list), or None."""
+        while self._count >= 2:
+            if self._peek(0) != 0x55:
+                LOGGER.error(
+                    'Got unexpected octet while waiting for response header: %02x',
+                    self._peek(0)
+                )
+                self._skip(1)
+                continue
+            if self._peek(1) != 0x55:
+                self._skip(1)   # a lone 0x55; the next octet is checked above
+                continue
+            if self._count < 4:
+                return None
+            length = self._peek(2)
+            if self._count < length + 2:
+                return None
+            cmd = self._peek(3)
+            params = [self._peek(4 + i) for i in range(length - 2)]
+            self._skip(max(length + 2, 4))
+            return cmd, params
+        return None
+
+
 class ServoController(object):
     """Optimized servo controller for asyncio-based robot control.
     
@@ -54,14 +248,56 @@ class ServoController(object):
     - Write-only commands (move, unload) are lock-free for maximum throughput
     - Query commands use an async lock only to serialize read operations
     - Serial writes are atomic at the OS level for small packets
+    - Optionally (threaded=True) move frames are handed to a background
+      SerialWriter so a slow UART write never blocks the event loop
     """
     
-    def __init__(self, serial, timeout=1):
+    def __init__(self, serial, timeout=1, threaded=False, bus=None, deadband=0,
+                 refresh_interval=50):
         self._serial = serial
         self._timeout = timeout
         # Async lock only needed for query operations (read after write)
         self._query_lock = asyncio.Lock()
         self._responses = []
+        # CMD_SERVO_MOVE templates, one per distinct tuple of servo IDs
+        self._move_packets = {}
+        # Response parsing; when attached to a loop, futures awaiting each command
+        self._parser = FrameParser()
+        self._waiters = defaultdict(deque)
+        # command -> loop time until which its frames are stale (see _drain)
+        self._draining = {}
+        self._loop = None
+        self._fd = None
+        # Delta mode (deadband > 0): move_array only sends servos whose target
+        # moved more than `deadband` units; every `refresh_interval` frames (and
+        # after the writer drops a frame) a full packet resyncs all servos.
+        self.deadband = deadband
+        self.refresh_interval = refresh_interval
+        self._frames_since_refresh = 0
+        self._dropped_seen = 0
+        # move_array fills a shared packet in place and keeps delta state; the UI
+        # thread and the loop thread both move, so fill + write is one critical
+        # section (uncontended -- a few tens of ns -- in the steady state)
+        self._move_lock = threading.Lock()
+        # Optional ServoBus bandwidth model; every packet written is accounted to it
+        self.bus = bus
+        # Serializes direct writes against the writer thread (uncontended otherwise)
+        self._write_lock = threading.Lock()
+        self._writer = SerialWriter(
+            serial, self._write_lock, on_write=self._on_move_written
+        ) if threaded else None
+        if self._writer is not None and not TEST_MODE:
+            self._writer.start()
+
+    @property
+    def writer(self):
+        """The background SerialWriter, or None when writes are synchronous."""
+        return self._writer
+
+    def close(self):
+        self.detach()
+        if self._writer is not None:
+            self._writer.stop()
 
     def _command(self, command, *params):
         """Send a command packet - no locking needed for write-only ops.
@@ -69,14 +305,30 @@ class ServoController(object):
         Serial writes of small packets (<64 bytes) are atomic at OS level.
         The Hiwonder protocol packets are always small enough.
         """
-        length = 2 + len(params)
-        LOGGER.debug('Sending servo control packet: %s', hex_data([
-            0x55, 0x55, length, command, *params
-        ]))
+        self.write(encode_packet(command, *params))
+
+    def write(self, packet, move=False):
+        """Send an already-encoded packet (see encode_move)."""
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug('Sending servo control packet: %s', hex_data(packet))
         if not TEST_MODE:
-            self._serial.write(bytearray([
-                0x55, 0x55, length, command, *params
-            ]))
+            with self._write_lock:
+                self._serial.write(packet)
+            if self.bus is not None:
+                self.bus.record(len(packet), move=move)
+
+    def _on_move_written(self, nbytes):
+        if self.bus is not None:
+            self.bus.record(nbytes, move=True)
+
+    def write_move(self, packet):
+        """Send a move packet; with a writer thread it is posted to the mailbox
+        (latest frame wins) instead of written on the caller's thread."""
+        if self._writer is None or not self._writer.running:
+            return self.write(packet, move=True)
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug('Posting servo move packet: %s', hex_data(packet))
+        self._writer.post(packet)
 
     def _wait_for_response(self, command, timeout=None):
         """Read response from serial - called only when lock is held."""
@@ -85,49 +337,67 @@ class ServoController(object):
         if TEST_MODE:
             raise Exception("Cannot read from Serial, we are in test mode.")
 
-        def read(size=1):
-            self._serial.timeout = timeout.time_left()
-            data = self._serial.read(size)
-            if len(data) != size:
-                raise TimeoutError()
-            return data
-
         while True:
-            data = []
-            data += read(1)
-            if data[-1] != 0x55:
-                LOGGER.error(
-                    'Got unexpected octet while waiting for response header: %02x',
-                    data[-1]
-                )
-                continue
-            data += read(1)
-            if data[-1] != 0x55:
-                LOGGER.error(
-                    'Got unexpected octet while waiting for response header: %02x',
-                    data[-1]
-                )
-                continue
-            data += read(2)
-            length = data[2]
-            cmd = data[3]
+            frame = self._parser.next_frame()
+            if frame is not None:
+                cmd, params = frame
+                if LOGGER.isEnabledFor(logging.DEBUG):
+                    LOGGER.debug('Got command %s response: %s', cmd, hex_data(params))
+                self._responses.append([cmd] + params)
+                return params
 
-            data += read(length - 2) if length > 2 else []
-            params = data[4:]
-
-            LOGGER.debug('Got command %s response: %s', cmd, hex_data(data))
-            self._responses.append([cmd] + params)
+            self._serial.timeout = timeout.time_left()
+            data = self._serial.read(self._serial.in_waiting or 1)
+            if not data:
+                raise TimeoutError()
+            self._parser.feed(data)
 
-            return params
+    def _discard_input(self):
+        """Drop responses left over from earlier queries (e.g. one that timed out
+        and answered late). Blocking queries are serialized, so anything already
+        buffered when a request is about to go out cannot be its response."""
+        if TEST_MODE:
+            return
+        while self._parser.next_frame() is not None:
+            pass
+        waiting = self._serial.in_waiting
+        if waiting:
+            LOGGER.debug('Discarding %d stale response bytes', waiting)
+            self._serial.read(waiting)
 
     def _query_sync(self, command, *params, timeout=None):
         """Synchronous query - use when not in async context."""
+        if self._loop is not None:
+            raise RuntimeError('Synchronous query while attached to an event loop')
+        self._discard_input()
         self._command(command, *params)
         return self._wait_for_response(command, timeout=timeout)
 
     async def _query_async(self, command, *params, timeout=None):
-        """Async query - serializes read operations with async lock."""
+        """Async query.
+
+        Attached to an event loop (see attach), the request is written and a
+        future awaits its response frame -- no thread hop and no lock, so queries
+        can be pipelined. Otherwise the blocking read runs in the executor,
+        serialized by an async lock.
+        """
+        timeout = timeout or self._timeout
+        if self._loop is not None:
+            # while a timed-out response may still arrive, hold new requests back
+            delay = self._draining.get(command, 0) - self._loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            future = self._loop.create_future()
+            self._waiters[command].append(future)
+            self._command(command, *params)
+            try:
+                return await asyncio.wait_for(future, timeout)
+            except asyncio.TimeoutError:
+                self._drain(command, timeout)
+                raise TimeoutError()
+
         async with self._query_lock:
+            self._discard_input()
             self._command(command, *params)
             # Run blocking serial read in executor to not block event loop
             loop = asyncio.get_event_loop()
@@ -135,6 +405,72 @@ class ServoController(object):
                 None, self._wait_for_response, command, timeout
             )
 
+    def _drain(self, command, timeout):
+        """A `command` response went missing. Responses carry no request id, so if
+        it turns up late it would be matched to the next waiter, and every answer
+        after it would be one request behind. Instead fail the other queries
+        already in flight for `command` and drop its frames for another
+        `timeout`; requests sent after that start from a clean slate."""
+        for future in self._waiters.pop(command, ()):
+            if not future.done():
+                future.set_exception(TimeoutError())
+        self._draining[command] = self._loop.time() + timeout
+
+    def attach(self, loop=None):
+        """Read responses natively on the event loop via loop.add_reader on the
+        serial fd. Returns False (and keeps the executor path) if the port has no
+        selectable file descriptor."""
+        loop = loop or asyncio.get_event_loop()
+        if TEST_MODE:
+            return False
+        try:
+            fd = self._serial.fileno()
+            self._serial.timeout = 0   # reads return only what is already buffered
+            loop.add_reader(fd, self._on_readable)
+        except (AttributeError, NotImplementedError, OSError, ValueError) as e:
+            LOGGER.warning('Async serial reads unavailable, using executor: %s', e)
+            return False
+        self._loop = loop
+        self._fd = fd
+        return True
+
+    def detach(self):
+        if self._loop is None:
+            return
+        self._loop.remove_reader(self._fd)
+        for waiters in self._waiters.values():
+            for future in waiters:
+                future.cancel()
+        self._waiters.clear()
+        self._draining.clear()
+        self._loop = None
+        self._fd = None
+
+    def _on_readable(self):
+        data = self._serial.read(self._serial.in_waiting or 1)
+        if not data:
+            return
+        self._parser.feed(data)
+        while True:
+            frame = self._parser.next_frame()
+            if frame is None:
+                return
+            cmd, params = frame
+            if LOGGER.isEnabledFor(logging.DEBUG):
+                LOGGER.debug('Got command %s response: %s', cmd, hex_data(params))
+            if cmd in self._draining:
+                if self._loop.time() < self._draining[cmd]:
+                    LOGGER.debug('Dropping stale command %s response', cmd)
+                    continue
+                del self._draining[cmd]
+            waiters = self._waiters.get(cmd)
+            if waiters:
+                future = waiters.popleft()
+                if not future.done():
+                    future.set_result(params)
+            else:
+                LOGGER.warning('Dropping unsolicited command %s response', cmd)
+
     def move(self, positions, time=0):
         """Command multiple servos to move to given positions in given time.
 
@@ -142,17 +478,44 @@ class ServoController(object):
             positoins - dict mapping servo IDs to corresponding positions
             time - int number of milliseconds for move
         """
-        time = clamp(0, 30000, time)
+        self.write_move(encode_move(positions, time))
+
+    def move_array(self, servo_ids, positions, time=0):
+        """Fast path for move: command servos from a NumPy int array.
+
+        The packet template (header and IDs) is built once per ID set and cached;
+        each call only clamps and packs the position words in place. Hex is
+        formatted for the log only when debug logging is enabled.
+
+        In delta mode (deadband > 0) only servos whose target changed by more
+        than the deadband are sent, and nothing at all while holding a pose.
 
-        self._command(
-            CMD_SERVO_MOVE, len(positions),
-            lower_byte(time), higher_byte(time),
-            *chain(*[
-                (servo_id, lower_byte(pos), higher_byte(pos))
-                for servo_id, position in positions.items()
-                for pos in [clamp(0, 10000, position)]
-            ])
-        )
+        Args:
+            servo_ids - tuple of servo IDs (hashable; the template cache key)
+            positions - int array of positions, same order as servo_ids
+            time - int number of milliseconds for move
+        """
+        with self._move_lock:
+            self._move_array(servo_ids, positions, time)
+
+    def _move_array(self, servo_ids, positions, time):
+        packet = self._move_packets.get(servo_ids)
+        if packet is None:
+            packet = self._move_packets[servo_ids] = MovePacket(servo_ids)
+        if self.deadband <= 0:
+            self.write_move(packet.fill(positions, time))
+            return
+
+        full = self._frames_since_refresh >= self.refresh_interval
+        writer = self._writer
+        if writer is not None and writer.frames_dropped != self._dropped_seen:
+            # a dropped delta frame may have carried a change: resync everything
+            self._dropped_seen = writer.frames_dropped
+            full = True
+        frame = packet.fill_changed(positions, time, self.deadband, full)
+        self._frames_since_refresh = 0 if full else self._frames_since_refresh + 1
+        if frame is not None:
+            self.write_move(frame)
 
     def get_positions(self, servo_ids):
         """Reads positions of servos with given IDs and returns a map
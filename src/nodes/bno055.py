@@ -0,0 +1,67 @@
+"""
+Burst reads of the BNO055 data registers.
+
+Each of the driver's `euler`, `acceleration` and `gyro` properties is its own
+I2C transaction, and each one first reads the mode register to check the value
+is valid -- six transactions, each with an address phase, per sample. The
+sensor's data registers are contiguous, though: accelerometer, magnetometer,
+gyroscope and euler are four little-endian int16 triples from 0x08 to 0x1F. A
+`BurstReader` fetches all 24 bytes in one write-then-read transaction into a
+preallocated buffer and decodes them with one np.frombuffer and a scale multiply,
+using the same scales as the driver so values are unchanged.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+DATA_START = 0x08                 # ACC_DATA_X_LSB
+DATA_END = 0x20                   # one past EUL_DATA_Z_MSB
+DATA_SIZE = DATA_END - DATA_START
+
+# Row order of the decoded (4, 3) block
+ACCELERATION, MAGNETIC, GYRO, EULER = range(4)
+
+# Driver scales (adafruit_bno055): m/s^2, microtesla, rad/s, degrees
+SCALES = np.array([
+    [1 / 100],
+    [1 / 16],
+    [0.001090830782496456],
+    [1 / 16],
+])
+
+
+def decode_data_block(data) -> np.ndarray:
+    """(4, 3) float array of acceleration, magnetic, gyro and euler from the
+    24-byte register block."""
+    return np.frombuffer(data, dtype='<i2', count=DATA_SIZE // 2).reshape(4, 3) * SCALES
+
+
+class BurstReader:
+    """Reads the BNO055 data block in one I2C transaction."""
+
+    def __init__(self, i2c_device):
+        self.i2c_device = i2c_device
+        # byte 0 is the register address written; the block is read in after it
+        self._buffer = bytearray(DATA_SIZE + 1)
+        self._buffer[0] = DATA_START
+        self._data = memoryview(self._buffer)[1:]
+
+    @classmethod
+    def for_sensor(cls, sensor) -> BurstReader | None:
+        """A reader sharing the sensor's I2C device, or None when the sensor is
+        not on I2C (UART driver, test doubles) and must be read per property."""
+        i2c_device = getattr(sensor, 'i2c_device', None)
+        if i2c_device is None:
+            return None
+        return cls(i2c_device)
+
+    def read_raw(self) -> memoryview:
+        with self.i2c_device as i2c:
+            i2c.write_then_readinto(self._buffer, self._buffer, out_end=1, in_start=1)
+        return self._data
+
+    def read(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(euler, acceleration, gyro), as the driver properties return them."""
+        block = decode_data_block(self.read_raw())
+        return block[EULER], block[ACCELERATION], block[GYRO]
@@ -1,10 +1,13 @@
+import asyncio
 import atexit
 import logging
+import os
+import threading
 import time
 
 import numpy as np
 import serial
-from dataclasses import replace
+from dataclasses import dataclass, field, replace
 from settings import settings
 from src.interfaces.pose import Pose
 from src.model.types import MoveTypes
@@ -13,14 +16,17 @@ from src.motion.gaits.trot import Trot
 from src.motion.gaits.turn import Turn
 from src.motion.gaits.simple_turn import SimpleTurn
 from src.motion.gaits.arc_turn import ArcTurn
+from src.motion.gaits.cache import gait_cache
+from src.motion.gaits.transition import GaitTransition
 from src.motion.gaits.simplified_gait import (
     SimpleTrotWithLateral, SimpleSidestep
 )
 from src.motion.gaits.prowl import Prowl
 from src.motion.kinematics import QuadrupedKinematics
-from src.motion.servo_controller import ServoController
+from src.motion.servo_bus import ServoBus
+from src.motion.servo_controller import ServoController, encode_move
 from src.nodes.imu import IMUData
-from src.nodes.node import Node
+from src.nodes.node import Node, OverrunPolicy
 from src.signals import Topics
 
 logger = logging.getLogger("VEGA")
@@ -33,8 +39,23 @@ _km = QuadrupedKinematics(
     settings.robot_length,
 )
 
+
+def _open_servo_port():
+    """The servo board's serial port, or the simulated bus when configured."""
+    if settings.servo_bus_simulated:
+        from src.mock.servo_serial import SimulatedServoBus
+        return SimulatedServoBus(settings.servo_baudrate, slew_rate=settings.servo_slew_rate)
+    return serial.Serial(settings.serial_port, settings.servo_baudrate)
+
+
 try:
-    _sc = ServoController(serial.Serial(settings.serial_port))
+    _sc = ServoController(
+        _open_servo_port(),
+        threaded=settings.servo_threaded_writer,
+        bus=ServoBus(settings.servo_baudrate, settings.servo_bus_max_utilization),
+        deadband=settings.servo_deadband,
+        refresh_interval=settings.servo_refresh_interval,
+    )
 except:  # noqa: E722
     _sc = None
     logger.debug("Robot will not move - couldn't open serial port.")
@@ -45,8 +66,10 @@ SERVO_MAX_ANGLE = np.radians(240)
 # Pre-compute constants for servo position calculations (avoid repeated computation)
 _SERVO_SCALE = 1000.0 / SERVO_MAX_ANGLE
 _SERVO_IDS = np.array(settings.servo_ids)
+_SERVO_ID_KEY = tuple(int(servo_id) for servo_id in _SERVO_IDS)   # move_array template key
 _ANGLE_ZERO = settings.angle_zero
 _ANGLE_FLIP = settings.angle_flip
+_SERVO_GAIN = _ANGLE_FLIP * _SERVO_SCALE
 # NOTE: position_offsets is NOT cached here - it changes at runtime via IMU leveling
 
 
@@ -56,11 +79,8 @@ def _angles_from_positions(positions: np.ndarray) -> np.ndarray:
 
 
 def _positions_from_angles(angles: np.ndarray) -> np.ndarray:
-    """Vectorized FK for all 4 legs."""
-    positions = np.zeros((4, 3))
-    for i in range(4):
-        positions[i] = _km.forward_kinematics(angles[i])
-    return positions - settings.position_offsets
+    """Vectorized FK for all 4 legs (or any (..., 4, 3) batch of frames)."""
+    return _km.forward_kinematics_batch(angles) - settings.position_offsets
 
 
 def _servo_positions_from_angles(angles: np.ndarray) -> dict:
@@ -79,7 +99,141 @@ def _angles_from_servo_positions(servo_positions) -> np.ndarray:
 
 
 def _servo_positions_to_numpy(servo_positions) -> np.ndarray:
-    return np.array(list(servo_positions.values()), dtype=np.float32).reshape((4, 3))
+    """(4, 3) servo positions in settings.servo_ids order; a servo missing from a
+    readback is NaN."""
+    return np.array(
+        [servo_positions.get(servo_id, np.nan) for servo_id in _SERVO_IDS],
+        dtype=np.float32,
+    ).reshape((4, 3))
+
+
+@dataclass
+class ServoTelemetry:
+    """One servo position readback, converted and compared to the last command.
+
+    servo_positions / commanded are raw servo units (4, 3); angles and positions
+    are the measured joint angles and foot positions. tracking_error is measured
+    minus commanded, in servo units and in mm -- a servo that keeps falling
+    behind under load shows up as a persistently large entry.
+    """
+    timestamp: float = 0.0
+    servo_positions: np.ndarray = field(default_factory=lambda: np.zeros((4, 3)))
+    commanded: np.ndarray = field(default_factory=lambda: np.zeros((4, 3)))
+    angles: np.ndarray = field(default_factory=lambda: np.zeros((4, 3)))
+    positions: np.ndarray = field(default_factory=lambda: np.zeros((4, 3)))
+    tracking_error: np.ndarray = field(default_factory=lambda: np.zeros((4, 3)))
+    position_error: np.ndarray = field(default_factory=lambda: np.zeros((4, 3)))
+
+    @property
+    def max_tracking_error(self) -> float:
+        return float(np.nanmax(np.abs(self.tracking_error)))
+
+
+def _telemetry_from_servo_positions(servo_positions: dict, pose: Pose) -> ServoTelemetry:
+    measured = _servo_positions_to_numpy(servo_positions)
+    angles = _angles_from_servo_positions(servo_positions)
+    positions = _positions_from_angles(angles)
+    commanded = (
+        _servo_positions_to_numpy(pose.cmd) if pose.cmd else np.full((4, 3), np.nan)
+    )
+    return ServoTelemetry(
+        timestamp=time.time(),
+        servo_positions=measured,
+        commanded=commanded,
+        angles=angles,
+        positions=positions,
+        tracking_error=measured - commanded,
+        position_error=positions - pose.positions,
+    )
+
+
+@dataclass
+class ServoTable:
+    """One gait cycle compiled down to servo commands.
+
+    Row i holds everything `move_to` would compute for frame i of the cycle, so
+    the steady-state tick is a lookup plus a serial write. `offsets` records the
+    position offsets the table was solved against; leveling mutates
+    settings.position_offsets at runtime, which invalidates the table.
+    """
+    positions: np.ndarray   # (N, 4, 3) commanded foot positions
+    angles: np.ndarray      # (N, 4, 3) joint angles
+    servos: np.ndarray      # (N, 12) int16 servo positions, in settings.servo_ids order
+    cmds: list              # N servo_id -> position dicts (Pose.cmd)
+    packets: list           # N pre-encoded CMD_SERVO_MOVE packets
+    offsets: np.ndarray     # (4, 3) position offsets at compile time
+    millis: int = 0
+
+    def __len__(self):
+        return self.servos.shape[0]
+
+    def is_stale(self) -> bool:
+        return not np.array_equal(self.offsets, settings.position_offsets)
+
+
+def _gait_servo_table(gait: Gait) -> ServoTable:
+    """`gait`'s table for the current position offsets. It lives in gait.compiled,
+    which all copies of a cached gait share, so a switch back to a gait reuses
+    it; it is recompiled only when the offsets it was solved against change."""
+    table = gait.compiled.get('servo_table')
+    if table is None or table.is_stale():
+        table = gait.compiled['servo_table'] = _compile_servo_table(gait.cycle_positions())
+    return table
+
+
+def _compile_servo_table(positions: np.ndarray, millis: int = 0) -> ServoTable:
+    """Solve IK and servo mapping for a whole (N, 4, 3) cycle in one pass."""
+    positions = np.asarray(positions)
+    n = positions.shape[0]
+    offsets = np.copy(settings.position_offsets)
+    angles = _km.inverse_kinematics_batch(positions + offsets)
+    servos = (
+        ((angles - _ANGLE_ZERO) * _ANGLE_FLIP * _SERVO_SCALE + 500)
+        .astype(np.int32)
+        .reshape(n, -1)
+        .astype(np.int16)
+    )
+    cmds = [dict(zip(_SERVO_IDS, row.astype(np.int32))) for row in servos]
+    packets = [encode_move(cmd, millis) for cmd in cmds]
+    return ServoTable(positions, angles, servos, cmds, packets, offsets, millis)
+
+
+class _MoveBuffers:
+    """Reusable work arrays for the preallocated move_to path.
+
+    IK and the servo mapping write into these, and ServoController.move_array
+    packs the packet in place, so a steady 50 Hz stream of move_to calls allocates
+    nothing and never feeds the GC. The arrays are overwritten on every move: Pose.angles and Pose.cmd become live
+    views of the latest command rather than per-tick snapshots.
+    """
+
+    def __init__(self):
+        self.target = np.empty((4, 3))
+        self.angles = np.empty((4, 3))
+        self.servo = np.empty((4, 3))
+        self.servo_values = np.empty(12, dtype=np.int32)
+        self.servo_ids = list(_SERVO_IDS)
+        self.cmd: dict = dict.fromkeys(self.servo_ids, 0)
+
+    def solve(self, positions: np.ndarray):
+        """IK + servo mapping into the buffers; same values as
+        _servo_positions_from_angles(_angles_from_positions(positions))."""
+        np.add(positions, settings.position_offsets, out=self.target)
+        _km.inverse_kinematics_vectorized(self.target, out=self.angles)
+        np.subtract(self.angles, _ANGLE_ZERO, out=self.servo)
+        np.multiply(self.servo, _SERVO_GAIN, out=self.servo)
+        np.add(self.servo, 500, out=self.servo)
+        np.copyto(self.servo_values, self.servo.reshape(-1), casting='unsafe')
+        self.cmd.update(zip(self.servo_ids, self.servo_values))
+
+
+def _lower_thread_priority():
+    """Best effort: nice the calling thread down. Linux schedules threads as
+    separate tasks, so this leaves the rest of the process alone."""
+    try:
+        os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), 19)
+    except (AttributeError, OSError):
+        pass
 
 
 def millis_or_default(millis):
@@ -87,21 +241,41 @@ def millis_or_default(millis):
 
 
 class Controller(Node):
+    # Gait frames are time-based: run late ticks rather than dropping them so gait
+    # speed does not depend on how busy the event loop is.
+    overrun_policy = OverrunPolicy.CATCH_UP
 
     def __init__(self, **kwargs):
         super(Controller, self).__init__(**kwargs)
         self.pose = Pose()
+        # Preallocated-buffer mode: move_to solves into reusable arrays and an
+        # in-place packet instead of allocating per call (see _MoveBuffers).
+        self.buffers: _MoveBuffers | None = (
+            _MoveBuffers() if kwargs.get("preallocate", True) else None
+        )
+        # move_to runs on the loop thread (gait ticks) and the UI thread
+        # (process_move / stop / set_pose); the buffers and the pose are shared,
+        # so a move is one critical section. Re-entrant for raw_pose subscribers.
+        self._move_lock = threading.RLock()
         self.gait: Gait | None = None
+        # Blend into a newly selected gait instead of jumping to its first frame.
+        self.transition: GaitTransition | None = None
+        self.servo_table: ServoTable | None = None
+        self.telemetry: ServoTelemetry | None = None
+        # Set by the spinner after each gait frame so telemetry slots in behind it.
+        self._move_sent = asyncio.Event()
+        self._telemetry_task: asyncio.Task | None = None
         self.move_type: MoveTypes = MoveTypes.STOP
         self.moving: bool = False
         # Live-tunable ICR for ArcTurn (0.5 = spin in place; offset = curving arc).
         self.arc_pivot_ratio: float = 0.5
+        # Whether each move type's gait and its servo table are compiled, i.e.
+        # whether switching to it is a lookup rather than a compile.
+        self.gaits_ready: dict[MoveTypes, bool] = dict.fromkeys(self._gait_factories(), False)
+        self._warm_thread: threading.Thread | None = None
         self._read_positions()
         self.set_targets(settings.position_ready)
         self.move_to(settings.position_ready, 400)
-        self.imu_data: IMUData = IMUData()
-
-        self.handle_subscriptions()
 
         atexit.register(self.shutdown)
 
@@ -110,15 +284,14 @@ class Controller(Node):
         time.sleep(0.2)
 
         if _sc:
+            _sc.close()
             _sc.unload(settings.servo_ids)
 
-    def handle_subscriptions(self):
-        Topics.raw_imu.connect(self.on_raw_imu)
-
-    def on_raw_imu(self, sender, payload: IMUData):
-        """Handle IMU data updates."""
-        self.imu_data = payload
-        self.logger.debug(f"IMU Euler: {payload.euler}")  
+    @property
+    def imu_data(self) -> IMUData:
+        """Latest IMU sample, from the raw_imu topic cache."""
+        latest = Topics.raw_imu.latest
+        return latest if latest is not None else IMUData()
 
     def set_targets(self, positions: np.ndarray):
         self.pose.target_positions = positions
@@ -132,6 +305,9 @@ class Controller(Node):
         return self.move_to(self.pose.target_positions, millis_or_default(millis))
 
     def move_to(self, positions: np.ndarray, millis=500):
+        if self.buffers is not None:
+            return self._move_to_buffered(positions, millis)
+
         angles = _angles_from_positions(positions)
         cmd: dict = _servo_positions_from_angles(angles)
 
@@ -145,22 +321,93 @@ class Controller(Node):
         Topics.raw_pose.send("pose", payload=self.pose)
         return cmd
 
+    def _move_to_buffered(self, positions: np.ndarray, millis=500):
+        buffers = self.buffers
+        with self._move_lock:
+            buffers.solve(positions)
+
+            if _sc is not None:
+                _sc.move_array(_SERVO_ID_KEY, buffers.servo_values, millis_or_default(millis))
+
+            self.pose.angles = buffers.angles
+            self.pose.positions = positions
+            self.pose.cmd = buffers.cmd
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(self.pose)
+            Topics.raw_pose.send("pose", payload=self.pose)
+        return buffers.cmd
+
+    def _servo_table(self) -> ServoTable:
+        """The current gait's compiled table, fetched on first use and whenever
+        the position offsets have changed since it was compiled."""
+        table = self.servo_table
+        if table is None or table.is_stale():
+            table = self.servo_table = _gait_servo_table(self.gait)
+            self.gaits_ready[self.move_type] = True
+        return table
+
+    def move_to_index(self, table: ServoTable, index: int):
+        """Table-driven move_to: send frame `index` of a compiled cycle."""
+        with self._move_lock:
+            if _sc is not None:
+                if _sc.deadband > 0:
+                    # delta mode diffs against the last frame sent, so use the raw row
+                    _sc.move_array(_SERVO_ID_KEY, table.servos[index], table.millis)
+                else:
+                    _sc.write_move(table.packets[index])
+
+            self.pose.angles = table.angles[index]
+            self.pose.positions = table.positions[index]
+            self.pose.cmd = table.cmds[index]
+            Topics.raw_pose.send("pose", payload=self.pose)
+            return self.pose.cmd
+
     def _read_positions(self):
         try:
             if _sc is not None:
-                self.logger.debug(_sc.get_positions(settings.servo_ids))
+                servo_positions = _sc.get_positions(settings.servo_ids)
+                self.logger.debug(servo_positions)
                 self.logger.debug(f"battery: {_sc.get_battery_voltage()}")
-            # self.pose.servo_positions = _servo_positions_to_numpy(_sc.get_positions(SERVO_IDS))
-            # self.pose.angles = _angles_from_servo_positions(self.pose.servo_positions)
-            # self.pose.positions = _positions_from_angles(self.pose.angles)
+                self.telemetry = _telemetry_from_servo_positions(servo_positions, self.pose)
         except:  # noqa: E722
             pass
 
+    async def poll_telemetry(self, frequency: float):
+        """Read all servo positions at `frequency` Hz and publish ServoTelemetry.
+
+        Each query waits for the next move frame to go out (or one period, when
+        idle) and is sent straight behind it, so it uses the gap before the next
+        tick instead of delaying the command stream.
+        """
+        period = 1 / frequency
+        while self._running:
+            await asyncio.sleep(period)
+            self._move_sent.clear()
+            try:
+                await asyncio.wait_for(self._move_sent.wait(), period)
+            except asyncio.TimeoutError:
+                pass
+            # Moves have priority: skip this slot if the query would still be on
+            # the wire when the next tick's move is due.
+            bus = _sc.bus
+            if self.moving and bus is not None and not bus.query_slot_open(
+                len(settings.servo_ids), self.frequency
+            ):
+                continue
+            try:
+                servo_positions = await _sc.get_positions_async(settings.servo_ids)
+            except Exception as e:
+                self.logger.warning(f"servo telemetry read failed: {e!r}")
+                continue
+            self.telemetry = _telemetry_from_servo_positions(servo_positions, self.pose)
+            Topics.servo_telemetry.send("servo_telemetry", payload=self.telemetry)
+
     def ready(self, millis=100):
         self.move_to(settings.position_ready, millis)
 
     def stop(self):
         self.moving = False
+        self.transition = None
         self.move_type = MoveTypes.STOP
         self.ready()
         return {"moving": self.moving, "move_type": self.move_type}
@@ -175,48 +422,100 @@ class Controller(Node):
         self.logger.info("Done trotting in place...")
         time.sleep(0.1)
 
-    def _get_gait_factory(self, move_type: MoveTypes):
-        """Return a gait instance for the given move type."""
-        factories = {
-            MoveTypes.FORWARD: lambda: SimpleTrotWithLateral(
+    def _gait_factories(self) -> dict:
+        return {
+            MoveTypes.FORWARD: lambda: gait_cache.get(
+                SimpleTrotWithLateral,
                 p0=settings.position_trot + settings.position_forward_offsets,
                 params=settings.trot_params
             ),
-            MoveTypes.BACKWARD: lambda: SimpleTrotWithLateral(
+            MoveTypes.BACKWARD: lambda: gait_cache.get(
+                SimpleTrotWithLateral,
                 p0=settings.position_trot + settings.position_backward_offsets,
                 params=settings.trot_reverse_params,
             ),
-            MoveTypes.FORWARD_LT: lambda: Turn(params=replace(settings.turn_params, turn_direction=1)),
-            MoveTypes.FORWARD_RT: lambda: Turn(params=replace(settings.turn_params, turn_direction=-1)),
-            MoveTypes.BACKWARD_LT: lambda: Turn(params=replace(settings.turn_params, turn_direction=-1, is_reversed=True)),
-            MoveTypes.BACKWARD_RT: lambda: Turn(params=replace(settings.turn_params, turn_direction=1, is_reversed=True)),
+            MoveTypes.FORWARD_LT: lambda: gait_cache.get(Turn, params=replace(settings.turn_params, turn_direction=1)),
+            MoveTypes.FORWARD_RT: lambda: gait_cache.get(Turn, params=replace(settings.turn_params, turn_direction=-1)),
+            MoveTypes.BACKWARD_LT: lambda: gait_cache.get(Turn, params=replace(settings.turn_params, turn_direction=-1, is_reversed=True)),
+            MoveTypes.BACKWARD_RT: lambda: gait_cache.get(Turn, params=replace(settings.turn_params, turn_direction=1, is_reversed=True)),
             # Experimental turns for A/B comparison vs legacy Turn (same direction
             # convention: LT -> turn_direction=1, RT -> -1).
-            MoveTypes.SIMPLE_TURN_LT: lambda: SimpleTurn(params=replace(settings.turn_params, turn_direction=1)),
-            MoveTypes.SIMPLE_TURN_RT: lambda: SimpleTurn(params=replace(settings.turn_params, turn_direction=-1)),
-            MoveTypes.ARC_TURN_LT: lambda: ArcTurn(params=replace(settings.turn_params, turn_direction=1, pivot_ratio=self.arc_pivot_ratio)),
-            MoveTypes.ARC_TURN_RT: lambda: ArcTurn(params=replace(settings.turn_params, turn_direction=-1, pivot_ratio=self.arc_pivot_ratio)),
-            MoveTypes.LEFT: lambda: SimpleSidestep(params=replace(settings.sidestep_params, is_reversed=True)),
-            MoveTypes.RIGHT: lambda: SimpleSidestep(params=settings.sidestep_params),
-            MoveTypes.TROT_IN_PLACE: lambda: Trot(params=settings.trot_in_place_params),
-            MoveTypes.PROWL: lambda: Prowl(
+            MoveTypes.SIMPLE_TURN_LT: lambda: gait_cache.get(SimpleTurn, params=replace(settings.turn_params, turn_direction=1)),
+            MoveTypes.SIMPLE_TURN_RT: lambda: gait_cache.get(SimpleTurn, params=replace(settings.turn_params, turn_direction=-1)),
+            MoveTypes.ARC_TURN_LT: lambda: gait_cache.get(ArcTurn, params=replace(settings.turn_params, turn_direction=1, pivot_ratio=self.arc_pivot_ratio)),
+            MoveTypes.ARC_TURN_RT: lambda: gait_cache.get(ArcTurn, params=replace(settings.turn_params, turn_direction=-1, pivot_ratio=self.arc_pivot_ratio)),
+            MoveTypes.LEFT: lambda: gait_cache.get(SimpleSidestep, params=replace(settings.sidestep_params, is_reversed=True)),
+            MoveTypes.RIGHT: lambda: gait_cache.get(SimpleSidestep, params=settings.sidestep_params),
+            MoveTypes.TROT_IN_PLACE: lambda: gait_cache.get(Trot, params=settings.trot_in_place_params),
+            MoveTypes.PROWL: lambda: gait_cache.get(
+                Prowl,
                 p0=settings.position_prowl,
                 params=settings.prowl_params
             ),
-            MoveTypes.PROWL_BACKWARD: lambda: Prowl(
+            MoveTypes.PROWL_BACKWARD: lambda: gait_cache.get(
+                Prowl,
                 p0=settings.position_prowl,
                 params=settings.prowl_reverse_params
             ),
         }
-        factory = factories.get(move_type)
-        return factory() if factory else None
+
+    def _get_gait_factory(self, move_type: MoveTypes):
+        """Return a gait instance for the given move type, compiled at most once
+        per parameter set (see gait_cache)."""
+        factory = self._gait_factories().get(move_type)
+        if factory is None:
+            return None
+        return factory()
+
+    def warm_gait_cache(self, pause: float | None = None) -> threading.Thread:
+        """Compile every move type's gait, and its servo table, into the gait cache
+        from a low-priority background thread, so even the first switch to a gait
+        is a lookup.
+
+        The thread sleeps `pause` seconds between gaits to hand the GIL back to
+        the control loop; `gaits_ready` fills in as it goes.
+        """
+        if self._warm_thread is not None and self._warm_thread.is_alive():
+            return self._warm_thread
+        pause = settings.gait_warm_pause if pause is None else pause
+        self._warm_thread = threading.Thread(
+            target=self._warm_gaits, args=(pause,), name='gait-warm', daemon=True
+        )
+        self._warm_thread.start()
+        return self._warm_thread
+
+    def _warm_gaits(self, pause: float):
+        _lower_thread_priority()
+        started = time.perf_counter()
+        for move_type in self._gait_factories():
+            if self.gaits_ready.get(move_type):
+                continue
+            try:
+                self._precompile(move_type)
+            except Exception:  # noqa: BLE001 -- a bad gait must not stop the others
+                self.logger.exception(f"Could not precompile the {move_type.value} gait")
+            time.sleep(pause)
+        ready = sum(self.gaits_ready.values())
+        self.logger.info(
+            f"Gait cache warm: {ready}/{len(self.gaits_ready)} gaits in "
+            f"{time.perf_counter() - started:.2f}s"
+        )
+
+    def _precompile(self, move_type: MoveTypes):
+        gait = self._get_gait_factory(move_type)
+        # generators get a table too once their cached cycle takes over
+        if gait.indexed or gait.transient is not None:
+            _gait_servo_table(gait)
+        self.gaits_ready[move_type] = True
 
     def set_arc_pivot_ratio(self, value: float):
         """Update ArcTurn's ICR live. If an arc turn is already running, rebuild
         the gait in place so the slider sweeps spin <-> arc without stopping."""
         self.arc_pivot_ratio = float(value)
+        # the new ratio is a new cache key
+        self.gaits_ready[MoveTypes.ARC_TURN_LT] = self.gaits_ready[MoveTypes.ARC_TURN_RT] = False
         if self.moving and self.move_type in (MoveTypes.ARC_TURN_LT, MoveTypes.ARC_TURN_RT):
-            self.gait = self._get_gait_factory(self.move_type)
+            self._switch_gait(self._get_gait_factory(self.move_type))
         return {"arc_pivot_ratio": self.arc_pivot_ratio}
 
     def process_move(self, move_type: MoveTypes):
@@ -226,12 +525,29 @@ class Controller(Node):
 
         gait = self._get_gait_factory(move_type)
         if gait:
-            self.gait = gait
+            self._switch_gait(gait)
             self.move_type = move_type
             self.moving = True
 
         return {"moving": self.moving, "move_type": self.move_type}
     
+    def _switch_gait(self, gait: Gait):
+        """Make `gait` current, blending into it over settings.gait_transition_ticks
+        from the pose being held (or from the running gait, in phase, when the
+        two are compatible -- see GaitTransition)."""
+        ticks = settings.gait_transition_ticks
+        if ticks > 0:
+            previous = self.gait if self.moving else None
+            self.transition = GaitTransition(
+                gait, ticks, np.array(self.pose.positions, dtype=float), previous,
+                # mid-transition the running gait is not what is being sent
+                follow_previous=self.transition is None,
+            )
+        else:
+            self.transition = None
+        self.gait = gait
+        self.servo_table = None
+
     def set_pose(self, pose: str):
         """Set the robot to a named pose."""
         pose_map = {
@@ -253,14 +569,53 @@ class Controller(Node):
         self.set_targets(position)
         self.move_to_targets()
 
+    async def spin(self, frequency: float | None = None):
+        if settings.gait_warm:
+            self.warm_gait_cache()
+        # Servo responses are read natively on this loop from here on.
+        if _sc is not None:
+            if _sc.bus is not None:
+                _sc.bus.check(
+                    len(settings.servo_ids),
+                    frequency or self.frequency,
+                    settings.servo_telemetry_frequency,
+                    strict=settings.servo_bus_strict,
+                )
+            _sc.attach(asyncio.get_running_loop())
+            if settings.servo_telemetry_frequency > 0:
+                self._running = True
+                self._telemetry_task = asyncio.ensure_future(
+                    self.poll_telemetry(settings.servo_telemetry_frequency)
+                )
+        try:
+            await super(Controller, self).spin(frequency)
+        finally:
+            if self._telemetry_task is not None:
+                self._telemetry_task.cancel()
+                self._telemetry_task = None
+
     @staticmethod
     def voltage():
         return 0.0
 
     def spinner(self):
         if self.moving and self.gait is not None:
-            # Hot path: get next position and send to servos
-            # next() is already optimized in Gait class
-            position = next(self.gait)
-            # time=0 means immediate move, no interpolation delay
-            self.move_to(position, 0)
+            if self.transition is not None:
+                # Blending into a new gait; it is stepped inside the transition.
+                position = next(self.transition)
+                if self.transition.done:
+                    self.transition = None
+                self.move_to(position, 0)
+            elif self.gait.indexed:
+                # Hot path: the cycle is precompiled, so a tick is a table lookup
+                # and a serial write (time=0 -> immediate move, no interpolation).
+                table = self._servo_table()
+                index = self.gait.index
+                next(self.gait)
+                self.move_to_index(table, index)
+            else:
+                # Generator gaits compute each frame on the fly.
+                position = next(self.gait)
+                self.move_to(position, 0)
+            # Only the loop thread sets this (move_to may also run on the UI thread).
+            self._move_sent.set()
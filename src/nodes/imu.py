@@ -1,7 +1,28 @@
+"""
+BNO055 IMU node.
+
+Read through the driver properties, euler + acceleration + gyro is six I2C
+transactions and takes 70-350 ms on the Pi, far longer than a control tick;
+with `imu.burst_read` the whole data block comes back in one (src/nodes/bno055.py).
+With
+`imu.threaded` on, a daemon thread samples the sensor at `imu.sample_frequency`
+and drops each reading into a single latest-value slot (`imu_data`): a new,
+never-mutated IMUData is built and the attribute rebound, which is atomic, so
+readers on any thread just take whatever is there without locking or waiting
+on the bus. The node's spinner only republishes the newest sample on
+`Topics.raw_imu` from the event loop, so subscribers keep running on the loop
+thread and the control loop never touches I2C.
+"""
+
 import atexit
+import threading
+import time
 import numpy as np
 from settings import settings
+from src.nodes.bno055 import BurstReader
+from src.nodes.imu_history import IMUHistory
 from src.nodes.node import Node
+from src.nodes.timing import LatencyHistogram
 from src.signals import Topics
 from dataclasses import dataclass, field
 
@@ -18,6 +39,9 @@ class IMUData:
     euler: np.ndarray = field(default_factory=lambda: np.zeros(3))
     acceleration: np.ndarray = field(default_factory=lambda: np.zeros(3))
     gyro: np.ndarray = field(default_factory=lambda: np.zeros(3))
+    # time.monotonic() when the read completed, and a running sample count
+    timestamp: float = 0.0
+    sequence: int = 0
 
     @property
     def heading(self) -> float:
@@ -62,7 +86,20 @@ class IMU(Node):
         self.sensor = adafruit_bno055.BNO055_I2C(board.I2C())
         self.sensor.mode = IMUMode.NDOF_MODE
         self.imu_data = IMUData()
-        
+        self.threaded = kwargs.get('threaded', settings.imu_threaded)
+        self.sample_frequency = kwargs.get('sample_frequency', settings.imu_sample_frequency)
+        # Last imu.history_seconds of samples, for windowed queries
+        self.history = IMUHistory(
+            kwargs.get('history_seconds', settings.imu_history_seconds),
+            max(self.sample_frequency, self.frequency),
+        )
+        # Time spent in the I2C reads, and how many reads raised
+        self.read_time = LatencyHistogram()
+        self.read_errors = 0
+        self._published = 0
+        self._sampling = False
+        self._sampler: threading.Thread | None = None
+
         if settings.bno_axis_remap:
             self.sensor.axis_remap = settings.bno_axis_remap
 
@@ -75,27 +112,72 @@ class IMU(Node):
         if settings.imu_acceleration_offsets:
             self.sensor.offsets_accelerometer = tuple(settings.imu_acceleration_offsets)
 
+        # One-transaction reads of the whole data block when the sensor is on I2C
+        self.reader = BurstReader.for_sensor(self.sensor) if settings.imu_burst_read else None
+
         self.read_measurements()
 
+        if self.threaded:
+            self.start_sampler()
+
         atexit.register(self.shutdown)
 
-    
-    def read_measurements(self):
+    def shutdown(self):
+        self.stop_sampler()
+
+    def start_sampler(self):
+        if self._sampling:
+            return
+        self._sampling = True
+        self._sampler = threading.Thread(target=self._sample_loop, name='imu-sampler', daemon=True)
+        self._sampler.start()
+
+    def stop_sampler(self, timeout=1.0):
+        self._sampling = False
+        if self._sampler is not None:
+            self._sampler.join(timeout)
+            self._sampler = None
+
+    def _sample_loop(self):
+        period = 1 / self.sample_frequency
+        deadline = time.monotonic()
+        while self._sampling:
+            self.sample()
+            deadline += period
+            delay = deadline - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                # the bus is slower than the sample rate: go again straight away
+                deadline = time.monotonic()
+
+    def sample(self) -> IMUData | None:
+        """Read the sensor into the latest-value slot. Blocks on I2C."""
         try:
-            # Only read euler (orientation) - most important for balance
-            # Reading all 7 sensors takes 70-350ms and blocks GIL during gaits
-            euler = np.round(np.array(self.sensor.euler),3)
-            acceleration = np.round(np.array(self.sensor.acceleration),3)
-            gyro = np.round(np.array(self.sensor.gyro),3)
-
+            start = time.perf_counter()
+            if self.reader is not None:
+                euler, acceleration, gyro = self.reader.read()
+            else:
+                # Per-property reads: a transaction each (plus a mode check)
+                # Reading all 7 sensors takes 70-350ms, so keep it to three
+                euler = np.array(self.sensor.euler)
+                acceleration = np.array(self.sensor.acceleration)
+                gyro = np.array(self.sensor.gyro)
+            euler = np.round(euler,3)
+            acceleration = np.round(acceleration,3)
+            gyro = np.round(gyro,3)
+            self.read_time.record(time.perf_counter() - start)
+
+            timestamp = time.monotonic()
+            self.history.append(timestamp, euler, acceleration, gyro)
             self.imu_data = IMUData(
                 euler=euler,
                 acceleration=acceleration,
-                gyro=gyro
+                gyro=gyro,
+                timestamp=timestamp,
+                sequence=self.imu_data.sequence + 1,
             )
 
-            Topics.raw_imu.send("imu", payload=self.imu_data)
-
             # Uncomment these only if actively needed (slows down gaits)
             #
             #self.magnetic = np.round(np.array(self.sensor.magnetic),3)
@@ -103,8 +185,42 @@ class IMU(Node):
             #self.linear_acceleration = np.round(np.array(self.sensor.linear_acceleration),3)
             #self.gravity = np.round(np.array(self.sensor.gravity),3)
 
+            return self.imu_data
+
         except Exception as e:
+            self.read_errors += 1
             self.logger.warning(f"could not read imu {e.__str__()}")
+            return None
+
+    def latest_euler(self, seconds: float) -> np.ndarray:
+        """Mean euler over the last `seconds`, for callers that block the event
+        loop (Robot.level). Without the sampler thread nothing else reads the
+        sensor while they wait, so a fresh sample goes into the window first. If
+        the window is still empty, the latest sample."""
+        if not self._sampling:
+            self.sample()
+        euler = self.history.mean('euler', seconds)
+        return self.imu_data.euler if np.isnan(euler).any() else euler
+
+    def read_measurements(self):
+        """Synchronous read and publish (the unthreaded path)."""
+        if self.sample() is not None:
+            self.publish()
+
+    def publish(self):
+        """Send the latest sample on raw_imu if it has not been sent yet."""
+        data = self.imu_data
+        if data.sequence != self._published:
+            self._published = data.sequence
+            Topics.raw_imu.send("imu", payload=data)
+
+    @property
+    def age(self) -> float:
+        """Seconds since the latest sample was taken."""
+        return time.monotonic() - self.imu_data.timestamp
 
     def spinner(self):
-        self.read_measurements()
+        if self.threaded:
+            self.publish()
+        else:
+            self.read_measurements()
@@ -0,0 +1,111 @@
+"""
+Timestamped ring buffer of IMU samples.
+
+One preallocated float64 array holds the last `seconds` of samples, one row per
+sample: [timestamp, euler(3), acceleration(3), gyro(3)]. The sampler appends a
+row per read; readers ask for windows ("the last 200 ms", "everything since t")
+and get a chronological copy, so leveling and stability logic can average over
+a window instead of trusting one noisy read.
+
+Timestamps are time.monotonic() seconds and strictly increase, so window
+lookups are a binary search on the time column.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+
+import numpy as np
+
+TIME = 0
+EULER = slice(1, 4)
+ACCELERATION = slice(4, 7)
+GYRO = slice(7, 10)
+WIDTH = 10
+
+FIELDS = {
+    'euler': EULER,
+    'acceleration': ACCELERATION,
+    'gyro': GYRO,
+}
+
+
+class IMUHistory:
+    """Fixed-capacity ring buffer of the last `seconds` of IMU samples."""
+
+    def __init__(self, seconds: float, sample_frequency: float, clock=time.monotonic):
+        self.seconds = seconds
+        # time source for `now` in window queries (replay swaps in its own clock)
+        self.clock = clock
+        self.capacity = max(1, math.ceil(seconds * sample_frequency)) + 1
+        self._data = np.zeros((self.capacity, WIDTH))
+        # index of the next row to write, and how many rows are valid
+        self._head = 0
+        self._size = 0
+        # one writer (the sampler) and readers on other threads; the lock is
+        # only held for a row write or a window copy
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, timestamp: float, euler, acceleration, gyro):
+        with self._lock:
+            row = self._data[self._head]
+            row[TIME] = timestamp
+            row[EULER] = euler
+            row[ACCELERATION] = acceleration
+            row[GYRO] = gyro
+            self._head = (self._head + 1) % self.capacity
+            if self._size < self.capacity:
+                self._size += 1
+
+    def clear(self):
+        with self._lock:
+            self._head = 0
+            self._size = 0
+
+    def _ordered_indices(self) -> np.ndarray:
+        start = (self._head - self._size) % self.capacity
+        return (start + np.arange(self._size)) % self.capacity
+
+    def since(self, t: float) -> np.ndarray:
+        """Rows with timestamp > t, oldest first, shape (n, WIDTH)."""
+        with self._lock:
+            indices = self._ordered_indices()
+            times = self._data[indices, TIME]
+            first = np.searchsorted(times, t, side='right')
+            return self._data[indices[first:]]
+
+    def window(self, seconds: float, now: float | None = None) -> np.ndarray:
+        """Rows from the last `seconds` before `now` (default: the clock)."""
+        now = self.clock() if now is None else now
+        with self._lock:
+            indices = self._ordered_indices()
+            times = self._data[indices, TIME]
+            first = np.searchsorted(times, now - seconds, side='left')
+            last = np.searchsorted(times, now, side='right')
+            return self._data[indices[first:last]]
+
+    def latest(self) -> np.ndarray | None:
+        with self._lock:
+            if not self._size:
+                return None
+            return self._data[(self._head - 1) % self.capacity].copy()
+
+    def mean(self, field: str, seconds: float, now: float | None = None) -> np.ndarray:
+        """Mean of `field` ('euler', 'acceleration' or 'gyro') over the last
+        `seconds`; NaNs if the window is empty. Heading wraps at 360, so its
+        mean is only meaningful away from north."""
+        rows = self.window(seconds, now)
+        if not len(rows):
+            return np.full(3, np.nan)
+        return rows[:, FIELDS[field]].mean(axis=0)
+
+    def std(self, field: str, seconds: float, now: float | None = None) -> np.ndarray:
+        rows = self.window(seconds, now)
+        if not len(rows):
+            return np.full(3, np.nan)
+        return rows[:, FIELDS[field]].std(axis=0)
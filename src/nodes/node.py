@@ -1,19 +1,43 @@
 import atexit
 import logging
+import time
 from abc import abstractmethod, ABC
 import asyncio
+from enum import Enum
+
+from settings import settings
+from src.nodes.timing import LoopStats
+
+
+class OverrunPolicy(str, Enum):
+    """What spin does when a tick's spinner runs past the next deadline.
+
+    SKIP     -- drop the missed ticks and realign to the next future deadline
+                (the right thing for sensors: a stale read is worthless).
+    CATCH_UP -- run the missed ticks back to back so the tick count keeps pace
+                with wall time (gait frames are time-based, so this keeps gait
+                speed independent of load), up to `max_catch_up` ticks behind;
+                beyond that, resync like SKIP.
+    """
+    SKIP = "skip"
+    CATCH_UP = "catch_up"
+
 
 class Node(ABC):
     logger = logging.getLogger('VEGA')
+    overrun_policy: OverrunPolicy = OverrunPolicy.SKIP
+    max_catch_up: int = 3
 
     def __init__(self, **kwargs):
         self.frequency = kwargs.get('frequency', 10)
+        self.overrun_policy = OverrunPolicy(kwargs.get('overrun_policy', self.overrun_policy))
         self.logger.info("*" * 50 + "\n")
         self.logger.info(f"*\tStarting {self.__class__.__name__} Node @ {self.frequency}Hz\n")
         self.logger.info("*" * 50 + "\n")
         self._thread = None
         self._running = False
-        
+        self.loop_stats = LoopStats()
+
         atexit.register(self._shutdown)
 
     def loaded(self):
@@ -30,13 +54,70 @@ class Node(ABC):
         pass
 
     async def spin(self, frequency: float | None = None):
+        """Run spinner at a fixed rate against absolute deadlines.
+
+        Each tick is scheduled at start + n * period on the loop clock, so the
+        rate does not drift with spinner time or event-loop latency. Overruns are
+        handled per `overrun_policy`.
+        """
         self.frequency = frequency or self.frequency or 10
         self._running = True
         self.logger.info(f"*\t{self.__class__.__name__} is spinning at {self.frequency} Hz")
 
+        loop = asyncio.get_running_loop()
+        period = 1 / self.frequency
+        stats = self.loop_stats
+        deadline = loop.time()
+        log_interval = settings.timing_log_interval
+        next_log = deadline + log_interval if log_interval else None
+
         while self._running:
+            stats.record_tick(max(0.0, loop.time() - deadline))
+            started = time.perf_counter()
             self.spinner()
-            await asyncio.sleep(1/self.frequency)
+            stats.record_duration(time.perf_counter() - started)
+            deadline += period
+
+            if next_log is not None and deadline >= next_log:
+                next_log += log_interval
+                self.log_timing()
+
+            behind = loop.time() - deadline
+            if behind < 0:
+                await asyncio.sleep(-behind)
+                continue
+
+            stats.overruns += 1
+            missed = int(behind / period) + 1
+            if self.overrun_policy == OverrunPolicy.SKIP or missed > self.max_catch_up:
+                # realign to the next deadline still in the future
+                stats.skipped += missed
+                deadline += missed * period
+                await asyncio.sleep(deadline - loop.time())
+            else:
+                # run the late tick now; yield so other nodes still get a turn
+                await asyncio.sleep(0)
+
+    def timing_summary(self) -> dict:
+        """Spin-loop timing: tick/overrun/skip counts and spinner duration and
+        jitter distributions (ms)."""
+        return {
+            'node': self.__class__.__name__,
+            'frequency': self.frequency,
+            **self.loop_stats.summary(1 / self.frequency if self.frequency else None),
+        }
+
+    def log_timing(self):
+        summary = self.timing_summary()
+        duration, jitter = summary['duration_ms'], summary['jitter_ms']
+        self.logger.info(
+            f"{summary['node']} timing: {summary['ticks']} ticks, "
+            f"{summary['overruns']} overruns, {summary['skipped']} skipped | "
+            f"spinner p50 {duration['p50']:.2f} p99 {duration['p99']:.2f} "
+            f"max {duration['max']:.2f} ms | "
+            f"jitter p50 {jitter['p50']:.2f} p99 {jitter['p99']:.2f} "
+            f"max {jitter['max']:.2f} ms"
+        )
 
     def spin_once(self):
         self.spinner()
@@ -44,4 +125,4 @@ class Node(ABC):
     def _shutdown(self):
         self.logger.info(f'{self.__class__.__name__} shutting down')
         self.shutdown()
-        
+
@@ -10,6 +10,9 @@ from src.nodes.controller import Controller
 from src.nodes.imu import IMU, IMUData
 from src.nodes.node import Node
 
+# Seconds of IMU history averaged per leveling read
+_LEVEL_WINDOW = 0.2
+
 
 def _array_to_dict(ar, label: str = "Leg"):
     return {
@@ -20,7 +23,7 @@ def _array_to_dict(ar, label: str = "Leg"):
 
 @dataclass
 class RobotData:
-    imu: IMUData = IMUData()
+    imu: IMUData = field(default_factory=IMUData)
     positions: dict = field(default_factory=lambda: _array_to_dict(Pose().positions))
     angles: dict = field(
         default_factory=lambda: _array_to_dict(Pose().angles_in_degrees)
@@ -44,6 +47,8 @@ class Robot(Node):
         self.pitch_offsets: np.ndarray = np.zeros((4, 3))
         self.controller = controller
         self.imu = imu
+        # Blocking waits in level(); replay substitutes a simulated clock's sleep
+        self.sleep = kwargs.get('sleep', time.sleep)
 
         self.loaded()
 
@@ -110,13 +115,15 @@ class Robot(Node):
         try:
             self.trot_in_place()
             self.ready(100)
-            time.sleep(0.2)
+            self.sleep(0.2)
 
             # Offset adjustment arrays for roll correction
             roll_array = np.array([1, -1, -1, 1])
 
             for _ in range(10):
-                _, roll, pitch = self.imu.sensor.euler
+                # average the settled window rather than one noisy read (this
+                # blocks the loop, so an unthreaded IMU is sampled here first)
+                _, roll, pitch = self.imu.latest_euler(_LEVEL_WINDOW)
                 self.logger.debug(f"roll: {roll:.2f}, pitch: {pitch:.2f}")
 
                 if roll is not None and abs(roll) > settings.roll_threshold:
@@ -128,7 +135,7 @@ class Robot(Node):
                     return True
 
                 self.ready(10)
-                time.sleep(0.3)
+                self.sleep(0.3)
 
         except Exception as ex:
             self.ready(200)
@@ -0,0 +1,134 @@
+"""
+Loop timing instrumentation for nodes.
+
+`LatencyHistogram` is a fixed-size, HDR-style log-linear histogram over integer
+microseconds: exact below 32 us, then 16 sub-buckets per power of two (~6%
+relative precision) up to ~70 minutes, in a flat list of counts. Recording is
+a bit_length and two integer ops -- a few hundred nanoseconds, far under 1% of
+a 20 ms tick -- and nothing is allocated after construction.
+
+`LoopStats` holds one node's spin-loop numbers: tick / overrun / skip counters,
+and histograms of spinner duration and tick-start jitter.
+"""
+
+from __future__ import annotations
+
+_SUB_BITS = 4
+_SUB = 1 << _SUB_BITS            # sub-buckets per power of two
+_LINEAR = 2 * _SUB               # values below this get an exact bucket
+_MAX_EXPONENT = 28               # top bucket covers ~2**32 us
+_NUM_BUCKETS = (_MAX_EXPONENT + 2) * _SUB
+
+
+def _bucket(value: int) -> int:
+    if value < _LINEAR:
+        return value if value > 0 else 0
+    exponent = value.bit_length() - (_SUB_BITS + 1)
+    if exponent > _MAX_EXPONENT:
+        return _NUM_BUCKETS - 1
+    return (exponent + 1) * _SUB + (value >> exponent) - _SUB
+
+
+def _bucket_high(index: int) -> int:
+    """Largest value (us) that lands in bucket `index`."""
+    if index < _LINEAR:
+        return index
+    exponent = index // _SUB - 1
+    mantissa = index % _SUB + _SUB
+    return ((mantissa + 1) << exponent) - 1
+
+
+class LatencyHistogram:
+    """Fixed-size log-linear histogram of durations, recorded in seconds and
+    bucketed in integer microseconds."""
+
+    def __init__(self):
+        self.counts = [0] * _NUM_BUCKETS
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float):
+        self.counts[_bucket(int(seconds * 1e6))] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def reset(self):
+        self.counts = [0] * _NUM_BUCKETS
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, pct: float) -> float:
+        """Upper bound (seconds) of the bucket holding the pct-th percentile."""
+        if not self.count:
+            return 0.0
+        rank = max(1, int(round(pct / 100.0 * self.count)))
+        seen = 0
+        for index, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                return min(_bucket_high(index) / 1e6, self.max)
+        return self.max
+
+    def summary(self, scale: float = 1e3) -> dict:
+        """Mean, p50/p90/p99 and max, in milliseconds by default."""
+        return {
+            'count': self.count,
+            'mean': self.mean * scale,
+            'p50': self.percentile(50) * scale,
+            'p90': self.percentile(90) * scale,
+            'p99': self.percentile(99) * scale,
+            'max': self.max * scale,
+        }
+
+
+class LoopStats:
+    """Scheduling statistics for one node's spin loop (seconds).
+
+    jitter is how late each tick started relative to its absolute deadline;
+    duration is how long spinner() ran.
+    """
+
+    def __init__(self):
+        self.ticks = 0
+        self.overruns = 0
+        self.skipped = 0
+        self.jitter_last = 0.0
+        self.jitter = LatencyHistogram()
+        self.duration = LatencyHistogram()
+
+    @property
+    def jitter_max(self) -> float:
+        return self.jitter.max
+
+    @property
+    def jitter_mean(self) -> float:
+        return self.jitter.mean
+
+    def record_tick(self, jitter: float):
+        self.ticks += 1
+        self.jitter_last = jitter
+        self.jitter.record(jitter)
+
+    def record_duration(self, seconds: float):
+        self.duration.record(seconds)
+
+    def summary(self, period: float | None = None) -> dict:
+        data = {
+            'ticks': self.ticks,
+            'overruns': self.overruns,
+            'skipped': self.skipped,
+            'duration_ms': self.duration.summary(),
+            'jitter_ms': self.jitter.summary(),
+        }
+        if period:
+            # share of the tick budget spinner() used on average
+            data['budget_used'] = self.duration.mean / period
+        return data
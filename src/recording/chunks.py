@@ -0,0 +1,130 @@
+"""
+Append-only chunked record files.
+
+A `ChunkWriter` appends fixed-size records for one topic into preallocated,
+memory-mapped chunk files (`<topic>.<n>.bin`), rolling over to a new chunk when
+one fills. Appending is a row assignment into the map -- no syscalls, no
+allocation beyond the record tuple -- except on rollover, which calls the
+writer's `on_roll` (the recorder rewrites the index there). The last chunk is truncated to its written
+length on close, so a finished chunk is exactly count * itemsize bytes.
+
+The session index (`index.json`) lists each topic's dtype and chunks with their
+record counts and time span. It is rewritten atomically on every rollover and
+flush; if the process dies, the open chunk is marked `open` and the reader
+recovers its records by trimming the unwritten (t == 0) tail.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from typing import Callable
+
+import numpy as np
+
+INDEX_FILE = 'index.json'
+INDEX_VERSION = 1
+
+
+def dtype_to_json(dtype: np.dtype) -> list:
+    return [list(field) for field in dtype.descr]
+
+
+def dtype_from_json(descr: list) -> np.dtype:
+    fields = []
+    for field in descr:
+        name, fmt, *shape = field
+        fields.append((name, fmt, tuple(shape[0])) if shape else (name, fmt))
+    return np.dtype(fields)
+
+
+def write_index(directory: str, index: dict):
+    path = os.path.join(directory, INDEX_FILE)
+    tmp = path + '.tmp'
+    with open(tmp, 'w') as f:
+        json.dump(index, f, indent=1)
+    os.replace(tmp, path)
+
+
+def read_index(directory: str) -> dict:
+    with open(os.path.join(directory, INDEX_FILE)) as f:
+        return json.load(f)
+
+
+class ChunkWriter:
+    """Appends records of one dtype to a sequence of memory-mapped chunk files."""
+
+    def __init__(self, directory: str, topic: str, dtype: np.dtype, chunk_size: int,
+                 on_roll: Callable[[], None] | None = None):
+        self.directory = directory
+        self.topic = topic
+        self.dtype = dtype
+        self.chunk_records = max(1, chunk_size // dtype.itemsize)
+        self.chunks: list[dict] = []
+        self.records = 0
+        self._map: np.memmap | None = None
+        self._row = 0
+        self._lock = threading.Lock()
+        # called after a new chunk is opened, outside the lock (it may describe())
+        self.on_roll = on_roll
+
+    def append(self, record: tuple):
+        with self._lock:
+            rolled = self._map is None or self._row == self.chunk_records
+            if rolled:
+                self._roll()
+            self._map[self._row] = record
+            self._row += 1
+            self.records += 1
+        if rolled and self.on_roll is not None:
+            self.on_roll()
+
+    def _roll(self):
+        self._close_chunk(truncate=False)
+        name = f"{self.topic}.{len(self.chunks):05d}.bin"
+        self._map = np.memmap(
+            os.path.join(self.directory, name), dtype=self.dtype, mode='w+',
+            shape=(self.chunk_records,),
+        )
+        self._row = 0
+        self.chunks.append({'file': name, 'count': 0, 'open': True})
+
+    def _close_chunk(self, truncate: bool):
+        if self._map is None:
+            return
+        self._update_current()
+        self.chunks[-1]['open'] = False
+        self._map.flush()
+        # dropping the last reference unmaps the file
+        self._map = None
+        if truncate:
+            path = os.path.join(self.directory, self.chunks[-1]['file'])
+            os.truncate(path, self._row * self.dtype.itemsize)
+
+    def _update_current(self):
+        chunk = self.chunks[-1]
+        chunk['count'] = self._row
+        if self._row:
+            chunk['t_first'] = float(self._map['t'][0])
+            chunk['t_last'] = float(self._map['t'][self._row - 1])
+
+    def flush(self):
+        with self._lock:
+            if self._map is not None:
+                self._update_current()
+                self._map.flush()
+
+    def close(self):
+        with self._lock:
+            self._close_chunk(truncate=True)
+
+    def describe(self) -> dict:
+        with self._lock:
+            return {
+                'dtype': dtype_to_json(self.dtype),
+                'itemsize': self.dtype.itemsize,
+                'chunk_records': self.chunk_records,
+                'records': self.records,
+                'chunks': [dict(chunk) for chunk in self.chunks],
+            }
@@ -0,0 +1,60 @@
+"""
+Loads recorded sessions into NumPy.
+
+`load_session` reads every chunk of every topic into one structured array per
+topic, sized from the index up front, so a session comes back in one call with
+one allocation per topic. Chunks left open by a crash are recovered by dropping
+their unwritten (t == 0) tail.
+"""
+
+from __future__ import annotations
+
+import os
+
+import numpy as np
+
+from src.recording.chunks import INDEX_FILE, dtype_from_json, read_index
+
+
+def list_sessions(path: str) -> list[str]:
+    """Session directories under `path`, oldest first."""
+    if not os.path.isdir(path):
+        return []
+    return sorted(
+        name for name in os.listdir(path)
+        if os.path.isfile(os.path.join(path, name, INDEX_FILE))
+    )
+
+
+def _read_chunk(directory: str, chunk: dict, dtype: np.dtype) -> np.ndarray:
+    data = np.fromfile(os.path.join(directory, chunk['file']), dtype=dtype)
+    if not chunk.get('open'):
+        return data[:chunk['count']]
+    # preallocated tail of a chunk that was never closed: t is still zero
+    written = np.flatnonzero(data['t'])
+    return data[:written[-1] + 1] if len(written) else data[:0]
+
+
+def load_topic(directory: str, topic: str, index: dict | None = None) -> np.ndarray:
+    index = index or read_index(directory)
+    meta = index['topics'][topic]
+    dtype = dtype_from_json(meta['dtype'])
+    chunks = meta['chunks']
+    closed = sum(chunk['count'] for chunk in chunks if not chunk.get('open'))
+    if not any(chunk.get('open') for chunk in chunks):
+        out = np.empty(closed, dtype=dtype)
+        offset = 0
+        for chunk in chunks:
+            with open(os.path.join(directory, chunk['file']), 'rb') as f:
+                f.readinto(out[offset:offset + chunk['count']])
+            offset += chunk['count']
+        return out
+    parts = [_read_chunk(directory, chunk, dtype) for chunk in chunks]
+    return np.concatenate(parts) if parts else np.empty(0, dtype=dtype)
+
+
+def load_session(directory: str, topics=None) -> dict[str, np.ndarray]:
+    """{topic: structured array of its records in time order}."""
+    index = read_index(directory)
+    topics = topics or list(index['topics'])
+    return {topic: load_topic(directory, topic, index) for topic in topics}
@@ -0,0 +1,123 @@
+"""
+Flight recorder: logs topic traffic to a session directory of chunked binary
+record files (see chunks.py for the layout and records.py for the formats).
+
+The recorder subscribes to raw_imu, raw_pose (which carries the servo command
+with the pose), obstacles and servo_telemetry. Each send becomes one fixed-size
+record written straight into a memory map from the publisher's thread, which
+costs a few microseconds -- cheap enough to leave on. As a node it spins
+slowly to flush the maps and rewrite the index, so a crash loses at most one
+flush interval of index bookkeeping and no records. The index is also rewritten
+whenever a topic opens a new chunk, so a chunk is never missing from it.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+
+from src.nodes.node import Node
+from src.recording import records
+from src.recording.chunks import ChunkWriter, INDEX_VERSION, write_index
+from src.signals import Topics
+
+
+def _obstacle_counts(obstacles: dict) -> tuple:
+    return tuple(obstacles.get(region, 0) for region in records.OBSTACLE_REGIONS)
+
+
+class FlightRecorder(Node):
+
+    def __init__(self, path: str, session: str | None = None, chunk_size: int = 4 << 20, **kwargs):
+        kwargs.setdefault('frequency', 1)
+        super(FlightRecorder, self).__init__(**kwargs)
+        self.session = session or time.strftime('%Y%m%d-%H%M%S')
+        self.directory = os.path.join(path, self.session)
+        self.chunk_size = chunk_size
+        self.writers: dict[str, ChunkWriter] = {}
+        self.started = None
+        self.recording = False
+        # the index is rewritten from publisher threads (rollover) and the spinner
+        self._index_lock = threading.Lock()
+
+    def start(self):
+        if self.recording:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        self.writers = {
+            topic: ChunkWriter(self.directory, topic, dtype, self.chunk_size, on_roll=self.write_index)
+            for topic, dtype in records.RECORD_TYPES.items()
+        }
+        self.started = {'wall': time.time(), 'monotonic': time.monotonic()}
+        Topics.raw_imu.connect(self.on_imu)
+        Topics.raw_pose.connect(self.on_pose)
+        Topics.obstacles.connect(self.on_obstacles)
+        Topics.servo_telemetry.connect(self.on_servo_telemetry)
+        self.recording = True
+        self.write_index()
+        self.logger.info(f"Recording session {self.session} to {self.directory}")
+
+    def stop(self):
+        if not self.recording:
+            return
+        self.recording = False
+        Topics.raw_imu.disconnect(self.on_imu)
+        Topics.raw_pose.disconnect(self.on_pose)
+        Topics.obstacles.disconnect(self.on_obstacles)
+        Topics.servo_telemetry.disconnect(self.on_servo_telemetry)
+        for writer in self.writers.values():
+            writer.close()
+        self.write_index()
+        self.logger.info(f"Recorded {self.records} records in session {self.session}")
+
+    @property
+    def records(self) -> int:
+        return sum(writer.records for writer in self.writers.values())
+
+    def flush(self):
+        for writer in self.writers.values():
+            writer.flush()
+        self.write_index()
+
+    def write_index(self):
+        with self._index_lock:
+            write_index(self.directory, {
+                'version': INDEX_VERSION,
+                'session': self.session,
+                'started': self.started,
+                'topics': {topic: writer.describe() for topic, writer in self.writers.items()},
+            })
+
+    # --- topic handlers -------------------------------------------------------
+
+    def on_imu(self, sender, payload):
+        self.writers['imu'].append((
+            time.monotonic(), payload.sequence, payload.euler, payload.acceleration, payload.gyro,
+        ))
+
+    def on_pose(self, sender, payload):
+        cmd = payload.cmd
+        self.writers['pose'].append((
+            time.monotonic(),
+            payload.positions,
+            payload.angles,
+            tuple(cmd.values()) if cmd else 0,
+        ))
+
+    def on_obstacles(self, sender, payload):
+        self.writers['obstacles'].append((time.monotonic(), _obstacle_counts(payload)))
+
+    def on_servo_telemetry(self, sender, payload):
+        self.writers['servo_telemetry'].append((
+            time.monotonic(), payload.servo_positions, payload.tracking_error,
+        ))
+
+    # --- node ------------------------------------------------------------------
+
+    def spinner(self):
+        if self.recording:
+            self.flush()
+
+    def shutdown(self):
+        self.stop()
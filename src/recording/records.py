@@ -0,0 +1,52 @@
+"""
+On-disk record formats for the flight recorder.
+
+Every topic gets one fixed-size NumPy structured dtype, so a chunk file is a
+bare array of records: no framing, no per-record header, memory-mappable as-is
+and loadable with np.fromfile. The first field is always `t`, the
+time.monotonic() at which the record was taken; a zero `t` marks a row that was
+preallocated but never written.
+"""
+
+import numpy as np
+
+# Region order for the obstacles counts (YoloAgent.handle_results keys)
+OBSTACLE_REGIONS = (
+    'upper_left', 'upper_center', 'upper_right',
+    'lower_left', 'lower_center', 'lower_right',
+)
+
+IMU = np.dtype([
+    ('t', '<f8'),
+    ('sequence', '<u4'),
+    ('euler', '<f4', (3,)),
+    ('acceleration', '<f4', (3,)),
+    ('gyro', '<f4', (3,)),
+])
+
+# Commanded pose; cmd is the servo command for each servo in
+# settings.servo_ids order (the order Controller builds pose.cmd in).
+POSE = np.dtype([
+    ('t', '<f8'),
+    ('positions', '<f4', (4, 3)),
+    ('angles', '<f4', (4, 3)),
+    ('cmd', '<i2', (12,)),
+])
+
+OBSTACLES = np.dtype([
+    ('t', '<f8'),
+    ('counts', '<u2', (len(OBSTACLE_REGIONS),)),
+])
+
+SERVO_TELEMETRY = np.dtype([
+    ('t', '<f8'),
+    ('servo_positions', '<f4', (4, 3)),
+    ('tracking_error', '<f4', (4, 3)),
+])
+
+RECORD_TYPES = {
+    'imu': IMU,
+    'pose': POSE,
+    'obstacles': OBSTACLES,
+    'servo_telemetry': SERVO_TELEMETRY,
+}
@@ -0,0 +1,272 @@
+"""
+Deterministic replay of recorded sessions through the control stack.
+
+A `Replay` builds a Controller, Navigator and Robot exactly as app.py does, but
+with the servo port swapped for a `CapturingSerial` and the IMU node swapped for
+a `ReplayIMU` fed from the recording. Recorded raw_imu and obstacles messages
+are re-published on their topics at their recorded times, and the nodes'
+spinners are ticked at their rates, all on one simulated clock: events and
+ticks are merged in time order (events first on ties), so the same session
+always produces the same servo byte stream. `realtime=True` paces the clock
+to the wall; otherwise it runs as fast as the stack can go, which makes it a
+whole-stack benchmark. Robot.level runs against the same clock through its
+injectable sleep.
+
+    python -m src.recording.replay recordings/<session> [--realtime] [--level]
+"""
+
+from __future__ import annotations
+
+import argparse
+import atexit
+import hashlib
+import json
+import time
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from settings import settings
+from src.mock.servo_serial import CapturingSerial
+from src.model.types import MoveTypes
+from src.motion.servo_controller import ServoController
+from src.nodes import controller as controller_module
+from src.nodes.controller import Controller
+from src.nodes.imu import IMUData
+from src.nodes.imu_history import IMUHistory
+from src.nodes.navigator import Navigator
+from src.nodes.robot import Robot
+from src.nodes.timing import LoopStats
+from src.recording.reader import load_session
+from src.recording.records import IMU, OBSTACLES, OBSTACLE_REGIONS
+from src.signals import Topics
+
+_IMU, _OBSTACLES = 0, 1
+
+
+class ReplayClock:
+    def __init__(self, start: float = 0.0):
+        self.now = start
+
+    def time(self) -> float:
+        return self.now
+
+
+class ReplayIMU:
+    """Stands in for the IMU node: recorded samples land in `imu_data` and
+    `history` (on the replay clock) and go out on raw_imu."""
+
+    def __init__(self, clock: ReplayClock, sample_frequency: float):
+        self.imu_data = IMUData()
+        self.history = IMUHistory(settings.imu_history_seconds, sample_frequency, clock=clock.time)
+
+    def feed(self, record):
+        euler = record['euler'].astype(float)
+        acceleration = record['acceleration'].astype(float)
+        gyro = record['gyro'].astype(float)
+        self.history.append(record['t'], euler, acceleration, gyro)
+        self.imu_data = IMUData(
+            euler=euler, acceleration=acceleration, gyro=gyro,
+            timestamp=float(record['t']), sequence=int(record['sequence']),
+        )
+        Topics.raw_imu.send("imu", payload=self.imu_data)
+
+    def latest_euler(self, seconds: float) -> np.ndarray:
+        euler = self.history.mean('euler', seconds)
+        return self.imu_data.euler if np.isnan(euler).any() else euler
+
+
+@dataclass
+class ReplayResult:
+    duration: float                                   # simulated seconds
+    wall_time: float                                  # seconds it took
+    writes: list = field(default_factory=list)        # (t, bytes) sent to the servos
+    moves: list = field(default_factory=list)         # (t, MoveTypes) on each change
+    ticks: dict = field(default_factory=dict)
+    timing: dict = field(default_factory=dict)        # LoopStats summaries per node
+    events: int = 0
+    level: bool | None = None
+
+    def digest(self) -> str:
+        """Hash of the servo byte stream and its timing, for regression checks."""
+        h = hashlib.sha256()
+        for t, data in self.writes:
+            h.update(f"{t:.6f}".encode())
+            h.update(data)
+        return h.hexdigest()
+
+    def summary(self) -> dict:
+        return {
+            'duration': self.duration,
+            'wall_time': self.wall_time,
+            'speedup': self.duration / self.wall_time if self.wall_time else None,
+            'events': self.events,
+            'writes': len(self.writes),
+            'moves': [(round(t, 6), move.value) for t, move in self.moves],
+            'ticks': self.ticks,
+            'timing': self.timing,
+            'level': self.level,
+            'digest': self.digest(),
+        }
+
+
+class _Ticker:
+    def __init__(self, node, frequency: float, start: float):
+        self.node = node
+        self.period = 1.0 / frequency
+        self.next = start
+        self.stats = LoopStats()
+
+
+class Replay:
+
+    def __init__(self, session: str | dict, realtime: bool = False,
+                 controller_frequency: float | None = None, navigator_frequency: float = 10):
+        data = load_session(session, topics=['imu', 'obstacles']) if isinstance(session, str) else session
+        imu = data.get('imu', np.empty(0, dtype=IMU))
+        obstacles = data.get('obstacles', np.empty(0, dtype=OBSTACLES))
+        self._imu, self._obstacles = imu, obstacles
+
+        times = np.concatenate([imu['t'], obstacles['t']])
+        kinds = np.concatenate([np.full(len(imu), _IMU), np.full(len(obstacles), _OBSTACLES)])
+        rows = np.concatenate([np.arange(len(imu)), np.arange(len(obstacles))])
+        order = np.argsort(times, kind='stable')
+        self._times, self._kinds, self._rows = times[order], kinds[order], rows[order]
+        self._cursor = 0
+
+        self.start = float(self._times[0]) if len(self._times) else 0.0
+        self.end = float(self._times[-1]) if len(self._times) else 0.0
+        self.clock = ReplayClock(self.start)
+        self.realtime = realtime
+        self._wall_start = None
+
+        span = self.end - self.start
+        sample_frequency = max(settings.imu_sample_frequency, len(imu) / span if span else 0)
+
+        self.serial = CapturingSerial(clock=self.clock.time)
+        self._previous_sc = controller_module._sc
+        controller_module._sc = ServoController(
+            self.serial, deadband=settings.servo_deadband,
+            refresh_interval=settings.servo_refresh_interval,
+        )
+        self.imu = ReplayIMU(self.clock, sample_frequency)
+        self.controller = Controller(frequency=controller_frequency or settings.robot_frequency)
+        self.navigator = Navigator(controller=self.controller, frequency=navigator_frequency)
+        self.robot = Robot(controller=self.controller, imu=self.imu, sleep=self.sleep)
+        # these nodes must not touch whatever port is installed at interpreter exit
+        for node in (self.controller, self.navigator, self.robot):
+            atexit.unregister(node._shutdown)
+        atexit.unregister(self.controller.shutdown)
+
+        self._tickers = [
+            _Ticker(self.navigator, self.navigator.frequency, self.start),
+            _Ticker(self.controller, self.controller.frequency, self.start),
+        ]
+        self.moves: list[tuple[float, MoveTypes]] = []
+        self.events = 0
+
+    def close(self):
+        if self.navigator.active:
+            self.navigator.stop_navigation()
+        controller_module._sc = self._previous_sc
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    # --- simulated time ---------------------------------------------------------
+
+    def _wait_for_wall(self, t: float):
+        if self._wall_start is None:
+            self._wall_start = time.perf_counter() - (t - self.start)
+        delay = (t - self.start) - (time.perf_counter() - self._wall_start)
+        if delay > 0:
+            time.sleep(delay)
+
+    def _dispatch(self, kind: int, row: int):
+        if kind == _IMU:
+            self.imu.feed(self._imu[row])
+        else:
+            counts = self._obstacles[row]['counts']
+            Topics.obstacles.send("replay", payload=dict(zip(OBSTACLE_REGIONS, counts.tolist())))
+        self.events += 1
+
+    def _tick(self, ticker: _Ticker):
+        move_type = self.controller.move_type
+        ticker.stats.record_tick(0.0)
+        started = time.perf_counter()
+        ticker.node.spin_once()
+        ticker.stats.record_duration(time.perf_counter() - started)
+        ticker.next += ticker.period
+        if self.controller.move_type != move_type:
+            self.moves.append((self.clock.now, self.controller.move_type))
+
+    def advance(self, until: float):
+        """Deliver every event and tick up to `until`, in time order."""
+        while True:
+            event_t = self._times[self._cursor] if self._cursor < len(self._times) else float('inf')
+            ticker = min(self._tickers, key=lambda tk: tk.next)
+            t = min(event_t, ticker.next)
+            if t > until:
+                break
+            if self.realtime:
+                self._wait_for_wall(t)
+            self.clock.now = t
+            if event_t <= ticker.next:
+                self._dispatch(self._kinds[self._cursor], self._rows[self._cursor])
+                self._cursor += 1
+            else:
+                self._tick(ticker)
+        self.clock.now = max(self.clock.now, until)
+
+    def sleep(self, seconds: float):
+        """Robot.level's sleep: let simulated time (and the stack) run on."""
+        self.advance(self.clock.now + seconds)
+
+    # --- runs -------------------------------------------------------------------
+
+    def run(self, duration: float | None = None, navigate: bool = True, level: bool = False) -> ReplayResult:
+        """Replay the session (or its first `duration` seconds); optionally start
+        autonomous navigation first and/or run Robot.level once at the start."""
+        wall = time.perf_counter()
+        until = self.start + duration if duration is not None else self.end
+        result = ReplayResult(duration=0.0, wall_time=0.0)
+        if navigate:
+            self.navigator.start_navigation()
+        if level:
+            result.level = self.robot.level()
+        self.advance(until)
+        if navigate:
+            self.navigator.stop_navigation()
+
+        result.duration = self.clock.now - self.start
+        result.wall_time = time.perf_counter() - wall
+        result.writes = list(self.serial.writes)
+        result.moves = list(self.moves)
+        result.events = self.events
+        for ticker in self._tickers:
+            name = ticker.node.__class__.__name__
+            result.ticks[name] = ticker.stats.ticks
+            result.timing[name] = ticker.stats.summary(ticker.period)
+        return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a recorded session through the control stack")
+    parser.add_argument('session', help="session directory (recordings/<session>)")
+    parser.add_argument('--realtime', action='store_true', help="pace replay to the wall clock")
+    parser.add_argument('--duration', type=float, help="replay only the first N seconds")
+    parser.add_argument('--level', action='store_true', help="run Robot.level at the start")
+    parser.add_argument('--no-navigate', action='store_true', help="do not start autonomous navigation")
+    args = parser.parse_args()
+
+    with Replay(args.session, realtime=args.realtime) as replay:
+        result = replay.run(args.duration, navigate=not args.no_navigate, level=args.level)
+    print(json.dumps(result.summary(), indent=1, default=str))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,8 +1,107 @@
+"""
+Pub/sub topics.
+
+Each `Topic` wraps a blinker signal and adds three things publishers at control
+rate need:
+
+  * a latest-value cache -- `latest` / `sender` / `stamp` hold the last payload
+    sent, so a consumer that only wants the current value reads it instead of
+    subscribing and storing it itself;
+  * a no-subscriber fast path -- with no receivers `send` only updates the cache
+    and returns, so a 50 Hz pose publication costs a few attribute writes when
+    the UI is not listening;
+  * per-subscriber throttling -- `connect(receiver, max_rate=...)` delivers at
+    most max_rate calls per second, `connect(receiver, every=n)` every n-th
+    send. Other subscribers still see every send.
+
+Payloads are passed by reference and the cache holds the same object, so
+publishers that mutate a payload in place (the controller's Pose) must not
+expect the cache to be a snapshot.
+"""
+
+from __future__ import annotations
+
+import time
+
 from blinker import signal
 
+
+class _Throttled:
+    """Receiver wrapper that drops sends above max_rate or between every-th."""
+
+    def __init__(self, receiver, max_rate: float | None = None, every: int | None = None):
+        self.receiver = receiver
+        self.interval = 1.0 / max_rate if max_rate else 0.0
+        self.every = every or 1
+        self._next = 0.0
+        self._count = 0
+        self.delivered = 0
+        self.dropped = 0
+
+    def __call__(self, sender, **kwargs):
+        self._count += 1
+        if self._count < self.every:
+            self.dropped += 1
+            return None
+        if self.interval:
+            now = time.monotonic()
+            if now < self._next:
+                self.dropped += 1
+                return None
+            self._next = now + self.interval
+        self._count = 0
+        self.delivered += 1
+        return self.receiver(sender, **kwargs)
+
+
+class Topic:
+    def __init__(self, name: str):
+        self.name = name
+        self.signal = signal(name)
+        self.latest = None
+        self.sender = None
+        self.stamp = 0.0
+        self.sends = 0
+        # receiver -> its _Throttled wrapper, so disconnect takes the original
+        self._throttled: dict = {}
+
+    @property
+    def has_receivers(self) -> bool:
+        return bool(self.signal.receivers)
+
+    def send(self, sender=None, payload=None, **kwargs):
+        self.latest = payload
+        self.sender = sender
+        self.stamp = time.monotonic()
+        self.sends += 1
+        if not self.signal.receivers:
+            return []
+        return self.signal.send(sender, payload=payload, **kwargs)
+
+    def connect(self, receiver, max_rate: float | None = None, every: int | None = None,
+                weak: bool = True):
+        """Subscribe `receiver(sender, payload=...)`; optionally throttled to
+        `max_rate` Hz and/or every `every`-th send. Throttled receivers are held
+        strongly until disconnect()."""
+        if max_rate or (every and every > 1):
+            wrapper = _Throttled(receiver, max_rate, every)
+            self._throttled[receiver] = wrapper
+            self.signal.connect(wrapper, weak=False)
+            return receiver
+        return self.signal.connect(receiver, weak=weak)
+
+    def disconnect(self, receiver):
+        wrapper = self._throttled.pop(receiver, None)
+        self.signal.disconnect(wrapper if wrapper is not None else receiver)
+
+    def age(self) -> float:
+        """Seconds since the last send (inf if never sent)."""
+        return time.monotonic() - self.stamp if self.sends else float('inf')
+
+
 class Topics:
-    raw_imu = signal('raw_imu')
-    raw_pose = signal('pose_raw')
-    raw_image = signal('raw_image')
-    obstacles = signal('obstacles')
-    
\ No newline at end of file
+    raw_imu = Topic('raw_imu')
+    raw_pose = Topic('pose_raw')
+    raw_image = Topic('raw_image')
+    obstacles = Topic('obstacles')
+    servo_telemetry = Topic('servo_telemetry')
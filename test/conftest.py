@@ -0,0 +1,13 @@
+"""
+Shared fixtures.
+"""
+
+import pytest
+
+from src.mock.controller import offline_controller
+
+
+@pytest.fixture
+def controller():
+    with offline_controller() as controller:
+        yield controller
@@ -0,0 +1,140 @@
+"""
+ArcTurn's float-loop generator must reproduce the original array-per-leg loop
+exactly. The reference below is that loop, kept verbatim; both are stepped side
+by side over several cycles and compared with array_equal, not allclose. The
+cycle-cached mode must replay the same motion through the indexed path.
+"""
+
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from settings import settings
+from src.model.types import MoveTypes
+from src.motion.gaits.arc_turn import ArcTurn, _smoothstep
+
+
+def _rot(v, a):
+    c, s = np.cos(a), np.sin(a)
+    return np.array([c * v[0] - s * v[1], s * v[0] + c * v[1]])
+
+
+class _LoopArcTurn(ArcTurn):
+    """The per-leg implementation ArcTurn shipped with."""
+
+    def _reset(self):
+        super(_LoopArcTurn, self)._reset()
+        self._foot_xy = self._neutral_xy.copy()
+        self._was_swing = np.array([False, False, False, False])
+        self._lift_off = self._neutral_xy.copy()
+        self._target = self._neutral_xy.copy()
+
+    def __next__(self):
+        out = np.array(self.p0, dtype=float)
+        stance_frac = 1.0 - self.SWING_FRAC
+
+        for i in range(4):
+            lp = (self._phi + self._phase_offset[i]) % 1.0
+            swinging = lp < self.SWING_FRAC
+
+            if swinging:
+                s = lp / self.SWING_FRAC
+                if not self._was_swing[i]:
+                    self._lift_off[i] = self._foot_xy[i].copy()
+                    advance = stance_frac * self._yaw_per_cycle
+                    self._target[i] = self._icr + _rot(self._lift_off[i] - self._icr, advance)
+                ease = _smoothstep(s)
+                xy = (1.0 - ease) * self._lift_off[i] + ease * self._target[i]
+                z = self.clearance * np.sin(np.pi * s)
+                self._foot_xy[i] = xy
+            else:
+                self._foot_xy[i] = self._icr + _rot(self._foot_xy[i] - self._icr, -self._dpsi)
+                z = 0.0
+
+            self._was_swing[i] = swinging
+            out[i, 0] = self.p0[i][0] + (self._foot_xy[i][0] - self._neutral_xy[i][0])
+            out[i, 1] = self.p0[i][1] + (self._foot_xy[i][1] - self._neutral_xy[i][1])
+            out[i, 2] = self.p0[i][2] - z
+
+        self._phi += 1.0 / self._N
+        self._psi += self._dpsi
+        if self._phi >= 1.0:
+            self._phi -= 1.0
+        self.positions = out
+        return out
+
+
+@pytest.mark.parametrize('pivot_ratio', [0.5, 0.2, 0.9])
+@pytest.mark.parametrize('turn_direction', [1, -1])
+@pytest.mark.parametrize('is_reversed', [False, True])
+def test_matches_per_leg_loop(pivot_ratio, turn_direction, is_reversed):
+    params = replace(settings.turn_params, pivot_ratio=pivot_ratio,
+                     turn_direction=turn_direction, is_reversed=is_reversed)
+    gait = ArcTurn(p0=settings.position_ready, params=params, cycle_cache=False)
+    reference = _LoopArcTurn(p0=settings.position_ready, params=params, cycle_cache=False)
+    for tick in range(gait._N * 3 + 1):
+        expected = next(reference)
+        actual = next(gait)
+        assert np.array_equal(actual, expected), tick
+    assert gait._psi == reference._psi
+
+
+def test_returns_a_fresh_array_each_tick():
+    gait = ArcTurn(p0=settings.position_ready, params=settings.turn_params, cycle_cache=False)
+    first = next(gait)
+    kept = first.copy()
+    second = next(gait)
+    assert second is not first
+    assert np.array_equal(first, kept)
+    assert gait.positions is second
+
+
+@pytest.mark.parametrize('pivot_ratio', [0.5, 0.2, 0.9])
+@pytest.mark.parametrize('turn_direction', [1, -1])
+def test_cycle_cache_replays_the_generator(pivot_ratio, turn_direction):
+    params = replace(settings.turn_params, pivot_ratio=pivot_ratio, turn_direction=turn_direction)
+    cached = ArcTurn(params=params, cycle_cache=True)
+    live = ArcTurn(params=params, cycle_cache=False)
+    n = live._N
+    assert cached.steps.shape == (4, n, 3)
+    assert cached.transient.shape == (n, 4, 3)
+
+    # the transient is emitted verbatim, then the gait goes indexed
+    for tick in range(n):
+        assert not cached.indexed
+        assert np.array_equal(next(cached), next(live)), tick
+    assert cached.indexed and cached.index == 0
+    for tick in range(n * 4):
+        np.testing.assert_allclose(next(cached), next(live), rtol=0, atol=1e-9)
+
+
+def test_cached_cycle_is_the_table_cycle():
+    gait = ArcTurn(params=settings.turn_params, cycle_cache=True)
+    for _ in range(len(gait.transient)):
+        next(gait)
+    cycle = gait.cycle_positions()
+    for i in range(gait.max_index):
+        assert gait.index == i
+        assert np.array_equal(next(gait), cycle[i])
+
+
+def test_cache_cycle_rejects_aperiodic_frames():
+    gait = ArcTurn(params=settings.turn_params, cycle_cache=False)
+    frames = np.arange(3 * 4 * 4 * 3, dtype=float).reshape(12, 4, 3)
+    assert not gait.cache_cycle(frames, 4)
+    assert gait.transient is None and not gait.indexed
+    with pytest.raises(ValueError):
+        gait.cache_cycle(frames, 7)
+
+
+def test_controller_switches_to_the_servo_table_after_the_transient(controller):
+    controller.process_move(MoveTypes.ARC_TURN_LT)
+    gait = controller.gait
+    for _ in range(len(gait.transient)):
+        controller.spinner()
+        assert controller.servo_table is None
+    for i in range(gait.max_index):
+        controller.spinner()
+        assert controller.servo_table is not None
+        assert np.array_equal(controller.pose.positions, controller.servo_table.positions[i])
@@ -0,0 +1,29 @@
+"""
+Benchmark suite smoke test -- every case runs, and the baseline comparison flags
+slowdowns past the threshold.
+"""
+
+from bench import run as bench_run
+from bench.cases import cases
+
+
+def test_every_case_runs():
+    names = set()
+    for case in cases():
+        fn = case.setup()
+        fn()
+        names.add(case.name)
+    assert 'controller.move_to' in names
+    assert any(name.startswith('compile_spec.') for name in names)
+
+
+def test_regression_is_flagged():
+    name = 'servo_controller.encode_move'
+    baseline = {'results': {name: {'per_call_us': 1e-3}}}
+    data = bench_run.run(name, baseline, threshold=0.25, repeat=1, min_time=0.001)
+    result = data['results'][name]
+    assert result['regressed'] and result['ratio'] > 1.25
+
+    baseline = {'results': {name: {'per_call_us': 1e6}}}
+    data = bench_run.run(name, baseline, threshold=0.25, repeat=1, min_time=0.001)
+    assert not data['results'][name]['regressed']
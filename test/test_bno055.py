@@ -0,0 +1,61 @@
+"""
+BNO055 burst reads -- the one-transaction register block decode must agree with
+the driver's per-property reads.
+"""
+
+import numpy as np
+
+from src.mock import adafruit_bno055
+from src.nodes.bno055 import BurstReader, DATA_SIZE, decode_data_block
+from src.nodes.imu import IMU
+
+
+def _sensor():
+    sensor = adafruit_bno055.BNO055_I2C(1)
+    sensor.euler = (271.5, -3.25, 12.0)
+    sensor.acceleration = (0.12, -0.5, 9.81)
+    sensor.gyro = (0.01, -0.02, 0.5)
+    sensor.magnetic = (20.0, -4.0, 31.5)
+    return sensor
+
+
+def test_burst_matches_property_reads():
+    sensor = _sensor()
+    euler, acceleration, gyro = BurstReader.for_sensor(sensor).read()
+    assert np.allclose(euler, sensor.euler)
+    assert np.allclose(acceleration, sensor.acceleration)
+    assert np.allclose(gyro, sensor.gyro)
+
+
+def test_burst_is_one_transaction():
+    sensor = _sensor()
+    reader = BurstReader.for_sensor(sensor)
+    device = sensor.i2c_device
+    before = device.transactions
+    reader.read()
+    assert device.transactions - before == 1
+    before = device.transactions
+    sensor.euler, sensor.acceleration, sensor.gyro
+    assert device.transactions - before == 3
+
+
+def test_decode_block_layout():
+    raw = np.arange(12, dtype='<i2') * 16
+    block = decode_data_block(raw.tobytes())
+    assert block.shape == (4, 3)
+    assert len(raw.tobytes()) == DATA_SIZE
+    # euler row is the last triple, 1/16 degree per LSB
+    assert block[3].tolist() == [9.0, 10.0, 11.0]
+
+
+def test_sensor_without_i2c_device_has_no_reader():
+    assert BurstReader.for_sensor(object()) is None
+
+
+def test_imu_node_uses_burst_reader():
+    imu = IMU(threaded=False)
+    assert imu.reader is not None
+    imu.sensor.euler = (90.0, 2.5, -1.0)
+    imu.sample()
+    assert imu.imu_data.roll == 2.5
+    assert imu.imu_data.pitch == -1.0
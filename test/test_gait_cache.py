@@ -0,0 +1,176 @@
+"""
+The gait cache hands out rewound copies of compiled gaits: same frames as a
+freshly built gait, shared step arrays, independent iterator state. The
+controller warms it for every move type from a background thread.
+"""
+
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from settings import settings
+from src.model.types import MoveTypes
+from src.motion.gaits.arc_turn import ArcTurn
+from src.motion.gaits.cache import GaitCache, gait_cache
+from src.motion.gaits.prowl import Prowl
+from src.motion.gaits.simplified_gait import SimpleTrotWithLateral
+from src.motion.gaits.trot import Trot
+from src.motion.gaits.turn import Turn
+from src.nodes import controller as controller_module
+
+GAITS = {
+    'trot_fwd': (SimpleTrotWithLateral, dict(
+        p0=settings.position_trot + settings.position_forward_offsets, params=settings.trot_params)),
+    'trot_in_place': (Trot, dict(params=settings.trot_in_place_params)),
+    'turn_L': (Turn, dict(params=replace(settings.turn_params, turn_direction=1))),
+    'prowl': (Prowl, dict(p0=settings.position_prowl, params=settings.prowl_params)),
+    'arc_turn': (ArcTurn, dict(params=settings.turn_params)),
+    'arc_turn_live': (ArcTurn, dict(params=settings.turn_params, cycle_cache=False)),
+}
+
+
+@pytest.mark.parametrize('name', list(GAITS))
+def test_cached_gait_matches_a_fresh_one(name):
+    cls, kwargs = GAITS[name]
+    cache = GaitCache()
+    used = cache.get(cls, **kwargs)
+    for _ in range(7):
+        next(used)
+
+    gait = cache.get(cls, **kwargs)
+    fresh = cls(**kwargs)
+    assert cache.hits == 1 and cache.misses == 1
+    assert gait is not used
+    for tick in range(3 * fresh.max_index + 50):
+        assert np.array_equal(next(gait), next(fresh)), tick
+
+
+def test_copies_share_steps_but_not_iterator_state():
+    cache = GaitCache()
+    a = cache.get(Trot, params=settings.trot_params)
+    b = cache.get(Trot, params=settings.trot_params)
+    assert a.steps is b.steps
+    next(a), next(a)
+    assert a.index == 2 and b.index == 0
+
+
+def test_arc_turn_copies_step_independently():
+    cache = GaitCache()
+    a = cache.get(ArcTurn, params=settings.turn_params, cycle_cache=False)
+    b = cache.get(ArcTurn, params=settings.turn_params, cycle_cache=False)
+    first = [next(a).copy() for _ in range(40)]
+    assert [np.array_equal(next(b), frame) for frame in first] == [True] * 40
+
+
+def test_key_covers_class_p0_and_params():
+    cache = GaitCache()
+    cache.get(Trot, params=settings.trot_params)
+    assert cache.cached(Trot, params=replace(settings.trot_params))
+    assert not cache.cached(Trot, params=replace(settings.trot_params, stride=1))
+    assert not cache.cached(Trot, p0=settings.position_prowl, params=settings.trot_params)
+    assert not cache.cached(Prowl, params=settings.trot_params)
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = GaitCache(maxsize=2)
+    params = [replace(settings.trot_params, stride=s) for s in (10, 20, 30)]
+    cache.get(Trot, params=params[0])
+    cache.get(Trot, params=params[1])
+    cache.get(Trot, params=params[0])
+    cache.get(Trot, params=params[2])
+    assert len(cache) == 2
+    assert cache.cached(Trot, params=params[0])
+    assert not cache.cached(Trot, params=params[1])
+
+
+def test_invalidate():
+    cache = GaitCache()
+    cache.get(Trot, params=settings.trot_params)
+    cache.get(Turn, params=settings.turn_params)
+    cache.invalidate(Trot)
+    assert not cache.cached(Trot, params=settings.trot_params)
+    assert cache.cached(Turn, params=settings.turn_params)
+    cache.invalidate()
+    assert len(cache) == 0
+    cache.get(Turn, params=settings.turn_params)
+    assert cache.misses == 3
+
+
+def test_disabled_cache_builds_every_time():
+    cache = GaitCache(maxsize=0)
+    a = cache.get(Trot, params=settings.trot_params)
+    b = cache.get(Trot, params=settings.trot_params)
+    assert a.steps is not b.steps
+    assert len(cache) == 0 and cache.misses == 2
+
+
+def test_warm_compiles_every_move_type(controller):
+    gait_cache.invalidate()
+    assert not any(controller.gaits_ready.values())
+    assert MoveTypes.STOP not in controller.gaits_ready
+
+    thread = controller.warm_gait_cache(pause=0)
+    thread.join(10)
+    assert not thread.is_alive()
+    assert all(controller.gaits_ready.values())
+
+    misses = gait_cache.misses
+    for move_type in controller.gaits_ready:
+        controller.process_move(move_type)
+    assert gait_cache.misses == misses
+
+
+def test_new_arc_pivot_ratio_is_not_ready(controller):
+    controller.warm_gait_cache(pause=0).join(10)
+    controller.set_arc_pivot_ratio(0.3)
+    assert not controller.gaits_ready[MoveTypes.ARC_TURN_LT]
+    assert not controller.gaits_ready[MoveTypes.ARC_TURN_RT]
+    controller.warm_gait_cache(pause=0).join(10)
+    assert controller.gaits_ready[MoveTypes.ARC_TURN_LT]
+    assert controller.gaits_ready[MoveTypes.ARC_TURN_RT]
+
+
+def test_switching_back_reuses_the_servo_table(controller, monkeypatch):
+    gait_cache.invalidate()
+    compiled = []
+    compile_table = controller_module._compile_servo_table
+    monkeypatch.setattr(controller_module, '_compile_servo_table',
+                        lambda positions: compiled.append(1) or compile_table(positions))
+    monkeypatch.setattr(settings, 'gait_transition_ticks', 0)
+
+    controller.process_move(MoveTypes.FORWARD)
+    controller.spinner()
+    table = controller.servo_table
+    controller.process_move(MoveTypes.TROT_IN_PLACE)
+    controller.spinner()
+    controller.process_move(MoveTypes.FORWARD)
+    controller.spinner()
+    assert controller.servo_table is table
+    assert len(compiled) == 2
+
+    # new offsets are a new table, shared again from then on
+    monkeypatch.setattr(settings, 'position_offsets', settings.position_offsets + 1)
+    controller.spinner()
+    assert controller.servo_table is not table
+    assert len(compiled) == 3
+
+
+def test_first_tick_after_a_warmed_switch_compiles_nothing(controller, monkeypatch):
+    gait_cache.invalidate()
+    controller.warm_gait_cache(pause=0).join(10)
+    compiled = []
+    compile_table = controller_module._compile_servo_table
+    monkeypatch.setattr(controller_module, '_compile_servo_table',
+                        lambda positions: compiled.append(1) or compile_table(positions))
+
+    for move_type in controller.gaits_ready:
+        controller.process_move(move_type)
+        gait = controller.gait
+        # through the blend and any transient, onto the table
+        ticks = settings.gait_transition_ticks + len(gait.transient if gait.transient is not None else ()) + 1
+        for _ in range(ticks):
+            controller.spinner()
+        if gait.indexed:
+            assert controller.servo_table is gait.compiled['servo_table'], move_type
+    assert compiled == []
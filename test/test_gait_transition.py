@@ -0,0 +1,127 @@
+"""
+Gait transitions crossfade into the new gait instead of jumping to its first
+frame, and keep the stepping phase across gaits with compatible periods.
+"""
+
+from dataclasses import replace
+
+import numpy as np
+
+from settings import settings
+from src.model.types import MoveTypes
+from src.motion.gaits.simplified_gait import SimpleTrotWithLateral
+from src.motion.gaits.transition import GaitTransition, compatible_periods
+from src.motion.gaits.trot import Trot
+from src.motion.gaits.turn import Turn
+
+
+def _trot_forward():
+    return SimpleTrotWithLateral(
+        p0=settings.position_trot + settings.position_forward_offsets, params=settings.trot_params,
+    )
+
+
+def _largest_step(frames) -> float:
+    frames = np.asarray(frames)
+    return float(np.abs(np.diff(frames, axis=0)).max())
+
+
+def test_blend_from_a_held_pose_has_no_jump():
+    start = np.array(settings.position_ready, dtype=float) + [15.0, 10.0, -20.0]
+    gait = Turn(params=settings.turn_params)
+    pure = Turn(params=settings.turn_params)
+    jump = float(np.abs(gait.get_positions() - start).max())
+    transition = GaitTransition(gait, 8, start)
+    assert not transition.aligned
+    frames = list(transition)
+    assert transition.done
+    # leaves from the held pose and arrives on the gait's own trajectory
+    assert np.abs(frames[0] - start).max() < jump * 0.1
+    residuals = [float(np.abs(frame - next(pure)).max()) for frame in frames]
+    assert residuals[-1] < jump * 0.1
+    # the gait was stepped through the transition, not restarted after it
+    assert gait.index == 8
+
+
+def test_compatible_periods():
+    trot, trot_fwd, turn = Trot(params=settings.trot_in_place_params), _trot_forward(), Turn(params=settings.turn_params)
+    assert trot.max_index * 2 == trot_fwd.max_index
+    assert compatible_periods(trot, trot_fwd) and compatible_periods(trot_fwd, trot)
+    assert not compatible_periods(trot_fwd, turn)
+
+
+def test_phase_is_carried_across_compatible_periods():
+    previous = Trot(params=settings.trot_in_place_params)
+    for _ in range(5):
+        next(previous)
+    gait = _trot_forward()
+    transition = GaitTransition(gait, 4, previous.positions, previous)
+    assert transition.aligned
+    assert gait.index == 10
+    list(transition)
+    assert gait.index == 14
+
+
+def test_aligned_blend_follows_the_outgoing_cycle():
+    previous = _trot_forward()
+    for _ in range(7):
+        next(previous)
+    expected = previous.cycle_positions()
+    gait = _trot_forward()
+    transition = GaitTransition(gait, 6, previous.positions, previous)
+    # blending a gait into itself, in phase, is the gait itself
+    for k, frame in enumerate(transition):
+        np.testing.assert_allclose(frame, expected[7 + k], rtol=0, atol=1e-9)
+
+
+def test_blend_weights_ramp_to_the_new_gait():
+    start = np.zeros((4, 3))
+    gait = Trot(params=settings.trot_in_place_params)
+    reference = Trot(params=settings.trot_in_place_params)
+    frames = list(GaitTransition(gait, 5, start))
+    fractions = [float(np.max(frame) / np.max(next(reference))) for frame in frames]
+    assert fractions == sorted(fractions)
+    assert 0 < fractions[0] < 0.2 and 0.8 < fractions[-1] < 1
+
+
+def test_controller_blends_each_switch(controller):
+    controller.process_move(MoveTypes.FORWARD)
+    frames = [np.array(settings.position_ready, dtype=float)]
+    for move_type in (MoveTypes.FORWARD, MoveTypes.FORWARD_LT, MoveTypes.FORWARD, MoveTypes.FORWARD_RT):
+        controller.process_move(move_type)
+        assert controller.transition is not None
+        for _ in range(settings.gait_transition_ticks):
+            controller.spinner()
+            frames.append(np.array(controller.pose.positions))
+        assert controller.transition is None
+        for _ in range(20):
+            controller.spinner()
+            frames.append(np.array(controller.pose.positions))
+        assert controller.servo_table is not None
+    # the largest tick-to-tick move is the gaits' own, not a switch
+    gaits_own = max(_largest_step(gait.cycle_positions()) for gait in (
+        _trot_forward(), Turn(params=replace(settings.turn_params, turn_direction=1)),
+    ))
+    assert _largest_step(frames) <= gaits_own * 1.5
+
+
+def test_interrupted_transition_starts_from_the_pose_sent(controller):
+    controller.process_move(MoveTypes.FORWARD)
+    for _ in range(30):
+        controller.spinner()
+    controller.process_move(MoveTypes.TROT_IN_PLACE)
+    controller.spinner()
+    controller.spinner()
+    held = np.array(controller.pose.positions)
+    controller.process_move(MoveTypes.FORWARD)
+    assert controller.transition.aligned
+    assert np.array_equal(controller.transition.source[0], held)
+
+
+def test_stop_and_zero_ticks_switch_directly(controller, monkeypatch):
+    controller.process_move(MoveTypes.FORWARD)
+    controller.process_move(MoveTypes.STOP)
+    assert controller.transition is None
+    monkeypatch.setattr(settings, 'gait_transition_ticks', 0)
+    controller.process_move(MoveTypes.FORWARD)
+    assert controller.transition is None
@@ -0,0 +1,53 @@
+"""
+IMU history ring buffer -- windows, wraparound and windowed means.
+"""
+
+import numpy as np
+
+from src.nodes.imu_history import IMUHistory, TIME, EULER
+
+
+def _filled(n, frequency=10.0, seconds=1.0):
+    history = IMUHistory(seconds, frequency)
+    for i in range(n):
+        t = i / frequency
+        history.append(t, (0.0, float(i), -float(i)), (0.0, 0.0, 9.8), (0.0, 0.0, 0.0))
+    return history
+
+
+def test_capacity_covers_the_requested_seconds():
+    history = IMUHistory(2.0, 50)
+    assert history.capacity == 101
+    assert len(history) == 0
+    assert history.latest() is None
+
+
+def test_wraparound_keeps_the_newest_in_order():
+    history = _filled(25)
+    assert len(history) == history.capacity == 11
+    rows = history.since(-1)
+    assert np.array_equal(rows[:, EULER][:, 1], np.arange(14, 25))
+    assert np.all(np.diff(rows[:, TIME]) > 0)
+    assert history.latest()[2] == 24
+
+
+def test_since_excludes_t():
+    history = _filled(10)
+    rows = history.since(0.5)
+    assert rows[:, TIME].tolist() == [0.6, 0.7, 0.8, 0.9]
+
+
+def test_window_mean():
+    history = _filled(10)
+    # samples at t = 0.7, 0.8, 0.9
+    mean = history.mean('euler', 0.2, now=0.9)
+    assert np.allclose(mean, [0.0, 8.0, -8.0])
+    assert np.allclose(history.std('acceleration', 0.2, now=0.9), 0.0)
+
+
+def test_empty_window_is_nan():
+    history = _filled(10)
+    assert np.isnan(history.mean('gyro', 0.2, now=50.0)).all()
+    history.clear()
+    assert len(history) == 0
+    assert len(history.window(10, now=1.0)) == 0
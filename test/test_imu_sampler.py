@@ -0,0 +1,139 @@
+"""
+IMU sampling thread -- a slow I2C bus must never stall the node's spinner, and the
+spinner republishes each sample exactly once. Without the thread, blocking readers
+(Robot.level) sample the sensor themselves.
+"""
+
+import atexit
+import time
+
+from settings import settings
+from src.nodes.imu import IMU
+from src.nodes.robot import Robot
+from src.signals import Topics
+
+
+class _SlowSensor:
+    """BNO055 stand-in whose every property read blocks like a slow I2C read."""
+
+    def __init__(self, delay):
+        self.delay = delay
+        self.reads = 0
+
+    def _read(self, value):
+        time.sleep(self.delay)
+        self.reads += 1
+        return value
+
+    @property
+    def euler(self):
+        return self._read((180.0, 1.5, -0.5))
+
+    @property
+    def acceleration(self):
+        return self._read((0.0, 0.0, 9.8))
+
+    @property
+    def gyro(self):
+        return self._read((0.0, 0.0, 0.1))
+
+
+def _imu(threaded, delay=0.0):
+    imu = IMU(threaded=False, sample_frequency=200)
+    imu.sensor = _SlowSensor(delay)
+    imu.reader = None
+    imu.threaded = threaded
+    return imu
+
+
+def test_threaded_spinner_never_waits_on_i2c():
+    imu = _imu(threaded=True, delay=0.02)
+    imu.start_sampler()
+    try:
+        start = time.perf_counter()
+        for _ in range(20):
+            imu.spinner()
+        assert time.perf_counter() - start < 0.01
+        deadline = time.monotonic() + 1.0
+        while imu.imu_data.sequence < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        imu.stop_sampler()
+    assert imu.imu_data.sequence >= 3
+    assert imu.imu_data.roll == 1.5
+    assert imu.read_time.count >= 2
+    assert imu.read_time.percentile(50) >= 0.06
+
+
+def test_each_sample_is_published_once():
+    imu = _imu(threaded=True)
+    received = []
+
+    def on_imu(sender, payload):
+        received.append(payload.sequence)
+
+    Topics.raw_imu.connect(on_imu)
+    try:
+        imu.spinner()
+        imu.spinner()
+        imu.sample()
+        imu.spinner()
+        imu.spinner()
+    finally:
+        Topics.raw_imu.disconnect(on_imu)
+    assert received == [imu.imu_data.sequence]
+
+
+def test_unthreaded_spinner_reads_and_publishes():
+    imu = _imu(threaded=False)
+    before = imu.imu_data.sequence
+    imu.spinner()
+    assert imu.imu_data.sequence == before + 1
+    assert imu.sensor.reads == 3
+    assert imu.age < 1.0
+
+
+def test_read_error_keeps_last_sample():
+    imu = _imu(threaded=False)
+    imu.sample()
+    last = imu.imu_data
+    imu.sensor = object()
+    assert imu.sample() is None
+    assert imu.imu_data is last
+    assert imu.read_errors == 1
+
+
+class _TiltedSensor(_SlowSensor):
+    """Roll follows the leg offsets that Robot.level adjusts: 2 degrees at the
+    default offsets, each correction step takes half a degree off."""
+
+    def __init__(self):
+        super().__init__(0.0)
+        self.start = settings.position_offsets[0, 2]
+
+    @property
+    def euler(self):
+        steps = settings.position_offsets[0, 2] - self.start
+        return self._read((180.0, 2.0 - 0.5 * steps, 0.0))
+
+
+def test_unthreaded_latest_euler_takes_a_fresh_sample():
+    imu = _imu(threaded=False)
+    before = imu.imu_data.sequence
+    imu.latest_euler(0.2)
+    assert imu.imu_data.sequence == before + 1
+    assert imu.sensor.reads == 3
+
+
+def test_unthreaded_level_sees_each_correction(controller):
+    imu = _imu(threaded=False)
+    imu.sensor = _TiltedSensor()
+    robot = Robot(controller=controller, imu=imu, sleep=lambda seconds: None)
+    atexit.unregister(robot._shutdown)
+    offsets = settings.position_offsets.copy()
+    try:
+        assert robot.level()
+        # the stale pre-level reading alone would have stopped it after 0 steps
+        assert settings.position_offsets[0, 2] - offsets[0, 2] >= 3
+    finally:
+        settings.position_offsets = offsets
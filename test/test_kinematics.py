@@ -75,3 +75,38 @@ def test_reachability_bounds():
     assert _km.validate_position(np.array([0, 0, 151]))       # mid-envelope
     assert not _km.validate_position(np.array([0, 0, 300]))   # beyond femur+tibia (216)
     assert not _km.validate_position(np.array([0, 0, 5]))      # inside min reach (12)
+
+
+def test_batch_ik_matches_per_frame_vectorized():
+    """(N, 4, 3) and (K, N, 4, 3) batches solve exactly like N separate calls."""
+    rng = np.random.default_rng(0)
+    frames = np.array(REACHABLE[:4], dtype=float) + rng.uniform(-10, 10, (6, 4, 3))
+    batch = _km.inverse_kinematics_batch(frames)
+    assert batch.shape == frames.shape
+    for i in range(frames.shape[0]):
+        assert np.array_equal(batch[i], _km.inverse_kinematics_vectorized(frames[i]))
+
+    sweep = np.stack([frames, frames + 5.0])
+    assert np.array_equal(_km.inverse_kinematics_batch(sweep)[0], batch)
+
+
+def test_batch_fk_round_trips_and_fills_out():
+    frames = np.tile(np.array(REACHABLE, dtype=float), (3, 1, 1))
+    out = np.empty_like(frames)
+    angles = _km.inverse_kinematics_batch(frames)
+    back = _km.forward_kinematics_batch(angles, out=out)
+    assert back is out
+    assert np.allclose(back, frames, atol=1e-6)
+
+
+def test_batch_out_shape_mismatch_raises():
+    with pytest.raises(ValueError):
+        _km.inverse_kinematics_batch(np.zeros((4, 3)), out=np.empty((5, 3)))
+
+
+@pytest.mark.parametrize("pos", REACHABLE)
+def test_vectorized_fk_matches_scalar(pos):
+    angles = _km.inverse_kinematics(np.array(pos, dtype=float))
+    scalar = _km.forward_kinematics(angles)
+    vectorized = _km.forward_kinematics_vectorized(np.tile(angles, (4, 1)))
+    assert np.allclose(vectorized, scalar, atol=1e-9)
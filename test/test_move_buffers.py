@@ -0,0 +1,123 @@
+"""
+Preallocated move_to path -- IK, servo mapping and the CMD_SERVO_MOVE packet are
+written into reusable buffers. It must command exactly what the allocating path
+commands, byte for byte.
+"""
+
+import sys
+import threading
+
+import numpy as np
+import pytest
+
+from settings import settings
+from src.mock.servo_serial import CapturingSerial
+from src.motion.servo_controller import MovePacket, ServoController, encode_move
+from src.nodes import controller as controller_module
+from src.nodes.controller import (
+    _MoveBuffers,
+    _angles_from_positions,
+    _servo_positions_from_angles,
+)
+
+POSES = [
+    settings.position_ready,
+    settings.position_sit,
+    settings.position_crouch,
+    settings.position_trot,
+    settings.position_prowl + np.array([[20, 15, -30], [0, 0, 0], [-10, -25, 0], [5, 5, 5]]),
+]
+
+
+@pytest.mark.parametrize("positions", POSES)
+def test_buffered_solve_matches_allocating_path(positions):
+    buffers = _MoveBuffers()
+    buffers.solve(positions)
+    cmd = _servo_positions_from_angles(_angles_from_positions(positions))
+    assert buffers.cmd == cmd
+    assert np.allclose(buffers.angles, _angles_from_positions(positions))
+    assert bytes(MovePacket(buffers.servo_ids).fill(buffers.servo_values, 0)) == encode_move(cmd, 0)
+
+
+@pytest.mark.parametrize("millis", [0, 10, 400, 31000, -5])
+def test_move_packet_matches_encode_move(millis):
+    ids = list(settings.servo_ids)
+    positions = np.array([0, 1, 255, 256, 500, 999, 1000, 4095, 10000, 12000, -40, 77])
+    packet = MovePacket(ids)
+    expected = encode_move(dict(zip(ids, positions.tolist())), millis)
+    assert bytes(packet.fill(positions, millis)) == expected
+
+
+def test_move_packet_is_reused_in_place():
+    packet = MovePacket(settings.servo_ids)
+    first = packet.fill(np.full(12, 100), 0)
+    second = packet.fill(np.full(12, 900), 0)
+    assert first is second
+
+
+def test_move_array_matches_dict_move():
+    serial = CapturingSerial()
+    sc = ServoController(serial)
+    ids = tuple(int(i) for i in settings.servo_ids)
+    positions = np.arange(12, dtype=np.int32) * 80
+    sc.move_array(ids, positions, 20)
+    sc.move(dict(zip(ids, positions.tolist())), 20)
+    assert serial.writes[0][1] == serial.writes[1][1]
+    sc.move_array(ids, positions + 1, 20)
+    assert len(sc._move_packets) == 1
+
+
+def test_fill_changed_sends_only_servos_past_the_deadband():
+    ids = list(settings.servo_ids)
+    packet = MovePacket(ids)
+    base = np.full(12, 500)
+    assert bytes(packet.fill_changed(base, 0, deadband=2)) == encode_move(dict(zip(ids, base.tolist())))
+    assert packet.fill_changed(base + 2, 0, deadband=2) is None      # within deadband
+
+    moved = base.copy()
+    moved[[1, 7]] = [520, 480]
+    frame = bytes(packet.fill_changed(moved, 0, deadband=2))
+    assert frame == encode_move({ids[1]: 520, ids[7]: 480}, 0)
+    assert packet.fill_changed(moved, 0, deadband=2) is None         # remembered as sent
+    full = packet.fill_changed(moved, 0, deadband=2, full=True)
+    assert bytes(full) == encode_move(dict(zip(ids, moved.tolist())), 0)
+
+
+def test_delta_mode_refreshes_periodically():
+    serial = CapturingSerial()
+    sc = ServoController(serial, deadband=3, refresh_interval=2)
+    ids = tuple(int(i) for i in settings.servo_ids)
+    positions = np.full(12, 500)
+    for _ in range(6):
+        sc.move_array(ids, positions, 0)
+    # first frame is full; holding the pose then only sends the periodic refreshes
+    assert len(serial.writes) == 3
+    assert all(len(frame) == 43 for _, frame in serial.writes)
+
+
+def test_moves_from_two_threads_never_tear_a_packet(controller):
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        poses = [settings.position_ready, settings.position_sit]
+        expected = {
+            encode_move(_servo_positions_from_angles(_angles_from_positions(pose)), 0) for pose in poses
+        }
+        serial = controller_module._sc._serial
+        serial.writes.clear()
+
+        def mover(pose):
+            for _ in range(300):
+                controller.move_to(pose, 0)
+
+        threads = [threading.Thread(target=mover, args=(pose,)) for pose in poses]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(switch_interval)
+    assert len(serial.writes) == 600
+    assert {data for _, data in serial.writes} <= expected
+    # the pose describes one move, not half of each
+    assert controller.pose.cmd == _servo_positions_from_angles(_angles_from_positions(controller.pose.positions))
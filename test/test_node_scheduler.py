@@ -0,0 +1,63 @@
+"""
+Node.spin runs against absolute deadlines: the tick rate does not drift with
+spinner time, and overruns are handled by the node's OverrunPolicy.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from src.nodes.node import Node, OverrunPolicy
+
+
+class _Worker(Node):
+    def __init__(self, work=lambda tick: 0.0, **kwargs):
+        super().__init__(**kwargs)
+        self.work = work
+        self.calls = 0
+
+    def spinner(self):
+        cost = self.work(self.calls)
+        self.calls += 1
+        if cost:
+            time.sleep(cost)
+
+
+def _run(node, frequency, duration):
+    async def scenario():
+        task = asyncio.ensure_future(node.spin(frequency))
+        await asyncio.sleep(duration)
+        node._running = False
+        await task
+
+    asyncio.run(scenario())
+
+
+def test_rate_does_not_drift_with_spinner_time():
+    # 4ms of work per 10ms tick: sleep-after-work would only reach ~70 Hz
+    # (~35 ticks here); deadlines keep ~50, less any ticks lost to host jitter.
+    node = _Worker(work=lambda tick: 0.004)
+    _run(node, 100, 0.5)
+    assert 42 <= node.calls <= 52
+
+
+def test_skip_policy_drops_missed_ticks():
+    node = _Worker(work=lambda tick: 0.025, overrun_policy=OverrunPolicy.SKIP)
+    _run(node, 100, 0.3)
+    stats = node.loop_stats
+    assert stats.overruns == stats.ticks or stats.overruns == stats.ticks - 1
+    assert stats.skipped >= 2 * stats.overruns - 1
+    assert node.calls <= 12
+
+
+def test_catch_up_policy_keeps_tick_count_with_wall_time():
+    # one 45ms stall at 100 Hz: catch-up runs the missed ticks back to back
+    node = _Worker(work=lambda tick: 0.045 if tick == 5 else 0.0,
+                   overrun_policy=OverrunPolicy.CATCH_UP)
+    node.max_catch_up = 10
+    _run(node, 100, 0.5)
+    assert node.loop_stats.overruns >= 1
+    assert node.loop_stats.skipped == 0
+    assert node.calls == pytest.approx(50, abs=6)
+    assert node.loop_stats.jitter_max >= 0.03
@@ -0,0 +1,95 @@
+"""
+Flight recorder -- topic traffic round-trips through chunked binary files, chunks
+roll over, and an unclosed session is still readable.
+"""
+
+import os
+
+import numpy as np
+
+from src.interfaces.pose import Pose
+from src.nodes.imu import IMUData
+from src.recording.chunks import read_index
+from src.recording.reader import list_sessions, load_session
+from src.recording.recorder import FlightRecorder
+from src.recording.records import POSE
+from src.signals import Topics
+
+
+def _pose(i):
+    pose = Pose()
+    pose.positions = np.full((4, 3), float(i))
+    pose.angles = np.full((4, 3), i / 10)
+    pose.cmd = dict(zip(range(12), range(i, i + 12)))
+    return pose
+
+
+def _record(recorder, n):
+    for i in range(n):
+        Topics.raw_pose.send("pose", payload=_pose(i))
+        Topics.raw_imu.send("imu", payload=IMUData(euler=np.array([i, 1.0, 2.0]), sequence=i))
+    Topics.obstacles.send("yolo", payload={'lower_center': 2, 'upper_left': 1})
+
+
+def test_round_trip_with_chunk_rollover(tmp_path):
+    recorder = FlightRecorder(str(tmp_path), session='run', chunk_size=POSE.itemsize * 8)
+    recorder.start()
+    try:
+        _record(recorder, 20)
+    finally:
+        recorder.stop()
+
+    assert list_sessions(str(tmp_path)) == ['run']
+    data = load_session(os.path.join(tmp_path, 'run'))
+    pose = data['pose']
+    assert len(pose) == 20
+    assert recorder.writers['pose'].chunks[-1]['count'] == 4
+    assert len(recorder.writers['pose'].chunks) == 3
+    assert np.all(np.diff(pose['t']) >= 0)
+    assert pose['positions'][7].tolist() == [[7.0] * 3] * 4
+    assert pose['cmd'][5].tolist() == list(range(5, 17))
+    assert data['imu']['euler'][:, 0].tolist() == list(range(20))
+    assert data['imu']['sequence'][-1] == 19
+    assert data['obstacles']['counts'].tolist() == [[1, 0, 0, 0, 2, 0]]
+    assert len(data['servo_telemetry']) == 0
+    # closed chunks are trimmed to exactly their records
+    last = recorder.writers['pose'].chunks[-1]['file']
+    assert os.path.getsize(os.path.join(tmp_path, 'run', last)) == 4 * POSE.itemsize
+
+
+def test_unclosed_session_is_recovered(tmp_path):
+    recorder = FlightRecorder(str(tmp_path), session='crash', chunk_size=1 << 16)
+    recorder.start()
+    try:
+        _record(recorder, 5)
+        recorder.flush()
+        _record(recorder, 3)
+        # no stop(): the index still says 5 poses in an open chunk
+        data = load_session(os.path.join(tmp_path, 'crash'), topics=['pose'])
+    finally:
+        recorder.stop()
+    assert list(data) == ['pose']
+    assert len(data['pose']) == 8
+
+
+def test_stopped_recorder_no_longer_subscribes(tmp_path):
+    recorder = FlightRecorder(str(tmp_path), session='off')
+    recorder.start()
+    recorder.stop()
+    _record(recorder, 3)
+    assert recorder.records == 0
+
+
+def test_rollover_is_in_the_index_without_a_flush(tmp_path):
+    recorder = FlightRecorder(str(tmp_path), session='roll', chunk_size=POSE.itemsize * 4)
+    recorder.start()
+    try:
+        _record(recorder, 10)
+        # no flush since start(): only the rollovers have rewritten the index
+        index = read_index(os.path.join(tmp_path, 'roll'))
+        data = load_session(os.path.join(tmp_path, 'roll'), topics=['pose'])
+    finally:
+        recorder.stop()
+    assert len(index['topics']['pose']['chunks']) == 3
+    assert len(data['pose']) == 10
+    assert data['pose']['positions'][9].tolist() == [[9.0] * 3] * 4
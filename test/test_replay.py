@@ -0,0 +1,63 @@
+"""
+Session replay -- recorded IMU and obstacle traffic drives Navigator, Controller and
+Robot.level on a simulated clock, deterministically, against a capturing port.
+"""
+
+import numpy as np
+import pytest
+
+from src.model.types import MoveTypes
+from src.nodes import controller as controller_module
+from src.recording.records import IMU, OBSTACLES, OBSTACLE_REGIONS
+from src.recording.replay import Replay
+
+
+def _session(roll=0.0):
+    imu = np.zeros(40, dtype=IMU)
+    imu['t'] = 100.0 + np.arange(40) * 0.05
+    imu['sequence'] = np.arange(1, 41)
+    imu['euler'][:, 0] = 180.0
+    imu['euler'][:, 1] = roll
+    obstacles = np.zeros(4, dtype=OBSTACLES)
+    obstacles['t'] = [100.0, 100.5, 101.0, 101.5]
+    center = OBSTACLE_REGIONS.index('lower_center')
+    right = OBSTACLE_REGIONS.index('lower_right')
+    # clear, then center blocked with more on the right, then clear again
+    obstacles['counts'][1:3, center] = 1
+    obstacles['counts'][1:3, right] = 2
+    return {'imu': imu, 'obstacles': obstacles}
+
+
+def _run(**kwargs):
+    with Replay(_session(), controller_frequency=50) as replay:
+        return replay.run(**kwargs)
+
+
+def test_replay_drives_navigation_through_the_controller():
+    result = _run()
+    assert result.duration == pytest.approx(1.95)
+    assert result.events == 44
+    assert result.ticks['Controller'] == 98
+    assert [move for _, move in result.moves] == [
+        MoveTypes.FORWARD, MoveTypes.FORWARD_LT, MoveTypes.FORWARD,
+    ]
+    assert result.moves[1][0] >= 100.5
+    # one move packet per controller tick while walking, all captured
+    assert len(result.writes) > result.ticks['Controller']
+
+
+def test_replay_is_deterministic():
+    assert _run().digest() == _run().digest()
+
+
+def test_replay_restores_the_servo_controller():
+    before = controller_module._sc
+    _run(duration=0.2)
+    assert controller_module._sc is before
+
+
+def test_level_reads_replayed_imu():
+    with Replay(_session(roll=0.2), controller_frequency=50) as replay:
+        result = replay.run(navigate=False, level=True)
+    assert result.level is True
+    assert result.moves == []
@@ -0,0 +1,106 @@
+"""
+Background serial writer -- move frames posted from the control loop are written
+by a daemon thread; when the bus is behind, only the newest frame is sent.
+"""
+
+import threading
+import time
+
+from src.motion.serial_writer import SerialWriter
+from src.motion.servo_controller import ServoController, encode_move
+
+
+class _SlowSerial:
+    """Records writes; each write blocks until `release` is set."""
+
+    def __init__(self):
+        self.written = []
+        self.release = threading.Event()
+        self.started = threading.Event()
+
+    def write(self, data):
+        self.started.set()
+        self.release.wait(1.0)
+        self.written.append(bytes(data))
+
+
+def test_latest_frame_wins_when_bus_is_behind():
+    serial = _SlowSerial()
+    writer = SerialWriter(serial)
+    writer.start()
+    try:
+        writer.post(b"\x01")
+        assert serial.started.wait(1.0)      # frame 1 is now stuck on the wire
+        writer.post(b"\x02")
+        writer.post(b"\x03")                 # replaces 2 before it is sent
+        serial.release.set()
+    finally:
+        writer.stop()
+
+    assert serial.written == [b"\x01", b"\x03"]
+    stats = writer.stats
+    assert stats["frames_posted"] == 3
+    assert stats["frames_sent"] == 2
+    assert stats["frames_dropped"] == 1
+    assert stats["write_time_max"] > 0.0
+
+
+def test_post_copies_the_reused_buffer():
+    serial = _SlowSerial()
+    serial.release.set()
+    writer = SerialWriter(serial)
+    buffer = bytearray(b"\x0a\x0b")
+    writer.post(buffer)
+    buffer[:] = b"\xff\xff"                  # caller reuses its packet buffer
+    writer.start()
+    writer.stop()
+    assert serial.written == [b"\x0a\x0b"]
+
+
+def test_threaded_controller_routes_moves_through_writer():
+    serial = _SlowSerial()
+    serial.release.set()
+    sc = ServoController(serial, threaded=True)
+    positions = {11: 500, 12: 400}
+    sc.move(positions, 0)
+    deadline = time.monotonic() + 1.0
+    while sc.writer.frames_sent < 1 and time.monotonic() < deadline:
+        time.sleep(0.001)
+    sc.close()
+    assert serial.written == [encode_move(positions, 0)]
+    assert not sc.writer.running
+
+
+class _FlakySerial(_SlowSerial):
+    """Fails its first write, like a port that hiccups once."""
+
+    def __init__(self):
+        super().__init__()
+        self.release.set()
+        self.failures = 1
+
+    def write(self, data):
+        if self.failures:
+            self.failures -= 1
+            raise OSError("write failed")
+        super().write(data)
+
+
+def test_writer_survives_a_failed_write():
+    serial = _FlakySerial()
+    writer = SerialWriter(serial)
+    writer.start()
+    try:
+        writer.post(b"\x01")
+        deadline = time.monotonic() + 1.0
+        while writer.write_errors < 1 and time.monotonic() < deadline:
+            time.sleep(0.001)
+        assert writer.running
+        writer.post(b"\x02")
+    finally:
+        writer.stop()
+
+    assert serial.written == [b"\x02"]
+    stats = writer.stats
+    assert stats["write_errors"] == 1
+    assert stats["frames_sent"] == 1
@@ -0,0 +1,73 @@
+"""
+Servo bus bandwidth model -- wire time from baud rate, planning checks for the
+control + telemetry load, and move-over-query priority at runtime.
+"""
+
+import pytest
+
+from src.mock.servo_serial import CapturingSerial
+from src.motion.servo_bus import (
+    BusBudgetError,
+    ServoBus,
+    move_packet_size,
+    position_query_size,
+)
+from src.motion.servo_controller import ServoController, encode_move
+
+
+def test_packet_sizes_match_the_encoder():
+    assert move_packet_size(12) == len(encode_move({i: 0 for i in range(12)})) == 43
+    # request: 4 header + count + 12 ids; response: 4 header + count + 12 * 3
+    assert position_query_size(12) == 17 + 41
+
+
+def test_wire_time_is_ten_bits_per_byte():
+    bus = ServoBus(115200)
+    assert bus.wire_time(43) == pytest.approx(43 * 10 / 115200)
+
+
+def test_plan_at_115200_fits_50hz_with_telemetry():
+    plan = ServoBus(115200).check(12, 50, telemetry_frequency=5, strict=True)
+    assert plan.move_time == pytest.approx(3.73e-3, rel=1e-2)
+    assert plan.query_fits_in_tick
+    assert plan.utilization < 0.25
+
+
+def test_check_refuses_when_moves_overrun_the_tick():
+    bus = ServoBus(9600)
+    with pytest.raises(BusBudgetError):
+        bus.check(12, 50, strict=True)
+    plan = bus.check(12, 50)                   # non-strict only warns
+    assert plan.move_time > plan.tick
+    assert plan.max_frequency == pytest.approx(9600 / 430)
+
+
+def test_query_deferred_when_it_would_collide_with_next_move():
+    bus = ServoBus(115200)
+    bus.record(43, move=True, now=0.0)
+    assert bus.query_slot_open(12, 50, now=0.004)       # 4ms + ~5ms query < 20ms
+    assert not bus.query_slot_open(12, 50, now=0.017)   # would spill past 20ms
+    assert bus.queries_deferred == 1
+
+
+def test_utilization_is_measured_per_window():
+    bus = ServoBus(115200, window=1.0)
+    for tick in range(50):
+        bus.record(43, move=True, now=tick * 0.02)
+    bus.record(43, move=True, now=1.0)
+    assert bus.utilization == pytest.approx(50 * 43 * 10 / 115200, rel=1e-6)
+
+
+def test_servo_controller_accounts_every_packet():
+    bus = ServoBus(115200)
+    sc = ServoController(CapturingSerial(), bus=bus)
+    sc.move({11: 500}, 0)
+    sc.unload([11])
+    assert bus.moves == 1
+    assert bus.queries == 1
+
+
+def test_check_flags_telemetry_that_never_gets_a_query_slot():
+    assert not ServoBus(9600).plan(12, 50, telemetry_frequency=2).query_fits_in_tick
+    with pytest.raises(BusBudgetError, match="only polled while the robot stands still"):
+        ServoBus(9600).check(12, 50, telemetry_frequency=2, strict=True)
@@ -0,0 +1,83 @@
+"""
+Simulated servo bus -- the Hiwonder protocol over a modelled UART: wire time,
+servo slew, and the asyncio reader path.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from src.mock.servo_serial import SimulatedServoBus
+from src.motion.servo_bus import position_query_size
+from src.motion.servo_controller import ServoController
+
+BAUD = 115200
+IDS = [11, 12, 13]
+
+
+@pytest.fixture
+def bus():
+    bus = SimulatedServoBus(BAUD, slew_rate=1000.0)
+    yield bus
+    bus.close()
+
+
+def test_query_round_trip_takes_wire_time(bus):
+    sc = ServoController(bus)
+    start = time.monotonic()
+    assert sc.get_positions(IDS) == {11: 500, 12: 500, 13: 500}
+    elapsed = time.monotonic() - start
+    assert elapsed >= bus.wire_time(position_query_size(len(IDS)))
+    assert sc.get_battery_voltage() == 8000
+
+
+def test_servos_slew_to_target(bus):
+    sc = ServoController(bus)
+    sc.move({11: 400, 12: 700}, 0)
+    sc.move({11: 600, 12: 700}, 0)
+    # 11 is mid-way on a 200-unit move at 1000 units/s
+    mid = sc.get_positions([11, 12])
+    assert 400 < mid[11] < 600
+    assert mid[12] == 700
+    time.sleep(0.25)
+    assert sc.get_positions([11])[11] == 600
+
+
+def test_move_time_is_honoured(bus):
+    sc = ServoController(bus)
+    sc.move({13: 500}, 0)
+    sc.move({13: 510}, 200)
+    assert sc.get_positions([13])[13] < 510
+
+
+def test_unload(bus):
+    sc = ServoController(bus)
+    sc.move({11: 450}, 0)
+    sc.unload([11, 12])
+    sc.get_battery_voltage()   # wait for the unload to reach the board
+    assert bus.unloaded == {11, 12}
+
+
+def test_pipelined_queries_on_the_event_loop():
+    # slow link so the overlap dwarfs scheduling overhead
+    bus = SimulatedServoBus(19200)
+    sc = ServoController(bus)
+    one = bus.wire_time(position_query_size(len(IDS)))
+
+    async def scenario():
+        assert sc.attach(asyncio.get_running_loop())
+        try:
+            start = time.monotonic()
+            results = await asyncio.gather(*[sc.get_positions_async(IDS) for _ in range(4)])
+            return results, time.monotonic() - start
+        finally:
+            sc.detach()
+
+    try:
+        results, elapsed = asyncio.run(scenario())
+    finally:
+        bus.close()
+    assert all(r == {11: 500, 12: 500, 13: 500} for r in results)
+    # requests and responses overlap on the two directions of the wire
+    assert elapsed < 4 * one
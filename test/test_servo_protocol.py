@@ -0,0 +1,165 @@
+"""
+Servo response parsing and the native asyncio query path.
+
+FrameParser must reassemble frames from arbitrary chunking, resync past garbage
+and survive ring-buffer wrap-around. With the controller attached to an event
+loop, queries resolve from the serial fd's reader callback and can be pipelined.
+"""
+
+import asyncio
+import socket
+
+import pytest
+
+from src.motion.servo_controller import (
+    CMD_GET_BATTERY_VOLTAGE,
+    CMD_MULT_SERVO_POS_READ,
+    FrameParser,
+    ServoController,
+    TimeoutError as ServoTimeout,
+    encode_packet,
+)
+
+VOLTAGE = encode_packet(CMD_GET_BATTERY_VOLTAGE, 0x40, 0x1f)            # 8000 mV
+POSITIONS = encode_packet(CMD_MULT_SERVO_POS_READ, 2, 11, 0xf4, 0x01, 12, 0x20, 0x03)
+
+
+def _drain(parser):
+    frames = []
+    while (frame := parser.next_frame()) is not None:
+        frames.append(frame)
+    return frames
+
+
+def test_parser_reassembles_byte_by_byte():
+    parser = FrameParser()
+    frames = []
+    for octet in VOLTAGE + POSITIONS:
+        parser.feed(bytes([octet]))
+        frames += _drain(parser)
+    assert frames == [
+        (CMD_GET_BATTERY_VOLTAGE, [0x40, 0x1f]),
+        (CMD_MULT_SERVO_POS_READ, [2, 11, 0xf4, 0x01, 12, 0x20, 0x03]),
+    ]
+    assert len(parser) == 0
+
+
+def test_parser_resyncs_past_garbage():
+    parser = FrameParser()
+    parser.feed(b"\x00\x13\x55\x07" + VOLTAGE)
+    assert _drain(parser) == [(CMD_GET_BATTERY_VOLTAGE, [0x40, 0x1f])]
+
+
+def test_parser_wraps_around_the_ring():
+    parser = FrameParser(size=16)
+    for _ in range(20):
+        parser.feed(VOLTAGE)
+        assert _drain(parser) == [(CMD_GET_BATTERY_VOLTAGE, [0x40, 0x1f])]
+
+
+def test_parser_rejects_non_power_of_two():
+    with pytest.raises(ValueError):
+        FrameParser(size=100)
+
+
+class _SocketSerial:
+    """pyserial stand-in over one end of a socketpair (selectable fd)."""
+
+    def __init__(self, sock):
+        self.sock = sock
+        self.sock.setblocking(False)
+        self.timeout = None
+        self.written = []
+
+    def fileno(self):
+        return self.sock.fileno()
+
+    @property
+    def in_waiting(self):
+        try:
+            return len(self.sock.recv(4096, socket.MSG_PEEK))
+        except BlockingIOError:
+            return 0
+
+    def read(self, size=1):
+        try:
+            return self.sock.recv(size)
+        except BlockingIOError:
+            return b""
+
+    def write(self, data):
+        self.written.append(bytes(data))
+
+
+def test_attached_queries_are_pipelined():
+    ours, servo_side = socket.socketpair()
+
+    async def scenario():
+        sc = ServoController(_SocketSerial(ours))
+        assert sc.attach(asyncio.get_running_loop())
+        voltage = asyncio.ensure_future(sc.get_battery_voltage_async())
+        positions = asyncio.ensure_future(sc.get_positions_async([11, 12]))
+        await asyncio.sleep(0)
+        assert len(sc._serial.written) == 2          # both requests in flight
+        servo_side.sendall(POSITIONS[:5])
+        await asyncio.sleep(0.01)
+        servo_side.sendall(POSITIONS[5:] + VOLTAGE)
+        result = await asyncio.gather(voltage, positions)
+        sc.close()
+        return result
+
+    try:
+        voltage, positions = asyncio.run(scenario())
+    finally:
+        ours.close()
+        servo_side.close()
+    assert voltage == 8000
+    assert positions == {11: 500, 12: 800}
+
+
+def test_attached_query_times_out():
+    ours, servo_side = socket.socketpair()
+
+    async def scenario():
+        sc = ServoController(_SocketSerial(ours), timeout=0.01)
+        sc.attach(asyncio.get_running_loop())
+        try:
+            with pytest.raises(Exception) as info:
+                await sc.get_battery_voltage_async()
+            return info.type, sc._waiters[CMD_GET_BATTERY_VOLTAGE]
+        finally:
+            sc.close()
+
+    try:
+        error, waiters = asyncio.run(scenario())
+    finally:
+        ours.close()
+        servo_side.close()
+    assert error.__name__ == "TimeoutError"
+    assert not waiters
+
+
+def test_late_response_is_not_handed_to_the_next_query():
+    ours, servo_side = socket.socketpair()
+
+    async def scenario():
+        sc = ServoController(_SocketSerial(ours), timeout=0.02)
+        sc.attach(asyncio.get_running_loop())
+        try:
+            with pytest.raises(ServoTimeout):
+                await sc.get_battery_voltage_async()
+            retry = asyncio.ensure_future(sc.get_battery_voltage_async())
+            servo_side.sendall(VOLTAGE)                 # the first answer, late
+            while len(sc._serial.written) < 2:
+                await asyncio.sleep(0.005)
+            servo_side.sendall(encode_packet(CMD_GET_BATTERY_VOLTAGE, 0xe8, 0x1c))   # 7400 mV
+            return await retry
+        finally:
+            sc.close()
+
+    try:
+        voltage = asyncio.run(scenario())
+    finally:
+        ours.close()
+        servo_side.close()
+    assert voltage == 7400
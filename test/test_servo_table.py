@@ -0,0 +1,70 @@
+"""
+Precompiled servo tables -- the steady-state controller tick replays a gait cycle
+compiled once into servo commands instead of re-running IK every frame.
+
+The invariant: frame i of a compiled table is byte-identical to what the per-tick
+path (`_angles_from_positions` -> `_servo_positions_from_angles` -> `encode_move`)
+produces for the same foot positions, and a table goes stale as soon as the
+runtime position offsets change.
+"""
+
+import numpy as np
+import pytest
+from dataclasses import replace
+
+from settings import settings
+from src.motion.gaits.trot import Trot
+from src.motion.gaits.turn import Turn
+from src.motion.gaits.prowl import Prowl
+from src.motion.gaits.simplified_gait import SimpleTrotWithLateral, SimpleSidestep
+from src.motion.servo_controller import encode_move
+from src.nodes.controller import (
+    _angles_from_positions,
+    _compile_servo_table,
+    _servo_positions_from_angles,
+)
+
+GAITS = {
+    "trot_fwd": lambda: SimpleTrotWithLateral(
+        p0=settings.position_trot + settings.position_forward_offsets,
+        params=settings.trot_params,
+    ),
+    "trot_in_place": lambda: Trot(params=settings.trot_in_place_params),
+    "sidestep_R": lambda: SimpleSidestep(params=settings.sidestep_params),
+    "turn_L": lambda: Turn(params=replace(settings.turn_params, turn_direction=1)),
+    "prowl": lambda: Prowl(p0=settings.position_prowl, params=settings.prowl_params),
+}
+
+
+@pytest.mark.parametrize("name", list(GAITS))
+def test_cycle_positions_match_iteration(name):
+    g = GAITS[name]()
+    cycle = g.cycle_positions()
+    assert cycle.shape == (g.max_index, 4, 3)
+    for i in range(g.max_index):
+        assert np.array_equal(next(g), cycle[i])
+
+
+@pytest.mark.parametrize("name", list(GAITS))
+def test_table_matches_per_tick_path(name):
+    g = GAITS[name]()
+    table = _compile_servo_table(g.cycle_positions())
+    assert len(table) == g.max_index
+    assert table.servos.shape == (g.max_index, 12)
+    assert table.servos.dtype == np.int16
+    for i in range(g.max_index):
+        cmd = _servo_positions_from_angles(_angles_from_positions(next(g)))
+        assert table.cmds[i] == cmd
+        assert table.packets[i] == encode_move(cmd, 0)
+
+
+def test_table_goes_stale_when_offsets_change():
+    table = _compile_servo_table(GAITS["trot_fwd"]().cycle_positions())
+    assert not table.is_stale()
+    saved = settings.position_offsets.copy()
+    try:
+        settings.adjust_offsets(z=1)
+        assert table.is_stale()
+    finally:
+        settings.position_offsets = saved
+    assert not table.is_stale()
@@ -0,0 +1,89 @@
+"""
+Servo telemetry -- position readbacks are converted back to joint angles and foot
+positions and compared against the last command.
+"""
+
+import asyncio
+
+import numpy as np
+
+from settings import settings
+from src.interfaces.pose import Pose
+from src.nodes import controller as controller_module
+from src.nodes.controller import (
+    _angles_from_positions,
+    _servo_positions_from_angles,
+    _telemetry_from_servo_positions,
+)
+from src.signals import Topics
+
+
+def _commanded_pose(positions):
+    pose = Pose()
+    pose.positions = positions
+    pose.angles = _angles_from_positions(positions)
+    pose.cmd = _servo_positions_from_angles(pose.angles)
+    return pose
+
+
+def test_readback_of_the_command_has_no_tracking_error():
+    pose = _commanded_pose(settings.position_ready)
+    readback = {int(k): int(v) for k, v in reversed(list(pose.cmd.items()))}
+    telemetry = _telemetry_from_servo_positions(readback, pose)
+    assert np.array_equal(telemetry.tracking_error, np.zeros((4, 3)))
+    # servo quantization (~0.4 deg per unit) bounds the foot position error
+    assert np.abs(telemetry.position_error).max() < 3.0
+
+
+def test_lagging_servo_shows_up_in_tracking_error():
+    pose = _commanded_pose(settings.position_ready)
+    readback = {int(k): int(v) for k, v in pose.cmd.items()}
+    readback[22] -= 40
+    telemetry = _telemetry_from_servo_positions(readback, pose)
+    assert telemetry.tracking_error[1, 1] == -40
+    assert telemetry.max_tracking_error == 40
+
+
+def test_missing_servo_is_nan():
+    pose = _commanded_pose(settings.position_ready)
+    readback = {int(k): int(v) for k, v in pose.cmd.items() if k != 33}
+    telemetry = _telemetry_from_servo_positions(readback, pose)
+    assert np.isnan(telemetry.servo_positions[2, 2])
+
+
+class _FakeServos:
+    bus = None
+
+    def __init__(self, controller):
+        self.controller = controller
+        self.queries = 0
+
+    async def get_positions_async(self, servo_ids):
+        self.queries += 1
+        return {int(k): int(v) for k, v in self.controller.pose.cmd.items()}
+
+
+def test_poll_publishes_telemetry(controller, monkeypatch):
+    fake = _FakeServos(controller)
+    monkeypatch.setattr(controller_module, "_sc", fake)
+    received = []
+
+    def on_telemetry(sender, payload):
+        received.append(payload)
+
+    Topics.servo_telemetry.connect(on_telemetry)
+
+    async def scenario():
+        controller._running = True
+        task = asyncio.ensure_future(controller.poll_telemetry(200))
+        await asyncio.sleep(0.05)
+        controller._running = False
+        task.cancel()
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        Topics.servo_telemetry.disconnect(on_telemetry)
+    assert fake.queries >= 1
+    assert received and received[-1] is controller.telemetry
+    assert controller.telemetry.max_tracking_error == 0
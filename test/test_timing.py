@@ -0,0 +1,83 @@
+"""
+Loop timing instrumentation -- histogram bucketing, percentiles, and the cost of
+recording relative to a tick.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from src.nodes.node import Node
+from src.nodes.timing import LatencyHistogram, LoopStats, _bucket, _bucket_high, _NUM_BUCKETS
+
+
+def test_bucket_bounds_value_within_precision():
+    for value in [0, 1, 31, 32, 33, 100, 1000, 12345, 20000, 10 ** 7]:
+        index = _bucket(value)
+        assert 0 <= index < _NUM_BUCKETS
+        high = _bucket_high(index)
+        assert value <= high
+        # log-linear: bucket width is at most 1/16 of the value
+        assert high - value <= max(1, value / 16)
+
+
+def test_buckets_are_monotonic():
+    previous = -1
+    for value in range(0, 200000, 7):
+        index = _bucket(value)
+        assert index >= previous
+        previous = index
+
+
+def test_huge_values_saturate_top_bucket():
+    assert _bucket(1 << 40) == _NUM_BUCKETS - 1
+
+
+def test_percentiles():
+    histogram = LatencyHistogram()
+    for ms in range(1, 101):
+        histogram.record(ms / 1000)
+    assert histogram.count == 100
+    assert histogram.mean == pytest.approx(0.0505)
+    assert histogram.percentile(50) == pytest.approx(0.050, rel=0.07)
+    assert histogram.percentile(99) == pytest.approx(0.099, rel=0.07)
+    assert histogram.percentile(100) == pytest.approx(0.100)
+    summary = histogram.summary()
+    assert summary['max'] == pytest.approx(100)
+    histogram.reset()
+    assert histogram.count == 0 and histogram.percentile(50) == 0.0
+
+
+def test_record_cost_is_negligible_against_a_tick():
+    stats = LoopStats()
+    n = 20000
+    start = time.perf_counter()
+    for i in range(n):
+        stats.record_tick(i * 1e-6)
+        stats.record_duration(i * 1e-6)
+    per_tick = (time.perf_counter() - start) / n
+    # well under 1% of a 20 ms (50 Hz) tick
+    assert per_tick < 0.01 * 0.020
+
+
+class _Busy(Node):
+    def spinner(self):
+        time.sleep(0.002)
+
+
+def test_spin_records_durations_and_summary():
+    node = _Busy(frequency=100)
+
+    async def scenario():
+        task = asyncio.ensure_future(node.spin())
+        await asyncio.sleep(0.1)
+        node._running = False
+        await task
+
+    asyncio.run(scenario())
+    summary = node.timing_summary()
+    assert summary['node'] == '_Busy'
+    assert summary['ticks'] == node.loop_stats.duration.count
+    assert summary['duration_ms']['p50'] >= 2.0
+    assert 0 < summary['budget_used'] < 1
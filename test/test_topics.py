@@ -0,0 +1,87 @@
+"""
+Topic layer over blinker -- latest-value cache, no-subscriber fast path and
+per-subscriber throttling.
+"""
+
+import time
+
+from src.signals import Topic
+
+
+def test_send_without_receivers_only_updates_the_cache():
+    topic = Topic('test_cache')
+    assert not topic.has_receivers
+    assert topic.age() == float('inf')
+    assert topic.send('me', payload=1) == []
+    assert topic.latest == 1 and topic.sender == 'me' and topic.sends == 1
+    assert topic.age() < 1.0
+
+
+def test_receivers_get_every_send():
+    topic = Topic('test_every')
+    received = []
+
+    def on_value(sender, payload):
+        received.append(payload)
+
+    topic.connect(on_value)
+    try:
+        for i in range(5):
+            topic.send('me', payload=i)
+    finally:
+        topic.disconnect(on_value)
+    assert received == [0, 1, 2, 3, 4]
+    assert not topic.has_receivers
+
+
+def test_decimation_is_per_subscriber():
+    topic = Topic('test_decimate')
+    every, third = [], []
+
+    def on_every(sender, payload):
+        every.append(payload)
+
+    def on_third(sender, payload):
+        third.append(payload)
+
+    topic.connect(on_every)
+    topic.connect(on_third, every=3)
+    try:
+        for i in range(9):
+            topic.send('me', payload=i)
+    finally:
+        topic.disconnect(on_every)
+        topic.disconnect(on_third)
+    assert every == list(range(9))
+    assert third == [2, 5, 8]
+    assert not topic.has_receivers
+
+
+def test_rate_limit():
+    topic = Topic('test_rate')
+    received = []
+
+    def on_value(sender, payload):
+        received.append(payload)
+
+    topic.connect(on_value, max_rate=20)
+    try:
+        for i in range(10):
+            topic.send('me', payload=i)
+        time.sleep(0.06)
+        topic.send('me', payload=10)
+    finally:
+        topic.disconnect(on_value)
+    assert received == [0, 10]
+    assert topic.latest == 10
+
+
+def test_fast_path_cost():
+    topic = Topic('test_cost')
+    n = 20000
+    start = time.perf_counter()
+    for i in range(n):
+        topic.send('me', payload=i)
+    per_send = (time.perf_counter() - start) / n
+    # a tiny fraction of a 20 ms tick
+    assert per_send < 20e-6